@@ -1,14 +1,26 @@
 """
 Implementing common methods for running the WgLestaAPI library
 """
-from typing import Any, Callable
-import urllib3
-import aiohttp
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
 import json
+import os
 
 from . import Utils
 from . import Constants
 from . import Exceptions
+from . import RateLimit
+from . import Cache
+from . import Decoders
+from . import Retry
+from . import Transport
+from . import Hooks
+
+if TYPE_CHECKING:
+    import aiohttp
+    import urllib3
 
 
 class _AppConstructor:
@@ -20,22 +32,61 @@ class _AppConstructor:
     Attributes:
         application_id (str): The application ID for API access.
         region (Constants.REGION): The region for the API access.
-        http (urllib3.PoolManager): The HTTP manager for synchronous requests.
+        base_url (str | None): The URL of the API of the game in the region, such as `https://api.worldoftanks.eu/wot/`.
+        transport_config (Transport.TransportConfig | None): The settings of the HTTP connections, `None` if a ready transport was passed.
+        transport (Transport.BaseTransport | Transport.BaseAsyncTransport): The transport that sends the requests.
+        hooks (Hooks.Hooks | None): The callbacks of the events of requests, `None` if there are no hooks.
+        tokens (Tokens.TokenManager | None): The access tokens added to requests, set by `Tokens.TokenManager`.
+        snapshots (Snapshots.Snapshots | None): The local snapshots of encyclopedia methods, set by `Snapshots.Snapshots`.
+        concurrency (RateLimit.AdaptiveConcurrency | None): The adaptive limit of requests in flight of `AsyncApp`.
+        limiter (RateLimit.TokenBucket | None): The limit of requests per second shared by all applications with the same `application_id`.
+        cache (Cache.ResponseCache | None): The optional cache of responses.
+        decode (Callable[[bytes], Any]): The function that decodes response bodies.
+        typed (bool): Return typed models from `Models` instead of dictionaries for the methods that have them.
+        retry (Retry.RetryPolicy | None): The optional retries of failed requests.
+        conditional (Cache.ConditionalCache | None): The optional validators of responses for conditional requests.
     """
     def __init__(self, 
             application_id: str, 
             region: Constants.REGION, 
             game_shortname: Constants.GAMENAMES.SHORTNAMES,
-            method_execution: Constants.METHODEXECUTION = Constants.METHODEXECUTION.SYNC
+            method_execution: Constants.METHODEXECUTION = Constants.METHODEXECUTION.SYNC,
+            rate_limit: float | None = None,
+            cache: Cache.ResponseCache | None = None,
+            decoder: Constants.DECODERS | Callable[[bytes], Any] = Constants.DECODERS.AUTO,
+            typed: bool = False,
+            retry: Retry.RetryPolicy | None = None,
+            conditional: Cache.ConditionalCache | None = None,
+            transport: Transport.TransportConfig | Transport.BaseTransport | Transport.BaseAsyncTransport | None = None,
+            hooks: Hooks.Hooks | None = None
         ) -> None:
         self.application_id = application_id
         self.region = region
         self.game_shortname = game_shortname
         self.method_execution = method_execution
-        self.company_name = (Constants.APIHOLDERS.LESTA if self.region in Constants.REGION.CIS else Constants.APIHOLDERS.WG).split('.')[0].capitalize()
+        self.api_holder = Utils.apiHolder(self.region)
+        self.company_name = self.api_holder.split('.')[0].capitalize()
         """May be equal `Wargaming` or `Lesta`"""
+        self.base_url = Utils.baseUrl(self.region, self.game_shortname) if self.game_shortname in Constants.SELECTOR else None
         
-        self.http = urllib3.PoolManager()
+        if transport is None:
+            transport = Transport.TransportConfig()
+        self.transport_config = transport if isinstance(transport, Transport.TransportConfig) else None
+        self.transport = Transport.createTransport(transport, self.method_execution)
+        self.hooks = hooks
+        self.tokens = None
+        self.snapshots = None
+        self.concurrency = None
+
+        explicit_rate = rate_limit is not None
+        if rate_limit is None:
+            rate_limit = Constants.RATELIMITS[self.api_holder]
+        self.limiter = RateLimit.getLimiter(self.application_id, rate_limit, update=explicit_rate) if rate_limit else None
+        self.cache = cache
+        self.decode = Decoders.getDecoder(decoder)
+        self.typed = typed
+        self.retry = retry
+        self.conditional = conditional
     
     def __str__(self) -> str:
         """
@@ -46,6 +97,18 @@ class _AppConstructor:
         """
         return f"{self.company_name}App('{Utils.maskString(self.application_id)}')"
 
+    def addHook(self, name: Constants.HOOKS, callback: Callable[[Hooks.Event], None]) -> None:
+        """
+        Subscribes the callback to an event of every request of the application.
+
+        Args:
+            name (Constants.HOOKS): The name of the event.
+            callback (Callable[[Hooks.Event], None]): The function called with the event.
+        """
+        if self.hooks is None:
+            self.hooks = Hooks.Hooks()
+        self.hooks.add(name, callback)
+
     def urlLogin(self, **kwargs: dict[str, Any]) -> str:
         """
         Returns the authentication URL.
@@ -92,6 +155,9 @@ class _AppConstructor:
         Args:
             api_method (str): The API method to be called.
             type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            typed (bool | None, optional): Return a typed model from `Models` if the method has one (default is the `typed` option of the application). Typed models are decoded straight from the response body, so such calls bypass the `cache` of the application.
+            cached (bool, optional): Return the response from the cache of the application if it is there (default is True). 
+                `False` always sends the request and stores the fresh response in the cache.
             **kwargs: Additional query parameters.
 
         """
@@ -99,72 +165,606 @@ class _AppConstructor:
     
 
 class App(_AppConstructor):
-    def __init__(self, application_id: str, region: Constants.REGION, game_shortname: Constants.GAMENAMES.SHORTNAMES) -> None:
+    def __init__(self, 
+            application_id: str, 
+            region: Constants.REGION, 
+            game_shortname: Constants.GAMENAMES.SHORTNAMES,
+            rate_limit: float | None = None,
+            cache: Cache.ResponseCache | None = None,
+            decoder: Constants.DECODERS | Callable[[bytes], Any] = Constants.DECODERS.AUTO,
+            typed: bool = False,
+            retry: Retry.RetryPolicy | None = None,
+            conditional: Cache.ConditionalCache | None = None,
+            workers: int = 8,
+            transport: Transport.TransportConfig | Transport.BaseTransport | None = None,
+            hooks: Hooks.Hooks | None = None
+        ) -> None:
         """
         Initializes the synchronous App instance with application ID and region.
 
+        Requests can be run in parallel on a pool of `workers` threads with `submit` and `map`. By default the connection 
+        pool keeps up to `workers` connections to every host and blocks threads when all of them are busy.
+
         Args:
             application_id (str): The application ID for API access.
             region (Constants.REGION): The region for the API access.
             game_shortname (Constants.GAMENAMES.SHORTNAMES): The short name of the game.
+            rate_limit (float | None, optional): Requests per second for this `application_id`, `0` disables the limit (default is `Constants.RATELIMITS` of the API holder).
+            cache (Cache.ResponseCache | None, optional): The cache of responses, by default responses are not cached.
+            decoder (Constants.DECODERS | Callable[[bytes], Any], optional): The decoder of response bodies, `Constants.DECODERS.RAW` returns `bytes` (default is `Constants.DECODERS.AUTO`).
+            typed (bool, optional): Return typed models from `Models` instead of dictionaries for the methods that have them (default is False).
+            retry (Retry.RetryPolicy | None, optional): The retries of failed requests, by default requests are not retried.
+            conditional (Cache.ConditionalCache | None, optional): The validators of responses to send conditional requests, by default requests are not conditional.
+            workers (int, optional): The number of threads of `submit` and `map` (default is 8).
+            transport (Transport.TransportConfig | Transport.BaseTransport | None, optional): The settings of the HTTP connections or a ready transport, such as `Transport.MockTransport` (default is a pool of `workers` connections per host).
+            hooks (Hooks.Hooks | None, optional): The callbacks of the events of requests, by default there are no hooks.
         """
+        if transport is None:
+            transport = Transport.TransportConfig(pool_size=workers, pool_block=True)
         self.method_execution = Constants.METHODEXECUTION.SYNC
-        super().__init__(application_id, region, game_shortname, self.method_execution)
+        super().__init__(application_id, region, game_shortname, self.method_execution, rate_limit, cache, decoder, typed, retry, conditional, transport, hooks)
+
+        self.workers = workers
+        self.executor: ThreadPoolExecutor | None = None
+
+    def __getattr__(self, method_block: str) -> Utils.MethodBlock:
+        return Utils.getMethodBlock(self, method_block, Utils.MethodBlock)
 
-    def __getattr__(self, method_block: str, *args, **kwargs) -> Utils.MethodBlock:
-        return Utils.MethodBlock(
+    def execute(
+            self, 
+            api_method: str, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            typed: bool | None = None,
+            cached: bool = True,
+            **kwargs: dict[str, Any]
+        ) -> dict | Any | urllib3.BaseHTTPResponse:
+        return Utils.methodSyncExecute(
             app_instance=self,
-            method_block=method_block,
-            *args, 
+            api_method=api_method, 
+            game_shortname=self.game_shortname, 
+            type_request=type_request,
+            typed=typed,
+            cached=cached,
             **kwargs
         )
 
-    def execute(
+    def __enter__(self) -> "App":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def getExecutor(self) -> ThreadPoolExecutor:
+        """
+        Returns the pool of threads of `submit` and `map`, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The pool of `workers` threads.
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="WgLestaAPI")
+        return self.executor
+
+    def close(self) -> None:
+        """
+        Stops the pool of threads and closes all pooled connections.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        self.transport.close()
+
+    def submit(
             self, 
             api_method: str, 
             type_request: Constants.TYPEREQUESTS = "GET",
+            typed: bool | None = None,
             **kwargs: dict[str, Any]
-        ) -> dict | urllib3.BaseHTTPResponse:
-        return Utils.methodSyncExecute(
+        ) -> Future:
+        """
+        Executes an API request on the pool of threads.
+
+        Args:
+            api_method (str): The API method to be called.
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            typed (bool | None, optional): Return a typed model from `Models` if the method has one (default is the `typed` option of the application). Typed models are decoded straight from the response body, so such calls bypass the `cache` of the application.
+            **kwargs: Additional query parameters.
+
+        Returns:
+            Future: The future of the API response.
+        """
+        return self.getExecutor().submit(self.execute, api_method, type_request, typed, **kwargs)
+
+    def map(
+            self, 
+            api_method: str, 
+            param_sets: Iterable[dict],
+            type_request: Constants.TYPEREQUESTS = "GET",
+            typed: bool | None = None,
+            workers: int | None = None
+        ) -> list[dict | Any | urllib3.BaseHTTPResponse]:
+        """
+        Executes an API request for every set of query parameters in parallel.
+
+        Args:
+            api_method (str): The API method to be called.
+            param_sets (Iterable[dict]): Query parameters of every request.
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            typed (bool | None, optional): Return typed models from `Models` if the method has one (default is the `typed` option of the application). Typed models are decoded straight from the response body, so such calls bypass the `cache` of the application.
+            workers (int | None, optional): The number of threads for this call (default is `workers` of the application). 
+                It can not exceed `pool_size` of a transport that waits for a free connection, such as the default one.
+
+        Raises:
+            Exceptions.WorkersExceedConnectionPool: If the extra threads would only wait for a free connection.
+
+        Returns:
+            list[dict | Any | urllib3.BaseHTTPResponse]: API responses in the order of `param_sets`.
+        """
+        def executeParams(params: dict) -> dict | Any | urllib3.BaseHTTPResponse:
+            return self.execute(api_method, type_request, typed, **params)
+
+        config = self.transport_config
+        if workers is not None and config is not None and config.pool_block and workers > config.pool_size:
+            raise Exceptions.WorkersExceedConnectionPool(workers, config.pool_size)
+        if workers is None or workers == self.workers:
+            return list(self.getExecutor().map(executeParams, param_sets))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="WgLestaAPI") as executor:
+            return list(executor.map(executeParams, param_sets))
+
+    def executeMany(
+            self, 
+            api_method: str, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            batch_size: int = Constants.MAX_IDS_PER_REQUEST,
+            typed: bool | None = None,
+            **kwargs: dict[str, Any]
+        ) -> dict | Any | urllib3.BaseHTTPResponse:
+        return Utils.methodSyncExecuteMany(
             app_instance=self,
             api_method=api_method, 
             game_shortname=self.game_shortname, 
             type_request=type_request,
+            batch_size=batch_size,
+            typed=typed,
+            **kwargs
+        )
+
+    def iterate(
+            self, 
+            api_method: str, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            page_no: int = 1,
+            cached: bool = True,
+            **kwargs: dict[str, Any]
+        ) -> Iterator[dict]:
+        return Utils.methodSyncIterate(
+            app_instance=self,
+            api_method=api_method, 
+            game_shortname=self.game_shortname, 
+            type_request=type_request,
+            page_no=page_no,
+            cached=cached,
             **kwargs
         )
 
 
 class AsyncApp(_AppConstructor):
-    def __init__(self, application_id: str, region: Constants.REGION, game_shortname: Constants.GAMENAMES.SHORTNAMES) -> None:
+    def __init__(self, 
+            application_id: str, 
+            region: Constants.REGION, 
+            game_shortname: Constants.GAMENAMES.SHORTNAMES,
+            rate_limit: float | None = None,
+            cache: Cache.ResponseCache | None = None,
+            decoder: Constants.DECODERS | Callable[[bytes], Any] = Constants.DECODERS.AUTO,
+            typed: bool = False,
+            retry: Retry.RetryPolicy | None = None,
+            conditional: Cache.ConditionalCache | None = None,
+            transport: Transport.TransportConfig | Transport.BaseAsyncTransport | None = None,
+            hooks: Hooks.Hooks | None = None,
+            session: aiohttp.ClientSession | None = None,
+            concurrency: RateLimit.AdaptiveConcurrency | None = None
+        ) -> None:
         """
         Initializes the asynchronous App instance with application ID and region.
 
+        The instance owns one long-lived `aiohttp.ClientSession` that is shared by every request made through 
+        `execute` and the dot-notation. The session is created on the first request, so the instance can still be 
+        declared outside of the running event loop. Close it with `aclose()` or use the instance as an async context manager.
+
         Args:
             application_id (str): The application ID for API access.
             region (Constants.REGION): The region for the API access.
             game_shortname (Constants.GAMENAMES.SHORTNAMES): The short name of the game.
+            rate_limit (float | None, optional): Requests per second for this `application_id`, `0` disables the limit (default is `Constants.RATELIMITS` of the API holder).
+            cache (Cache.ResponseCache | None, optional): The cache of responses, by default responses are not cached.
+            decoder (Constants.DECODERS | Callable[[bytes], Any], optional): The decoder of response bodies, `Constants.DECODERS.RAW` returns `bytes` (default is `Constants.DECODERS.AUTO`).
+            typed (bool, optional): Return typed models from `Models` instead of dictionaries for the methods that have them (default is False).
+            retry (Retry.RetryPolicy | None, optional): The retries of failed requests, by default requests are not retried.
+            conditional (Cache.ConditionalCache | None, optional): The validators of responses to send conditional requests, by default requests are not conditional.
+            transport (Transport.TransportConfig | Transport.BaseAsyncTransport | None, optional): The settings of the HTTP connections or a ready transport, such as `Transport.AsyncMockTransport` (default is `Transport.TransportConfig()`).
+            hooks (Hooks.Hooks | None, optional): The callbacks of the events of requests, by default there are no hooks.
+            session (aiohttp.ClientSession | None, optional): An external session shared with other applications. It is not closed by `aclose()` and the connection settings are ignored.
+            concurrency (RateLimit.AdaptiveConcurrency | None, optional): The adaptive limit of requests in flight, by default the number of requests in flight is not limited.
         """
         self.method_execution = Constants.METHODEXECUTION.ASYNC
-        super().__init__(application_id, region, game_shortname, self.method_execution)
+        super().__init__(application_id, region, game_shortname, self.method_execution, rate_limit, cache, decoder, typed, retry, conditional, transport, hooks)
+
+        if session is not None:
+            self.transport = Transport.AiohttpTransport(self.transport_config or Transport.TransportConfig(), session)
+        self.concurrency = concurrency
+        self.inflight: dict[tuple[str, Callable], asyncio.Task] = {}
+        """Identical `GET` requests in flight, keyed by the URL and the decoder"""
+
+    def __getattr__(self, method_block: str) -> Utils.AsyncMethodBlock:
+        return Utils.getMethodBlock(self, method_block, Utils.AsyncMethodBlock)
+
+    async def __aenter__(self) -> "AsyncApp":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the HTTP session and all of its pooled connections, unless the session is external.
+        """
+        await self.transport.aclose()
 
-    def __getattr__(self, method_block: str, *args, **kwargs) -> Utils.AsyncMethodBlock:
-        return Utils.AsyncMethodBlock(
+    async def execute(
+            self, 
+            api_method: str, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            typed: bool | None = None,
+            cached: bool = True,
+            **kwargs: dict[str, Any]
+        ) -> dict | Any | aiohttp.ClientResponse:
+        return await Utils.methodAsyncExecute(
             app_instance=self,
-            method_block=method_block,
-            *args, 
+            api_method=api_method, 
+            game_shortname=self.game_shortname, 
+            type_request=type_request,
+            typed=typed,
+            cached=cached,
             **kwargs
         )
 
-    async def execute(
+    async def executeMany(
             self, 
             api_method: str, 
             type_request: Constants.TYPEREQUESTS = "GET",
+            batch_size: int = Constants.MAX_IDS_PER_REQUEST,
+            typed: bool | None = None,
             **kwargs: dict[str, Any]
-        ) -> dict | aiohttp.ClientResponse:
-        return await Utils.methodAsyncExecute(
+        ) -> dict | Any | aiohttp.ClientResponse:
+        return await Utils.methodAsyncExecuteMany(
             app_instance=self,
             api_method=api_method, 
             game_shortname=self.game_shortname, 
             type_request=type_request,
+            batch_size=batch_size,
+            typed=typed,
             **kwargs
         )
+
+    def iterate(
+            self, 
+            api_method: str, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            page_no: int = 1,
+            prefetch: int = 2,
+            cached: bool = True,
+            **kwargs: dict[str, Any]
+        ) -> AsyncIterator[dict]:
+        return Utils.methodAsyncIterate(
+            app_instance=self,
+            api_method=api_method, 
+            game_shortname=self.game_shortname, 
+            type_request=type_request,
+            page_no=page_no,
+            prefetch=prefetch,
+            cached=cached,
+            **kwargs
+        )
+
+
+class FanOutApp:
+    """
+    Sends the same request to several regions and games at once.
+
+    One `AsyncApp` is created for every target, and all of them share one transport, which keeps 
+    a separate pool of connections for every host. Requests to one region are limited by its own semaphore.
+    
+    Attributes:
+        application_ids (dict[Constants.APIHOLDERS, str]): The application ID for every API holder.
+        targets (list[tuple[Constants.REGION, Constants.GAMENAMES.SHORTNAMES]]): Pairs of regions and games the requests are sent to.
+        apps (dict[str, AsyncApp]): Applications of the targets, keyed by `region.game_shortname`.
+        limits (dict[Constants.REGION, int]): The number of simultaneous requests to every region.
+    """
+    def __init__(self, 
+            application_ids: dict[str, str],
+            targets: list[tuple[Constants.REGION, Constants.GAMENAMES.SHORTNAMES]] | None = None,
+            concurrency: int | dict[str, int] = 4,
+            transport: Transport.TransportConfig | Transport.BaseAsyncTransport | None = None,
+            **kwargs: Any
+        ) -> None:
+        """
+        Initializes the fan-out application.
+
+        Args:
+            application_ids (dict[Constants.APIHOLDERS, str]): The application ID for every API holder, such as `{APIHOLDERS.WG: "...", APIHOLDERS.LESTA: "..."}`.
+            targets (list[tuple[Constants.REGION, Constants.GAMENAMES.SHORTNAMES]] | None, optional): Pairs of regions and games (default is every pair of `Constants.SELECTOR` for the given API holders).
+            concurrency (int | dict[Constants.REGION, int], optional): The number of simultaneous requests to one region, for all regions or for every region (default is 4).
+            transport (Transport.TransportConfig | Transport.BaseAsyncTransport | None, optional): The settings of the HTTP connections or a ready transport shared by all targets (default is `Transport.TransportConfig()`).
+            **kwargs (Any): Other arguments of every `AsyncApp`, such as `rate_limit`, `cache` or `retry`.
+        """
+        self.application_ids = application_ids
+        if targets is None:
+            targets = [
+                (region, game_shortname) 
+                for game_shortname, game_section in Constants.SELECTOR.items() 
+                for region in game_section["region"]
+                if Utils.apiHolder(region) in application_ids
+            ]
+        self.targets = targets
+        self.concurrency = concurrency
+        self.transport = Transport.createTransport(transport if transport is not None else Transport.TransportConfig(), Constants.METHODEXECUTION.ASYNC)
+
+        self.apps: dict[str, AsyncApp] = {
+            f"{region}.{game_shortname}": AsyncApp(application_ids[Utils.apiHolder(region)], region, game_shortname, transport=self.transport, **kwargs) 
+            for region, game_shortname in targets
+        }
+        self.limits: dict[str, int] = {
+            region: concurrency.get(region, 4) if isinstance(concurrency, dict) else concurrency 
+            for region, _ in targets
+        }
+        self.semaphores: dict[str, asyncio.Semaphore] = {}
+        """Semaphores of the regions in the event loop of `_loop`"""
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __str__(self) -> str:
+        return f"FanOutApp({', '.join(self.apps)})"
+
+    def __getattr__(self, method_block: str) -> Utils.FanOutMethodBlock:
+        return Utils.getMethodBlock(self, method_block, Utils.FanOutMethodBlock)
+
+    async def __aenter__(self) -> "FanOutApp":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared transport and all of its pooled connections.
+        """
+        await self.transport.aclose()
+
+    def getSemaphore(self, region: Constants.REGION) -> asyncio.Semaphore:
+        """
+        Returns the semaphore of the region in the running event loop. Semaphores belong to one event loop, 
+        so they are created again in every new loop, such as in every `asyncio.run` with the same application.
+
+        Args:
+            region (Constants.REGION): The region of the target.
+
+        Returns:
+            asyncio.Semaphore: The semaphore of `limits[region]` simultaneous requests.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self.semaphores, self._loop = {}, loop
+        semaphore = self.semaphores.get(region)
+        if semaphore is None:
+            semaphore = self.semaphores[region] = asyncio.Semaphore(self.limits[region])
+        return semaphore
+
+    async def execute(
+            self, 
+            api_method: str, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            targets: list[str] | None = None,
+            **kwargs: dict[str, Any]
+        ) -> dict:
+        """
+        Executes the API request in every target concurrently.
+
+        Args:
+            api_method (str): The API method to be called.
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            targets (list[str] | None, optional): Keys of the targets, such as `eu.wot` (default is all targets).
+            **kwargs: Additional query parameters.
+
+        Returns:
+            dict: The merged response: `status` is `ok`, `partial` or `error`, `data` contains the data of every 
+                successful target and `errors` contains the error or the exception of every failed target, both keyed by `region.game_shortname`.
+        """
+        keys = list(self.apps) if targets is None else targets
+
+        async def executeTarget(key: str) -> dict | Any:
+            app = self.apps[key]
+            async with self.getSemaphore(app.region):
+                return await app.execute(api_method, type_request, **kwargs)
+
+        results = await asyncio.gather(*[executeTarget(key) for key in keys], return_exceptions=True)
+        data, errors = {}, {}
+        for key, res in zip(keys, results):
+            if isinstance(res, dict) and res.get("status") == "ok":
+                data[key] = res.get("data")
+            else:
+                errors[key] = res.get("error", res) if isinstance(res, dict) else res
+        
+        status = "error" if not data else "partial" if errors else "ok"
+        return {"status": status, "meta": {"count": len(data)}, "data": data, "errors": errors}
+
+
+_worker_app: App | None = None
+"""The application of the worker process of `ProcessPoolApp`"""
+
+
+def _initWorker(application_id: str, region: str, game_shortname: str, limiter: RateLimit.SharedTokenBucket | None, kwargs: dict) -> None:
+    global _worker_app
+    _worker_app = App(application_id, region, game_shortname, rate_limit=0, **kwargs)
+    _worker_app.limiter = limiter
+
+
+def _executeInWorker(task: tuple) -> Any:
+    api_method, type_request, typed, transform, params = task
+    try:
+        res = _worker_app.execute(api_method, type_request, typed, **params)
+        if hasattr(res, "headers") and hasattr(res, "status"):
+            # a response that could not be decoded is sent back without its connection
+            res = Transport.Response(res.status, dict(res.headers), getattr(res, "data", getattr(res, "body", b"")))
+        return transform(res) if transform is not None else res
+    except Exception as e:
+        return Exceptions.RequestFailedInWorker(api_method, f"{type(e).__name__}: {e}")
+
+
+class ProcessPoolApp:
+    """
+    Executes API requests on a pool of processes, so decoding of large responses, such as `tanks.stats`, runs on several cores.
+
+    Every process has its own `App` with its own connections. All processes share one limit of requests per second 
+    of the `application_id` in shared memory (`RateLimit.SharedTokenBucket`). Responses are decoded in the processes, 
+    and the optional `transform` reduces them there before they are sent back.
+
+    Attributes:
+        application_id (str): The application ID for API access.
+        region (Constants.REGION): The region for the API access.
+        game_shortname (Constants.GAMENAMES.SHORTNAMES): The short name of the game.
+        processes (int): The number of worker processes.
+        limiter (RateLimit.SharedTokenBucket | None): The limit of requests per second shared by all processes.
+        pool (multiprocessing.pool.Pool): The pool of worker processes.
+    """
+    def __init__(self, 
+            application_id: str, 
+            region: Constants.REGION, 
+            game_shortname: Constants.GAMENAMES.SHORTNAMES,
+            processes: int | None = None,
+            rate_limit: float | None = None,
+            start_method: str | None = None,
+            **kwargs: Any
+        ) -> None:
+        """
+        Initializes the pool of processes.
+
+        Args:
+            application_id (str): The application ID for API access.
+            region (Constants.REGION): The region for the API access.
+            game_shortname (Constants.GAMENAMES.SHORTNAMES): The short name of the game.
+            processes (int | None, optional): The number of worker processes (default is the number of CPUs).
+            rate_limit (float | None, optional): Requests per second for this `application_id` in all processes together, `0` disables the limit (default is `Constants.RATELIMITS` of the API holder).
+            start_method (str | None, optional): The `multiprocessing` start method, such as `spawn` (default is the default of the platform).
+            **kwargs (Any): Other arguments of the `App` of every process, such as `retry` or `decoder`. They must be picklable with the `spawn` start method.
+        """
+        import multiprocessing
+
+        self.application_id = application_id
+        self.region = region
+        self.game_shortname = game_shortname
+        self.processes = processes or os.cpu_count() or 1
+        Utils.checkQuery(region, game_shortname, "account.info")
+        Decoders.getDecoder(kwargs.get("decoder", Constants.DECODERS.AUTO))
+
+        if rate_limit is None:
+            rate_limit = Constants.RATELIMITS[Utils.apiHolder(region)]
+        context = multiprocessing.get_context(start_method)
+        self.limiter = RateLimit.SharedTokenBucket(rate_limit, context=context) if rate_limit else None
+        self.pool = context.Pool(
+            self.processes, 
+            initializer=_initWorker, 
+            initargs=(application_id, region, game_shortname, self.limiter, kwargs)
+        )
+
+    def __str__(self) -> str:
+        return f"ProcessPoolApp('{Utils.maskString(self.application_id)}', processes={self.processes})"
+
+    def __enter__(self) -> "ProcessPoolApp":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Waits for the submitted requests and stops the worker processes.
+        """
+        self.pool.close()
+        self.pool.join()
+
+    def imap(
+            self, 
+            api_method: str, 
+            param_sets: Iterable[dict],
+            type_request: Constants.TYPEREQUESTS = "GET",
+            typed: bool | None = None,
+            transform: Callable[[Any], Any] | None = None,
+            ordered: bool = True,
+            chunksize: int = 1,
+            return_exceptions: bool = False
+        ) -> Iterator[Any]:
+        """
+        Executes an API request for every set of query parameters in the worker processes and yields the results as they arrive.
+
+        Args:
+            api_method (str): The API method to be called.
+            param_sets (Iterable[dict]): Query parameters of every request, consumed lazily.
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            typed (bool | None, optional): Return typed models from `Models` if the method has one (default is the `typed` option of the application). Typed models are decoded straight from the response body, so such calls bypass the `cache` of the application.
+            transform (Callable[[Any], Any] | None, optional): A function applied to every response in the worker process. It must be defined at the top level of a module.
+            ordered (bool, optional): Yield the results in the order of `param_sets`, otherwise in the order of completion (default is True).
+            chunksize (int, optional): The number of requests sent to a process at once (default is 1).
+            return_exceptions (bool, optional): Yield the errors of requests instead of raising them (default is False).
+
+        Raises:
+            Exceptions.RequestFailedInWorker: If a request has raised an exception and `return_exceptions` is False.
+
+        Yields:
+            Any: The API response or the result of `transform`.
+        """
+        tasks = ((api_method, type_request, typed, transform, params) for params in param_sets)
+        imap = self.pool.imap if ordered else self.pool.imap_unordered
+        for res in imap(_executeInWorker, tasks, chunksize):
+            if isinstance(res, Exceptions.RequestFailedInWorker) and not return_exceptions:
+                raise res
+            yield res
+
+    def map(
+            self, 
+            api_method: str, 
+            param_sets: Iterable[dict],
+            type_request: Constants.TYPEREQUESTS = "GET",
+            typed: bool | None = None,
+            transform: Callable[[Any], Any] | None = None
+        ) -> list[Any]:
+        """
+        Executes an API request for every set of query parameters in the worker processes.
+
+        Returns:
+            list[Any]: API responses or results of `transform` in the order of `param_sets`.
+        """
+        return list(self.imap(api_method, param_sets, type_request, typed, transform))
+
+    def executeMany(
+            self, 
+            api_method: str, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            batch_size: int = Constants.MAX_IDS_PER_REQUEST,
+            **kwargs: dict[str, Any]
+        ) -> dict | Any:
+        """
+        Executes the API request for a list of identifiers of any length, such as `account_id=[...]`. 
+        The batches are requested in the worker processes and merged into one response.
+
+        Returns:
+            dict | Any: The merged API response or the first unsuccessful response.
+        """
+        return Utils.mergeResponses(list(self.imap(api_method, Utils.splitBatches(kwargs, batch_size), type_request, False, ordered=False)))
+
+    def stats(self) -> dict:
+        """
+        Returns counters of the shared limit of requests per second.
+
+        Returns:
+            dict: The counters of `RateLimit.TokenBucket.stats`, empty if the limit is disabled.
+        """
+        return self.limiter.stats() if self.limiter is not None else {}
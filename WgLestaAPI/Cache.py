@@ -0,0 +1,282 @@
+"""
+Cache of API responses for the WgLestaAPI library
+"""
+from collections import OrderedDict
+from typing import Any
+import json
+import sqlite3
+import threading
+import time
+
+from . import Constants
+from . import Utils
+
+
+class SqliteBackend:
+    """
+    On-disk storage of cached responses, so a restarted application starts with a warm cache.
+
+    Attributes:
+        path (str): The path to the sqlite database file.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, expires_at REAL, value TEXT)")
+        self._db.commit()
+
+    def __str__(self) -> str:
+        return f"SqliteBackend('{self.path}')"
+
+    def get(self, key: str) -> tuple[float, dict] | None:
+        """
+        Returns the stored response.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            tuple[float, dict] | None: The expiration time and the response, or `None` if the key is not stored.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT expires_at, value FROM responses WHERE key = ?", (key,)).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def set(self, key: str, value: dict, expires_at: float) -> None:
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, expires_at, json.dumps(value)))
+            self._db.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of successful API responses with a time to live for every method.
+
+    Responses are keyed on the region, the game, the method and the normalised query parameters. 
+    Cached responses are shared between callers, so they must not be modified.
+
+    Attributes:
+        maxsize (int): The maximum number of responses kept in memory.
+        ttl (float): Seconds to keep responses of methods that are not listed in `ttls`, `0` disables caching of such methods.
+        ttls (dict[str, float]): Seconds to keep responses of a method (`encyclopedia.vehicles`) or of a whole method block (`encyclopedia`).
+        backend (SqliteBackend | None): The optional on-disk storage.
+        hits (int): The number of requests answered from the cache.
+        misses (int): The number of requests that were not found in the cache.
+        evictions (int): The number of responses removed from memory to respect `maxsize`.
+    """
+    def __init__(self, 
+            maxsize: int = 1024, 
+            ttl: float = 0, 
+            ttls: dict[str, float] | None = None, 
+            backend: SqliteBackend | None = None
+        ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = Constants.CACHETTLS if ttls is None else ttls
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._data: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"ResponseCache(maxsize={self.maxsize}, size={len(self._data)})"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def getTtl(self, api_method: str) -> float:
+        """
+        Returns seconds to keep responses of the method.
+
+        Args:
+            api_method (str): The API method, such as `encyclopedia.vehicles`.
+
+        Returns:
+            float: The time to live, `0` means that responses of the method are not cached.
+        """
+        if api_method in self.ttls:
+            return self.ttls[api_method]
+        return self.ttls.get(api_method.split(".")[0], self.ttl)
+
+    def makeKey(self, region: str, game_shortname: str, api_method: str, params: dict) -> str:
+        return json.dumps([region, game_shortname, api_method, sorted(Utils.normalizeParams(params).items())])
+
+    def get(self, key: str) -> dict | None:
+        """
+        Returns the cached response that is not expired.
+
+        Args:
+            key (str): The cache key made by `makeKey`.
+
+        Returns:
+            dict | None: The response or `None` on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[0] > now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            if item is not None:
+                del self._data[key]
+
+        if self.backend is not None:
+            item = self.backend.get(key)
+            if item is not None and item[0] > now:
+                with self._lock:
+                    self._store(key, item)
+                    self.hits += 1
+                return item[1]
+            if item is not None:
+                self.backend.delete(key)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, value: dict, ttl: float) -> None:
+        """
+        Puts the response into the cache.
+
+        Args:
+            key (str): The cache key made by `makeKey`.
+            value (dict): The decoded API response.
+            ttl (float): Seconds to keep the response.
+        """
+        item = (time.time() + ttl, value)
+        with self._lock:
+            self._store(key, item)
+        if self.backend is not None:
+            self.backend.set(key, value, item[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns counters of the cache.
+
+        Returns:
+            dict: The number of hits, misses, evictions and responses in memory.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+        }
+
+    def _store(self, key: str, item: tuple[float, dict]) -> None:
+        self._data[key] = item
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+
+class ConditionalCache:
+    """
+    Validators (`ETag` and `Last-Modified`) of responses with their decoded bodies, used to send conditional requests.
+
+    When the API answers `304 Not Modified`, the stored body is returned without downloading and decoding it again. 
+    Only responses with validators are stored.
+
+    Attributes:
+        maxsize (int): The maximum number of stored responses.
+        revalidated (int): The number of requests answered with `304 Not Modified`.
+    """
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.revalidated = 0
+
+        self._data: OrderedDict[Any, tuple[dict, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"ConditionalCache(maxsize={self.maxsize}, size={len(self._data)})"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Any) -> tuple[dict, Any] | None:
+        """
+        Returns the validators of the response together with its body. 
+        
+        The body is taken with the validators, so the response stays available even if the entry is evicted before the API answers.
+
+        Args:
+            key (Any): The URL of the request and its decoder.
+
+        Returns:
+            tuple[dict, Any] | None: `If-None-Match` and `If-Modified-Since` headers with the decoded body or `None` if there are no validators.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            self._data.move_to_end(key)
+            return item
+
+    def getBody(self, item: tuple[dict, Any]) -> Any:
+        """
+        Returns the stored body of the response that was not modified.
+
+        Args:
+            item (tuple[dict, Any]): The validators and the body returned by `get()` before the request.
+
+        Returns:
+            Any: The decoded body.
+        """
+        with self._lock:
+            self.revalidated += 1
+        return item[1]
+
+    def set(self, key: Any, headers: Any, body: Any) -> None:
+        """
+        Stores the validators of the response.
+
+        Args:
+            key (Any): The URL of the request and its decoder.
+            headers (Any): Headers of the response.
+            body (Any): The decoded body.
+        """
+        validators = {}
+        if headers.get("ETag"):
+            validators["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        if not validators:
+            return
+        with self._lock:
+            self._data[key] = (validators, body)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "revalidated": self.revalidated,
+            "size": len(self._data),
+        }
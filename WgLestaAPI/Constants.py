@@ -6,12 +6,82 @@ CIS_PREFIX = "cis-"
 """The prefix is necessary to unify short game names for Lesta Games
 """
 
+MAX_IDS_PER_REQUEST = 100
+"""The maximum number of comma-separated identifiers accepted by one API request
+"""
+
+MAX_QUERY_LENGTH = 2000
+"""The maximum length of the query string of a `GET` request. Longer requests are sent as `POST` with the parameters 
+in a form-encoded body, because servers and proxies reject too long URLs
+"""
+
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+"""The headers of `POST` requests with the parameters in the body
+"""
+
+SINGLE_ID_METHODS = (
+    "tanks.stats",
+    "tanks.achievements",
+)
+"""Methods that accept only one identifier, such as one `account_id`, so their requests can not be batched
+"""
+
+BATCH_PARAM_SUFFIX = "_id"
+"""The suffix of query parameters that accept a list of identifiers, such as `account_id`, `clan_id` or `tank_id`
+"""
+
+DELTA_FIELDS = ("updated_at", "last_battle_time")
+"""Fields of records that change whenever the record changes, used to refresh only changed records
+"""
+
+EXTRA_FIELDS = {
+    "account.info": (
+        "private.boosters", "private.garage", "private.grouped_contacts", "private.personal_missions", "private.rented",
+        "statistics.epic", "statistics.fallout", "statistics.globalmap_absolute", "statistics.globalmap_champion",
+        "statistics.globalmap_middle", "statistics.random", "statistics.ranked_battles",
+    ),
+    "tanks.stats": (
+        "epic", "fallout", "globalmap_absolute", "globalmap_champion", "globalmap_middle", "random", "ranked_battles",
+    ),
+}
+"""Fields of methods that are returned only when they are listed in the `extra` parameter
+"""
+
+CACHETTLS = {
+    "encyclopedia": 24 * 60 * 60,
+}
+"""The default time to live in seconds of cached responses for methods (`encyclopedia.vehicles`) or whole method blocks (`encyclopedia`)
+"""
+
+SNAPSHOTS = {
+    "encyclopedia.vehicles":        "tank_id",
+    "encyclopedia.modules":         "module_id",
+    "encyclopedia.achievements":    "name",
+}
+"""Encyclopedia methods kept by `Snapshots.Snapshots` and the fields that identify their records
+"""
+
+RETRYERRORS = (
+    "REQUEST_LIMIT_EXCEEDED",
+    "SOURCE_NOT_AVAILABLE",
+)
+"""Messages of API errors that are transient and can be retried
+"""
+
 class APIHOLDERS(object):
     """API Owners"""
     WG      = "wargaming.net"
     LESTA   = "lesta.ru"
 
 
+RATELIMITS = {
+    APIHOLDERS.WG:      10,
+    APIHOLDERS.LESTA:   10,
+}
+"""The default number of requests per second allowed for one `application_id` of each API holder
+"""
+
+
 class TYPEREQUESTS(object):
     """Request types available for API"""
     GET     = "GET"
@@ -20,6 +90,45 @@ class TYPEREQUESTS(object):
     ALL     = (GET, POST)
 
 
+class DECODERS(object):
+    """Decoders of response bodies"""
+    AUTO    = "auto"
+    """The fastest installed decoder
+    """
+    ORJSON  = "orjson"
+    """The `orjson` package (must be installed)
+    """
+    MSGSPEC = "msgspec"
+    """The `msgspec` package (must be installed)
+    """
+    JSON    = "json"
+    """The standard `json` module
+    """
+    RAW     = "raw"
+    """The response body is returned as `bytes` without decoding
+    """
+
+    ALL     = (AUTO, ORJSON, MSGSPEC, JSON, RAW)
+
+
+class HOOKS(object):
+    """Events of API requests that hooks can subscribe to"""
+    BEFORE_REQUEST  = "before_request"
+    """Before the request is sent
+    """
+    AFTER_RESPONSE  = "after_response"
+    """After the response is received and decoded
+    """
+    ON_ERROR        = "on_error"
+    """After the request failed with an exception or the response is not successful
+    """
+    ON_RETRY        = "on_retry"
+    """Before the failed request is retried
+    """
+
+    ALL     = (BEFORE_REQUEST, AFTER_RESPONSE, ON_ERROR, ON_RETRY)
+
+
 class REGION(object):
     """List of regions available for API"""
     RU      = "ru"
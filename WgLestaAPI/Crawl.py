@@ -0,0 +1,331 @@
+"""
+Bulk crawls of API methods over large lists of identifiers for the WgLestaAPI library
+"""
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+import asyncio
+import json
+import os
+import time
+
+from . import Constants
+from . import Exceptions
+
+
+class JsonlSink:
+    """
+    Writes every record to a JSON Lines file as `{"id": ..., "data": ...}`.
+
+    Attributes:
+        path (str): The path to the file, records are appended to it.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __str__(self) -> str:
+        return f"JsonlSink('{self.path}')"
+
+    def write(self, data: dict) -> None:
+        self._file.writelines(json.dumps({"id": k, "data": v}, ensure_ascii=False) + "\n" for k, v in data.items())
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetSink:
+    """
+    Writes every record to a Parquet file with the `id` and `data` (JSON) columns. Requires `pyarrow`.
+
+    Attributes:
+        path (str): The path to the file.
+    """
+    def __init__(self, path: str) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise Exceptions.PackageIsNotInstalled("pyarrow", "ParquetSink")
+        self.path = path
+        self._pa = pyarrow
+        self._schema = pyarrow.schema([("id", pyarrow.string()), ("data", pyarrow.string())])
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def __str__(self) -> str:
+        return f"ParquetSink('{self.path}')"
+
+    def write(self, data: dict) -> None:
+        self._writer.write_table(self._pa.table({
+            "id": [str(k) for k in data],
+            "data": [json.dumps(v, ensure_ascii=False) for v in data.values()],
+        }, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class CallbackSink:
+    """
+    Passes the `data` of every batch to your function.
+    """
+    def __init__(self, callback: Callable[[dict], Any]) -> None:
+        self.callback = callback
+
+    def write(self, data: dict) -> None:
+        self.callback(data)
+
+    def close(self) -> None:
+        pass
+
+
+class Checkpoint:
+    """
+    Numbers of completed batches, appended to a file, so an interrupted crawl is resumed without fetching them again.
+
+    Attributes:
+        path (str): The path to the checkpoint file.
+        done (set[int]): Numbers of completed batches.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.done: set[int] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.done = {int(line) for line in f if line.strip()}
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __str__(self) -> str:
+        return f"Checkpoint('{self.path}', done={len(self.done)})"
+
+    def mark(self, batch_no: int) -> None:
+        self.done.add(batch_no)
+        self._file.write(f"{batch_no}\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CrawlStats:
+    """
+    Progress of a crawl.
+
+    Attributes:
+        total (int | None): The number of identifiers, if the source has a length.
+        ids_done (int): Identifiers of completed and skipped batches.
+        batches_done (int): Batches fetched by this run.
+        batches_skipped (int): Batches completed by a previous run.
+        batches_failed (int): Batches that failed and will be fetched again by the next run.
+        last_error (Any): The exception or the unsuccessful response of the last failed batch.
+        started (float): The `time.monotonic()` of the start.
+    """
+    __slots__ = ("total", "ids_done", "ids_fetched", "batches_done", "batches_skipped", "batches_failed", "last_error", "started")
+
+    def __init__(self, total: int | None = None) -> None:
+        self.total = total
+        self.ids_done = 0
+        self.ids_fetched = 0
+        self.batches_done = 0
+        self.batches_skipped = 0
+        self.batches_failed = 0
+        self.last_error = None
+        self.started = time.monotonic()
+
+    def __str__(self) -> str:
+        eta = self.eta
+        return (
+            f"{self.ids_done}{f'/{self.total}' if self.total is not None else ''} ids, "
+            f"{self.batches_done} batches done, {self.batches_skipped} skipped, {self.batches_failed} failed, "
+            f"{self.rate:.1f} ids/s, ETA {f'{eta:.0f}s' if eta is not None else 'unknown'}"
+        )
+
+    @property
+    def rate(self) -> float:
+        """Identifiers fetched by this run per second"""
+        elapsed = time.monotonic() - self.started
+        return self.ids_fetched / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Seconds left, if the number of identifiers is known"""
+        if self.total is None or not self.rate:
+            return None
+        return max(self.total - self.ids_done, 0) / self.rate
+
+
+def readIds(source: str | os.PathLike | Iterable) -> Iterable:
+    """Return the identifiers of the source
+
+    Args:
+        source (str | os.PathLike | Iterable): A path to a file with one identifier per line, a `range` or any iterable
+
+    Returns:
+        Iterable: The identifiers
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return readLines(source)
+    return source
+
+
+def readLines(path: str | os.PathLike) -> Iterator[str]:
+    """Yield the non-empty lines of the file, which is closed when the lines are consumed or the generator is closed"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line := line.strip():
+                yield line
+
+
+def splitIds(ids: Iterable, batch_size: int) -> Iterator[tuple[int, list]]:
+    """Split the identifiers into numbered batches. The numbers are stable while the source keeps its order
+
+    Yields:
+        tuple[int, list]: The number of the batch and its identifiers
+    """
+    it = iter(ids)
+    batch_no = 0
+    while batch := list(islice(it, batch_size)):
+        yield batch_no, batch
+        batch_no += 1
+
+
+class Crawler:
+    """
+    Fetches an API method for every identifier of a large source with a bounded pool of workers.
+
+    Identifiers are sent in batches, results are streamed to the sink and completed batches are written to 
+    the checkpoint. An interrupted crawl started again with the same source and checkpoint skips the completed 
+    batches. Batches whose results were written but not checkpointed are fetched again, so the sink may get 
+    a record twice after a crash.
+
+    Attributes:
+        app (Application.AsyncApp): The application used for requests.
+        api_method (str): The API method, such as `account.info`.
+        stats (CrawlStats): Progress of the crawl.
+    """
+    def __init__(self, 
+            app: Any,
+            api_method: str,
+            ids: str | os.PathLike | Iterable,
+            sink: JsonlSink | ParquetSink | CallbackSink,
+            id_param: str = "account_id",
+            batch_size: int | None = None,
+            workers: int = 8,
+            checkpoint: str | None = None,
+            progress: Callable[[CrawlStats], Any] | None = None,
+            progress_interval: float = 10.0,
+            **params: Any
+        ) -> None:
+        """
+        Initializes the crawler.
+
+        Args:
+            app (Application.AsyncApp): The application used for requests, its rate limit and retries apply to the crawl.
+            api_method (str): The API method, such as `account.info` or `tanks.stats`.
+            ids (str | os.PathLike | Iterable): A path to a file with one identifier per line, a `range` or any iterable.
+            sink (JsonlSink | ParquetSink | CallbackSink): The destination of the results.
+            id_param (str, optional): The query parameter of identifiers (default is `account_id`).
+            batch_size (int | None, optional): The number of identifiers in one request (default is 100, and 1 for the methods of `Constants.SINGLE_ID_METHODS`, such as `tanks.stats`).
+            workers (int, optional): The number of simultaneous requests (default is 8).
+            checkpoint (str | None, optional): The path to the checkpoint file, `None` disables resuming.
+            progress (Callable[[CrawlStats], Any] | None, optional): The function called with the progress, for example `print`.
+            progress_interval (float, optional): Seconds between progress reports (default is 10).
+            **params (Any): Other query parameters of the method, such as `fields`.
+        """
+        self.app = app
+        self.api_method = api_method
+        self.ids = ids
+        self.sink = sink
+        self.id_param = id_param
+        single_id = api_method.lower() in Constants.SINGLE_ID_METHODS
+        if batch_size is None:
+            batch_size = 1 if single_id else Constants.MAX_IDS_PER_REQUEST
+        elif single_id and batch_size > 1:
+            raise Exceptions.BatchSizeIsNotSupported(api_method, batch_size)
+        self.batch_size = batch_size
+        self.workers = workers
+        self.checkpoint = Checkpoint(checkpoint) if checkpoint else None
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.params = params
+        self.stats = CrawlStats(len(ids) if hasattr(ids, "__len__") and not isinstance(ids, str) else None)
+
+    def __str__(self) -> str:
+        return f"Crawler('{self.api_method}', {self.stats})"
+
+    async def run(self) -> CrawlStats:
+        """
+        Runs the crawl until every batch is fetched or failed.
+
+        Returns:
+            CrawlStats: The final progress.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.workers * 2)
+        workers = [asyncio.ensure_future(self._work(queue)) for _ in range(self.workers)]
+        reporter = asyncio.ensure_future(self._report()) if self.progress else None
+        ids = readIds(self.ids)
+        try:
+            for batch_no, batch in splitIds(ids, self.batch_size):
+                if self.checkpoint is not None and batch_no in self.checkpoint.done:
+                    self.stats.batches_skipped += 1
+                    self.stats.ids_done += len(batch)
+                    continue
+                await self._put(queue, (batch_no, batch), workers)
+            for _ in workers:
+                await self._put(queue, None, workers)
+            await asyncio.gather(*workers)
+        finally:
+            if isinstance(self.ids, (str, os.PathLike)):
+                ids.close()
+            for task in workers:
+                task.cancel()
+            if reporter is not None:
+                reporter.cancel()
+            self.sink.close()
+            if self.checkpoint is not None:
+                self.checkpoint.close()
+        if self.progress:
+            self.progress(self.stats)
+        return self.stats
+
+    async def _put(self, queue: asyncio.Queue, item: tuple | None, workers: list[asyncio.Task]) -> None:
+        """Put the item into the queue while watching the workers, so an error of a worker, such as of the sink, 
+        is raised instead of waiting for the full queue forever"""
+        if not queue.full():
+            queue.put_nowait(item)
+            return
+        put = asyncio.ensure_future(queue.put(item))
+        pending = {put, *workers}
+        try:
+            while put in pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is not put and not task.cancelled():
+                        task.result()
+                if put in pending and len(pending) == 1:
+                    raise RuntimeError("All workers of the crawl have stopped")
+        finally:
+            put.cancel()
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        while (item := await queue.get()) is not None:
+            batch_no, batch = item
+            try:
+                res = await self.app.execute(self.api_method, **{**self.params, self.id_param: batch})
+            except Exception as e:
+                res = e
+            if not isinstance(res, dict) or res.get("status") != "ok":
+                self.stats.batches_failed += 1
+                self.stats.last_error = res
+                continue
+            self.sink.write(res.get("data") or {})
+            if self.checkpoint is not None:
+                self.checkpoint.mark(batch_no)
+            self.stats.batches_done += 1
+            self.stats.ids_done += len(batch)
+            self.stats.ids_fetched += len(batch)
+
+    async def _report(self) -> None:
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            self.progress(self.stats)
@@ -0,0 +1,56 @@
+"""
+JSON decoders of API responses for the WgLestaAPI library
+"""
+from typing import Any, Callable
+import json
+
+from . import Constants
+from . import Exceptions
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def decodeRaw(data: bytes) -> bytes:
+    """Return the response body untouched, so it can be decoded lazily or passed through
+
+    Args:
+        data (bytes): The response body
+
+    Returns:
+        bytes: The same response body
+    """
+    return data
+
+
+def getDecoder(decoder: str | Callable[[bytes], Any] = Constants.DECODERS.AUTO) -> Callable[[bytes], Any]:
+    """Return the function that decodes the response body
+
+    Args:
+        decoder (str | Callable[[bytes], Any], optional): One of `Constants.DECODERS` or your own function (default is `Constants.DECODERS.AUTO`). 
+            `AUTO` uses `orjson` or `msgspec` when they are installed and the standard `json` module otherwise
+
+    Returns:
+        Callable[[bytes], Any]: The decoding function
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == Constants.DECODERS.AUTO:
+        decoder = Constants.DECODERS.ORJSON if orjson else Constants.DECODERS.MSGSPEC if msgspec else Constants.DECODERS.JSON
+
+    if decoder == Constants.DECODERS.JSON:
+        return json.loads
+    if decoder == Constants.DECODERS.RAW:
+        return decodeRaw
+    if decoder == Constants.DECODERS.ORJSON and orjson:
+        return orjson.loads
+    if decoder == Constants.DECODERS.MSGSPEC and msgspec:
+        return msgspec.json.Decoder().decode
+    raise Exceptions.DecoderIsNotAvailable(decoder)
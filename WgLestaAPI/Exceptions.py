@@ -23,3 +23,47 @@ class GameDoesNotAppearThisRegion(Exception):
 class IncorrectMethodDeclaration(Exception):
     def __init__(self, value) -> None:
         super().__init__(f"Invalid declaration of this method: \"{value}\". You are using ({len(value.split('.'))}) parts of method instead of (2). Also you need use the dot-notation (for example `account.info`)")
+
+class BatchParameterIsNotDefined(Exception):
+    def __init__(self, value) -> None:
+        super().__init__(f"There is no list of identifiers to split into batches among the parameters: \"{value}\". Pass one of the `*{c.BATCH_PARAM_SUFFIX}` parameters as a list (for example `account_id=[1, 2, 3]`)")
+
+class FieldPathIsNotValid(Exception):
+    def __init__(self, value, api_method: str) -> None:
+        super().__init__(f"Invalid path of the field \"{value}\" for the method \"{api_method}\". Use the names of fields from the official documentation joined by dots (for example `statistics.all.battles`)")
+
+class BatchSizeIsNotSupported(Exception):
+    def __init__(self, api_method, batch_size) -> None:
+        super().__init__(f"The method \"{api_method}\" accepts only one identifier per request, but the batch size is {batch_size}. Use `batch_size=1`")
+
+class WorkersExceedConnectionPool(ValueError):
+    def __init__(self, workers, pool_size) -> None:
+        super().__init__(f"{workers} threads can not send requests at once through the pool of {pool_size} connections, the rest would wait for a free connection. Create the application with `workers={workers}` or pass a `transport` with `pool_size={workers}`")
+
+class DecoderIsNotAvailable(Exception):
+    def __init__(self, value) -> None:
+        super().__init__(f"This decoder \"{value}\" is not available. Available decoders is: {', '.join(c.DECODERS.ALL)}. The `orjson` and `msgspec` decoders must be installed separately")
+
+class ResponseIsNotSuccessful(Exception):
+    def __init__(self, response) -> None:
+        self.response = response
+        error = response.get("error") if isinstance(response, dict) else None
+        super().__init__(f"API has returned an unsuccessful response: {error if error else response}")
+
+class PackageIsNotInstalled(Exception):
+    def __init__(self, package, feature) -> None:
+        super().__init__(f"The package \"{package}\" is required for \"{feature}\". Install it with `pip install {package}`")
+
+
+class HookIsNotDefined(Exception):
+    def __init__(self, value) -> None:
+        super().__init__(f"The hook \"{value}\" is not defined. Use one of `Constants.HOOKS`")
+
+class RequestFailedInWorker(Exception):
+    def __init__(self, api_method: str, error: str) -> None:
+        self.api_method = api_method
+        self.error = error
+        super().__init__(f"The request to \"{api_method}\" has failed in the worker process: {error}")
+
+    def __reduce__(self):
+        return type(self), (self.api_method, self.error)
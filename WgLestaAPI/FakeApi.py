@@ -0,0 +1,469 @@
+"""
+Fake Wargaming.net and Lesta Games API for offline development and load testing
+
+`FakeApi` generates realistic responses of the common methods from the identifiers of the request, so the same
+request always returns the same data. It can delay responses, fail a share of them and answer with
+`REQUEST_LIMIT_EXCEEDED` when an application exceeds its limit of requests per second. The fake API is served
+over HTTP by `FakeApiServer` or called in-process by `Transport.MockTransport` and `Transport.AsyncMockTransport`.
+"""
+from typing import Any, Callable
+from urllib.parse import parse_qsl, urlsplit
+import asyncio
+import json
+import random
+import threading
+import time
+
+from aiohttp import web
+
+from . import Transport
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+NATIONS = ("ussr", "germany", "usa", "france", "uk", "china", "japan", "czech", "sweden", "poland", "italy")
+TYPES = ("lightTank", "mediumTank", "heavyTank", "AT-SPG", "SPG")
+MODULE_TYPES = ("vehicleGun", "vehicleTurret", "vehicleEngine", "vehicleChassis", "vehicleRadio")
+ACHIEVEMENT_TYPES = ("repeatable", "single", "class", "custom", "series")
+VEHICLES_TOTAL = 800
+MODULES_TOTAL = 2000
+ACHIEVEMENTS_TOTAL = 300
+CLANS_TOTAL = 50000
+GAME_VERSION = "1.0.0"
+
+
+def _dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _error(code: int, message: str, field: str | None = None) -> dict:
+    return {"status": "error", "error": {"field": field, "message": message, "code": code, "value": None}}
+
+
+def _ids(params: dict, name: str) -> list[str]:
+    return [i for i in params.get(name, "").split(",") if i]
+
+
+def _project(record: dict, fields: str | None) -> dict:
+    """Keep only the fields of the record listed in the `fields` parameter, dotted paths are supported"""
+    if not fields:
+        return record
+    result = {}
+    for path in fields.split(","):
+        src, dst = record, result
+        *parents, leaf = path.strip().split(".")
+        for key in parents:
+            if not isinstance(src.get(key), dict):
+                break
+            src, dst = src[key], dst.setdefault(key, {})
+        else:
+            if leaf in src:
+                dst[leaf] = src[leaf]
+    return result
+
+
+def accountInfo(account_id: int) -> dict:
+    rnd = random.Random(account_id)
+    battles = rnd.randint(0, 60000)
+    wins = int(battles * rnd.uniform(0.4, 0.65))
+    created_at = 1262304000 + rnd.randint(0, 400000000)
+    last_battle_time = created_at + rnd.randint(0, 1000000)
+    return {
+        "account_id": account_id,
+        "nickname": f"player_{account_id}",
+        "clan_id": rnd.randint(1, CLANS_TOTAL) if rnd.random() < 0.4 else None,
+        "global_rating": rnd.randint(0, 12000),
+        "created_at": created_at,
+        "updated_at": last_battle_time + rnd.randint(0, 3600),
+        "last_battle_time": last_battle_time,
+        "client_language": rnd.choice(("en", "ru", "de", "pl", "fr")),
+        "statistics": {
+            "trees_cut": rnd.randint(0, 50000),
+            "all": {
+                "battles": battles,
+                "wins": wins,
+                "losses": battles - wins - battles // 50,
+                "draws": battles // 50,
+                "frags": int(battles * rnd.uniform(0.5, 1.5)),
+                "damage_dealt": battles * rnd.randint(300, 3000),
+                "xp": battles * rnd.randint(300, 900),
+                "max_xp": rnd.randint(0, 3000),
+                "hits_percents": rnd.randint(50, 85),
+            },
+        },
+    }
+
+
+def tankStats(account_id: int) -> list[dict]:
+    rnd = random.Random(account_id)
+    return [
+        {
+            "tank_id": tank_id,
+            "account_id": account_id,
+            "mark_of_mastery": rnd.randint(0, 4),
+            "max_xp": rnd.randint(0, 3000),
+            "max_frags": rnd.randint(0, 10),
+            "battle_life_time": rnd.randint(0, 500000),
+            "in_garage": None,
+            "all": {"battles": (battles := rnd.randint(1, 2000)), "wins": battles // 2, "frags": battles, "damage_dealt": battles * 1500},
+        }
+        for tank_id in sorted(rnd.sample(range(1, VEHICLES_TOTAL + 1), rnd.randint(1, 30)))
+    ]
+
+
+def clanInfo(clan_id: int) -> dict:
+    rnd = random.Random(clan_id)
+    members = sorted(rnd.sample(range(1, 600000000), rnd.randint(1, 100)))
+    return {
+        "clan_id": clan_id,
+        "name": f"Clan {clan_id}",
+        "tag": f"C{clan_id}"[:5],
+        "color": f"#{rnd.randint(0, 0xFFFFFF):06X}",
+        "motto": "",
+        "leader_id": members[0],
+        "leader_name": f"player_{members[0]}",
+        "members_count": len(members),
+        "created_at": 1262304000 + rnd.randint(0, 400000000),
+        "updated_at": 1700000000 + rnd.randint(0, 10000000),
+        "is_clan_disbanded": False,
+        "members": [{"account_id": i, "account_name": f"player_{i}", "role": "private", "joined_at": 1600000000} for i in members],
+    }
+
+
+def vehicle(tank_id: int) -> dict:
+    rnd = random.Random(tank_id)
+    tier = (tank_id - 1) % 10 + 1
+    return {
+        "tank_id": tank_id,
+        "name": f"Vehicle {tank_id}",
+        "short_name": f"V{tank_id}",
+        "tag": f"V{tank_id}_tag",
+        "nation": NATIONS[tank_id % len(NATIONS)],
+        "type": TYPES[tank_id % len(TYPES)],
+        "tier": tier,
+        "is_premium": rnd.random() < 0.2,
+        "is_gift": False,
+        "price_credit": tier ** 4 * 1000,
+        "price_gold": 0,
+        "images": {"big_icon": f"https://example.com/{tank_id}.png"},
+        "description": "A vehicle of the fake API. " * rnd.randint(2, 10),
+    }
+
+
+def module(module_id: int) -> dict:
+    tier = (module_id - 1) % 10 + 1
+    return {
+        "module_id": module_id,
+        "name": f"Module {module_id}",
+        "nation": NATIONS[module_id % len(NATIONS)],
+        "type": MODULE_TYPES[module_id % len(MODULE_TYPES)],
+        "tier": tier,
+        "price_credit": tier ** 3 * 500,
+        "weight": random.Random(module_id).randint(100, 20000),
+        "image": f"https://example.com/modules/{module_id}.png",
+        "tanks": [(module_id * 7 + i) % VEHICLES_TOTAL + 1 for i in range(3)],
+    }
+
+
+def achievement(achievement_no: int) -> dict:
+    return {
+        "name": f"achievement_{achievement_no}",
+        "name_i18n": f"Achievement {achievement_no}",
+        "type": ACHIEVEMENT_TYPES[achievement_no % len(ACHIEVEMENT_TYPES)],
+        "section": ("battle", "epic", "special", "memorial", "class")[achievement_no % 5],
+        "order": achievement_no,
+        "image": f"https://example.com/achievements/{achievement_no}.png",
+        "description": f"Description of the achievement {achievement_no}.",
+    }
+
+
+class FakeApi:
+    """
+    Responses of the fake API.
+
+    Attributes:
+        latency (float): The average delay of a response in seconds.
+        jitter (float): The maximum deviation of the delay in seconds.
+        error_rate (float): The share of responses with the `SOURCE_NOT_AVAILABLE` error.
+        http_error_rate (float): The share of responses with the HTTP status 503.
+        rate_limit (float | None): Requests per second allowed for one `application_id`, `None` means no limit.
+        game_version (str): The version of the game returned by `encyclopedia.info`.
+        requests (int): The number of requests handled.
+        errors (int): The number of failed responses, including rate-limited ones.
+        limited (int): The number of responses with `REQUEST_LIMIT_EXCEEDED`.
+    """
+    def __init__(self,
+            latency: float = 0.0,
+            jitter: float = 0.0,
+            error_rate: float = 0.0,
+            http_error_rate: float = 0.0,
+            rate_limit: float | None = None,
+            seed: int | None = None
+        ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.http_error_rate = http_error_rate
+        self.rate_limit = rate_limit
+        self.game_version = GAME_VERSION
+        self.requests = 0
+        self.errors = 0
+        self.limited = 0
+
+        self._random = random.Random(seed)
+        self._windows: dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._methods: dict[str, Callable[[dict], dict]] = {
+            "account.list":             self._accountList,
+            "account.info":             self._recordsById("account_id", accountInfo),
+            "tanks.stats":              self._tanksStats,
+            "clans.info":               self._recordsById("clan_id", clanInfo),
+            "clans.list":               self._clansList,
+            "encyclopedia.vehicles":    self._encyclopedia("tank_id", vehicle, VEHICLES_TOTAL),
+            "encyclopedia.modules":     self._encyclopedia("module_id", module, MODULES_TOTAL),
+            "encyclopedia.achievements": self._achievements,
+            "encyclopedia.info":        self._info,
+            "auth.prolongate":          self._prolongate,
+        }
+
+    def __str__(self) -> str:
+        return f"FakeApi(latency={self.latency}, error_rate={self.error_rate}, rate_limit={self.rate_limit})"
+
+    def sampleLatency(self) -> float:
+        """
+        Returns the delay of the next response.
+
+        Returns:
+            float: Seconds to wait before responding.
+        """
+        if not self.jitter:
+            return self.latency
+        return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the fake API.
+
+        Returns:
+            dict: `requests`, `errors` and `limited` responses.
+        """
+        return {"requests": self.requests, "errors": self.errors, "limited": self.limited}
+
+    def respond(self, type_request: str, url: str, body: bytes | None = None) -> Transport.Response:
+        """
+        Returns the response to a request without the delay.
+
+        Args:
+            type_request (str): The type of HTTP request.
+            url (str): The URL of the request, such as `http://127.0.0.1:8080/wot/account/info/?application_id=...`.
+            body (bytes | None, optional): The form-encoded body of a `POST` request.
+
+        Returns:
+            Transport.Response: The response.
+        """
+        parts = urlsplit(url)
+        params = dict(parse_qsl(parts.query))
+        if body:
+            params.update(parse_qsl(body.decode()))
+        path = [p for p in parts.path.split("/") if p]
+        api_method = ".".join(path[1:3]).lower()
+
+        with self._lock:
+            self.requests += 1
+            status = self._admit(params.get("application_id", ""))
+            roll = self._random.random()
+        if status is None and roll < self.http_error_rate:
+            with self._lock:
+                self.errors += 1
+            return Transport.Response(503, {"Content-Type": "text/html"}, b"<html><body>503 Service Unavailable</body></html>")
+        if status is None and roll < self.http_error_rate + self.error_rate:
+            status = (504, "SOURCE_NOT_AVAILABLE")
+        if status is None and api_method not in self._methods:
+            status = (404, "METHOD_NOT_FOUND")
+
+        if status is not None:
+            with self._lock:
+                self.errors += 1
+            data = _error(*status)
+        else:
+            data = self._methods[api_method](params)
+        return Transport.Response(200, {"Content-Type": "application/json; charset=utf-8"}, _dumps(data))
+
+    def _admit(self, application_id: str) -> tuple[int, str] | None:
+        if self.rate_limit is None:
+            return None
+        now = time.monotonic()
+        window = self._windows.setdefault(application_id, [now, 0])
+        if now - window[0] >= 1.0:
+            window[0], window[1] = now, 0
+        window[1] += 1
+        if window[1] > self.rate_limit:
+            self.limited += 1
+            return (407, "REQUEST_LIMIT_EXCEEDED")
+        return None
+
+    def _recordsById(self, id_param: str, factory: Callable[[int], Any]) -> Callable[[dict], dict]:
+        def method(params: dict) -> dict:
+            fields = params.get("fields")
+            data = {}
+            for i in _ids(params, id_param):
+                record = factory(int(i))
+                data[i] = _project(record, fields) if isinstance(record, dict) else record
+            return {"status": "ok", "meta": {"count": len(data)}, "data": data}
+        return method
+
+    def _tanksStats(self, params: dict) -> dict:
+        # like the real API, the method accepts one account and at most 100 vehicles
+        account_ids = _ids(params, "account_id")
+        if len(account_ids) != 1:
+            return _error(407, "INVALID_ACCOUNT_ID", "account_id")
+        tank_ids = set(_ids(params, "tank_id"))
+        if len(tank_ids) > 100:
+            return _error(407, "TANK_ID_LIST_LIMIT_EXCEEDED", "tank_id")
+        records = tankStats(int(account_ids[0]))
+        if tank_ids:
+            records = [r for r in records if str(r["tank_id"]) in tank_ids]
+        fields = params.get("fields")
+        return {"status": "ok", "meta": {"count": 1}, "data": {account_ids[0]: [_project(r, fields) for r in records]}}
+
+    def _accountList(self, params: dict) -> dict:
+        search = params.get("search", "player")
+        limit = min(int(params.get("limit", 100)), 100)
+        data = [{"nickname": f"{search}_{i}", "account_id": 500000000 + i} for i in range(limit)]
+        return {"status": "ok", "meta": {"count": len(data)}, "data": data}
+
+    def _clansList(self, params: dict) -> dict:
+        page, limit = int(params.get("page_no", 1)), min(int(params.get("limit", 100)), 100)
+        ids = range((page - 1) * limit + 1, min(page * limit, CLANS_TOTAL) + 1)
+        data = [{"clan_id": i, "name": f"Clan {i}", "tag": f"C{i}"[:5], "members_count": random.Random(i).randint(1, 100)} for i in ids]
+        return {"status": "ok", "meta": {"count": len(data), "total": CLANS_TOTAL}, "data": data}
+
+    def _encyclopedia(self, id_param: str, factory: Callable[[int], dict], total: int) -> Callable[[dict], dict]:
+        def method(params: dict) -> dict:
+            ids = [int(i) for i in _ids(params, id_param)] or range(1, total + 1)
+            records = [factory(i) for i in ids if 0 < i <= total]
+            for name in ("tier", "nation", "type"):
+                if name in params:
+                    values = params[name].split(",")
+                    records = [r for r in records if str(r[name]) in values]
+            page, limit = int(params.get("page_no", 1)), int(params.get("limit", 100))
+            page_records = records[(page - 1) * limit:page * limit]
+            fields = params.get("fields")
+            data = {str(r[id_param]): _project(r, fields) for r in page_records}
+            meta = {"count": len(data), "page_total": -(-len(records) // limit), "total": len(records), "limit": limit, "page": page}
+            return {"status": "ok", "meta": meta, "data": data}
+        return method
+
+    def _achievements(self, params: dict) -> dict:
+        fields = params.get("fields")
+        data = {r["name"]: _project(r, fields) for r in map(achievement, range(1, ACHIEVEMENTS_TOTAL + 1))}
+        return {"status": "ok", "meta": {"count": len(data)}, "data": data}
+
+    def _info(self, params: dict) -> dict:
+        return {"status": "ok", "meta": {"count": 1}, "data": {"game_version": self.game_version, "tanks_updated_at": 1700000000}}
+
+    def _prolongate(self, params: dict) -> dict:
+        expires_at = int(time.time()) + int(params.get("expires_at", 14 * 86400))
+        token = f"token_{self._random.getrandbits(64):016x}"
+        return {"status": "ok", "data": {"access_token": token, "account_id": 0, "expires_at": expires_at}}
+
+
+class FakeApiServer:
+    """
+    Serves the fake API over HTTP from a background thread, so both `App` and `AsyncApp` can be pointed at it.
+
+    Attributes:
+        api (FakeApi): The responses of the server.
+        host (str): The host of the server.
+        port (int): The port of the server, `0` picks a free port when the server starts.
+    """
+    def __init__(self, api: FakeApi | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.api = api if api is not None else FakeApi()
+        self.host = host
+        self.port = port
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+        self._error: Exception | None = None
+
+    def __str__(self) -> str:
+        return f"FakeApiServer('{self.host}:{self.port}')"
+
+    def __enter__(self) -> "FakeApiServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def baseUrl(self, game_shortname: str) -> str:
+        """
+        Returns the URL of the game on the server, to be set as `base_url` of an application.
+
+        Args:
+            game_shortname (str): The short name of the game.
+
+        Returns:
+            str: The URL, such as `http://127.0.0.1:8080/wot/`.
+        """
+        return f"http://{self.host}:{self.port}/{game_shortname}/"
+
+    def start(self) -> None:
+        """
+        Starts the server and waits until it accepts connections.
+
+        Raises:
+            OSError: If the server can not listen on the host and the port, such as when the port is in use.
+        """
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._serve, args=(started,), name="WgLestaAPI-FakeApiServer", daemon=True)
+        self._thread.start()
+        started.wait()
+        if self._error is not None:
+            error, self._error = self._error, None
+            self._thread.join()
+            self._thread = None
+            raise error
+
+    def stop(self) -> None:
+        """
+        Stops the server.
+        """
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    def _serve(self, started: threading.Event) -> None:
+        loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        try:
+            loop.run_until_complete(self._runner.setup())
+            site = web.TCPSite(self._runner, self.host, self.port)
+            loop.run_until_complete(site.start())
+        except Exception as e:
+            # the error is raised by `start` in the thread that waits for the server
+            self._error = e
+            loop.run_until_complete(self._runner.cleanup())
+            loop.close()
+            started.set()
+            return
+        self.port = site._server.sockets[0].getsockname()[1]
+        self._loop = loop
+        started.set()
+        loop.run_forever()
+        loop.close()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        delay = self.api.sampleLatency()
+        if delay:
+            await asyncio.sleep(delay)
+        res = self.api.respond(request.method, str(request.url), await request.read())
+        return web.Response(status=res.status, body=res.body, headers=res.headers)
@@ -0,0 +1,275 @@
+"""
+Instrumentation hooks of API requests for the WgLestaAPI library
+
+Callbacks subscribed to the events of `Constants.HOOKS` receive an `Event` of every request. When an application
+has no hooks, the requests only check that `hooks` is `None`. `PrometheusAdapter` and `OpenTelemetryAdapter`
+export the events as metrics and spans.
+"""
+from typing import Any, Callable
+import time
+
+from . import Constants
+from . import Exceptions
+
+
+class Event:
+    """
+    One event of an API request.
+
+    Attributes:
+        name (Constants.HOOKS): The name of the event.
+        api_method (str): The API method, such as `account.info`.
+        region (Constants.REGION): The region of the application.
+        game_shortname (Constants.GAMENAMES.SHORTNAMES): The short name of the game.
+        type_request (Constants.TYPEREQUESTS): The type of HTTP request.
+        url (str): The URL of the request, it contains the `application_id`.
+        started (float): The `time.perf_counter()` when the request was sent.
+        latency (float | None): Seconds from sending the request to decoding the response.
+        size (int | None): The size of the response body in bytes.
+        status (int | None): The HTTP status.
+        api_status (str | None): The `status` of the API response, `ok` or `error`.
+        error_code (int | None): The `error.code` of the API response.
+        error_message (str | None): The `error.message` of the API response.
+        exception (BaseException | None): The exception raised by the request.
+        attempt (int | None): The number of the failed attempt of `on_retry`.
+        delay (float | None): Seconds before the retry of `on_retry`.
+        context (dict): The state of adapters between the events of one request.
+    """
+    __slots__ = (
+        "name", "api_method", "region", "game_shortname", "type_request", "url", "started", "latency", "size",
+        "status", "api_status", "error_code", "error_message", "exception", "attempt", "delay", "context",
+    )
+
+    def __init__(self, name: str, app_instance: Any, api_method: str, type_request: str, url: str) -> None:
+        self.name = name
+        self.api_method = api_method
+        self.region = app_instance.region
+        self.game_shortname = app_instance.game_shortname
+        self.type_request = type_request
+        self.url = url
+        self.started = time.perf_counter()
+        self.latency = None
+        self.size = None
+        self.status = None
+        self.api_status = None
+        self.error_code = None
+        self.error_message = None
+        self.exception = None
+        self.attempt = None
+        self.delay = None
+        self.context = {}
+
+    def __repr__(self) -> str:
+        return f"Event('{self.name}', '{self.api_method}', region='{self.region}', status={self.status}, error_code={self.error_code})"
+
+    @property
+    def failed(self) -> bool:
+        """`True` if the request raised an exception or the response is not successful"""
+        return self.exception is not None or self.api_status == "error" or (self.status is not None and self.status >= 400)
+
+
+def _apiResult(data: Any) -> tuple[str | None, dict | None]:
+    if isinstance(data, dict):
+        return data.get("status"), data.get("error")
+    return getattr(data, "status", None), getattr(data, "error", None)
+
+
+class Hooks:
+    """
+    Callbacks of the events of API requests, shared by any number of applications.
+
+    Attributes:
+        callbacks (dict[Constants.HOOKS, list[Callable[[Event], None]]]): Callbacks of every event.
+    """
+    ADAPTER_METHODS = {
+        Constants.HOOKS.BEFORE_REQUEST: "beforeRequest",
+        Constants.HOOKS.AFTER_RESPONSE: "afterResponse",
+        Constants.HOOKS.ON_ERROR: "onError",
+        Constants.HOOKS.ON_RETRY: "onRetry",
+    }
+    """Methods of adapters called for every event"""
+
+    def __init__(self) -> None:
+        self.callbacks: dict[str, list[Callable[[Event], None]]] = {name: [] for name in Constants.HOOKS.ALL}
+
+    def __str__(self) -> str:
+        return f"Hooks({', '.join(f'{name}={len(callbacks)}' for name, callbacks in self.callbacks.items())})"
+
+    def add(self, name: Constants.HOOKS, callback: Callable[[Event], None]) -> None:
+        """
+        Subscribes the callback to the event.
+
+        Args:
+            name (Constants.HOOKS): The name of the event.
+            callback (Callable[[Event], None]): The function called with the event.
+        """
+        if name not in self.callbacks:
+            raise Exceptions.HookIsNotDefined(name)
+        self.callbacks[name].append(callback)
+
+    def remove(self, name: Constants.HOOKS, callback: Callable[[Event], None]) -> None:
+        """
+        Unsubscribes the callback from the event.
+
+        Args:
+            name (Constants.HOOKS): The name of the event.
+            callback (Callable[[Event], None]): The function passed to `add`.
+        """
+        self.callbacks[name].remove(callback)
+
+    def attach(self, adapter: Any) -> Any:
+        """
+        Subscribes the methods `beforeRequest`, `afterResponse`, `onError` and `onRetry` of the adapter that it has.
+
+        Args:
+            adapter (Any): The adapter, such as `PrometheusAdapter`.
+
+        Returns:
+            Any: The same adapter.
+        """
+        for name, method in self.ADAPTER_METHODS.items():
+            if hasattr(adapter, method):
+                self.add(name, getattr(adapter, method))
+        return adapter
+
+    def emit(self, event: Event) -> None:
+        for callback in self.callbacks[event.name]:
+            callback(event)
+
+    def start(self, app_instance: Any, api_method: str, type_request: str, url: str) -> Event:
+        """
+        Emits `before_request` and returns the event, which is passed on to `response` or `error`.
+        """
+        event = Event(Constants.HOOKS.BEFORE_REQUEST, app_instance, api_method, type_request, url)
+        self.emit(event)
+        return event
+
+    def response(self, event: Event, res: Any, data: Any) -> None:
+        """
+        Emits `after_response`, and `on_error` if the response is not successful.
+        """
+        event.latency = time.perf_counter() - event.started
+        event.status = res.status
+        event.size = len(res.body)
+        api_status, error = _apiResult(data)
+        event.api_status = api_status if isinstance(api_status, str) else None
+        if isinstance(error, dict):
+            event.error_code, event.error_message = error.get("code"), error.get("message")
+        event.name = Constants.HOOKS.AFTER_RESPONSE
+        self.emit(event)
+        if event.failed:
+            event.name = Constants.HOOKS.ON_ERROR
+            self.emit(event)
+
+    def error(self, event: Event, exc: BaseException) -> None:
+        """
+        Emits `on_error` for the exception raised by the request.
+        """
+        event.latency = time.perf_counter() - event.started
+        event.exception = exc
+        event.name = Constants.HOOKS.ON_ERROR
+        self.emit(event)
+
+    def retry(self, app_instance: Any, api_method: str, type_request: str, url: str) -> Callable[[int, float, Any, BaseException | None], None]:
+        """
+        Returns the callback of `Retry.RetryPolicy` that emits `on_retry`.
+        """
+        def onRetry(attempt: int, delay: float, result: Any, exc: BaseException | None) -> None:
+            event = Event(Constants.HOOKS.ON_RETRY, app_instance, api_method, type_request, url)
+            event.attempt, event.delay, event.exception = attempt, delay, exc
+            event.api_status, error = _apiResult(result)
+            if isinstance(event.api_status, int):
+                event.status, event.api_status = event.api_status, None
+            if isinstance(error, dict):
+                event.error_code, event.error_message = error.get("code"), error.get("message")
+            self.emit(event)
+        return onRetry
+
+
+class PrometheusAdapter:
+    """
+    Exports the events as Prometheus metrics, requires the `prometheus_client` package.
+
+    Metrics (with the prefix):
+        `requests_total{method, region, status}`: Responses by HTTP status, `exception` for failed requests.
+        `request_duration_seconds{method, region}`: Latency of requests.
+        `response_size_bytes{method}`: Sizes of response bodies.
+        `errors_total{method, region, code}`: Failed requests by API error code or exception name.
+        `retries_total{method, region}`: Retries of requests.
+    """
+    def __init__(self, registry: Any = None, prefix: str = "wglestaapi") -> None:
+        try:
+            import prometheus_client
+        except ImportError:
+            raise Exceptions.PackageIsNotInstalled("prometheus_client", "PrometheusAdapter")
+        options = {} if registry is None else {"registry": registry}
+        self.requests = prometheus_client.Counter(f"{prefix}_requests_total", "API requests", ["method", "region", "status"], **options)
+        self.latency = prometheus_client.Histogram(f"{prefix}_request_duration_seconds", "Latency of API requests", ["method", "region"], **options)
+        self.size = prometheus_client.Histogram(
+            f"{prefix}_response_size_bytes", "Sizes of API responses", ["method"],
+            buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, float("inf")), **options
+        )
+        self.errors = prometheus_client.Counter(f"{prefix}_errors_total", "Failed API requests", ["method", "region", "code"], **options)
+        self.retries = prometheus_client.Counter(f"{prefix}_retries_total", "Retries of API requests", ["method", "region"], **options)
+
+    def afterResponse(self, event: Event) -> None:
+        self.requests.labels(event.api_method, event.region, str(event.status)).inc()
+        self.latency.labels(event.api_method, event.region).observe(event.latency)
+        self.size.labels(event.api_method).observe(event.size)
+
+    def onError(self, event: Event) -> None:
+        if event.exception is not None:
+            self.requests.labels(event.api_method, event.region, "exception").inc()
+            code = type(event.exception).__name__
+        else:
+            code = str(event.error_code if event.error_code is not None else event.status)
+        self.errors.labels(event.api_method, event.region, code).inc()
+
+    def onRetry(self, event: Event) -> None:
+        self.retries.labels(event.api_method, event.region).inc()
+
+
+class OpenTelemetryAdapter:
+    """
+    Exports every request as an OpenTelemetry span of the kind `CLIENT`, requires the `opentelemetry-api` package.
+    The URL is not recorded, because it contains the `application_id` and the `access_token`.
+    """
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise Exceptions.PackageIsNotInstalled("opentelemetry-api", "OpenTelemetryAdapter")
+        self.trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer("WgLestaAPI")
+
+    def beforeRequest(self, event: Event) -> None:
+        event.context["span"] = self.tracer.start_span(
+            event.api_method,
+            kind=self.trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": event.type_request,
+                "wglestaapi.method": event.api_method,
+                "wglestaapi.region": event.region,
+                "wglestaapi.game": event.game_shortname,
+            },
+        )
+
+    def afterResponse(self, event: Event) -> None:
+        span = event.context.pop("span", None)
+        if span is None:
+            return
+        span.set_attribute("http.response.status_code", event.status)
+        span.set_attribute("wglestaapi.response_size", event.size)
+        if event.error_code is not None:
+            span.set_attribute("wglestaapi.error_code", event.error_code)
+        if event.failed:
+            span.set_status(self.trace.Status(self.trace.StatusCode.ERROR, event.error_message))
+        span.end()
+
+    def onError(self, event: Event) -> None:
+        span = event.context.pop("span", None)
+        if span is None:
+            return
+        span.record_exception(event.exception)
+        span.set_status(self.trace.Status(self.trace.StatusCode.ERROR, type(event.exception).__name__))
+        span.end()
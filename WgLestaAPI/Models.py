@@ -0,0 +1,191 @@
+"""
+Typed models of API responses for the WgLestaAPI library
+
+The models keep only the most used fields of the common methods and are much lighter than plain dictionaries. 
+Field names follow the World of Tanks API, missing fields are set to `None` and unknown fields are dropped. 
+When `msgspec` is installed, responses are decoded straight from bytes into the models.
+"""
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
+import types
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+@dataclass(slots=True)
+class AccountListItem:
+    account_id: int | None = None
+    nickname: str | None = None
+
+
+@dataclass(slots=True)
+class AccountInfo:
+    account_id: int | None = None
+    nickname: str | None = None
+    clan_id: int | None = None
+    global_rating: int | None = None
+    created_at: int | None = None
+    updated_at: int | None = None
+    last_battle_time: int | None = None
+    client_language: str | None = None
+    statistics: dict | None = None
+
+
+@dataclass(slots=True)
+class TankStats:
+    tank_id: int | None = None
+    account_id: int | None = None
+    mark_of_mastery: int | None = None
+    max_xp: int | None = None
+    max_frags: int | None = None
+    battle_life_time: int | None = None
+    in_garage: bool | None = None
+    all: dict | None = None
+
+
+@dataclass(slots=True)
+class ClanInfo:
+    clan_id: int | None = None
+    name: str | None = None
+    tag: str | None = None
+    color: str | None = None
+    motto: str | None = None
+    leader_id: int | None = None
+    leader_name: str | None = None
+    members_count: int | None = None
+    created_at: int | None = None
+    updated_at: int | None = None
+    is_clan_disbanded: bool | None = None
+    members: list[dict] | None = None
+
+
+@dataclass(slots=True)
+class Vehicle:
+    tank_id: int | None = None
+    name: str | None = None
+    short_name: str | None = None
+    tag: str | None = None
+    nation: str | None = None
+    type: str | None = None
+    tier: int | None = None
+    is_premium: bool | None = None
+    is_gift: bool | None = None
+    price_credit: int | None = None
+    price_gold: int | None = None
+    images: dict | None = None
+
+
+@dataclass(slots=True)
+class AccountListResponse:
+    status: str | None = None
+    meta: dict | None = None
+    error: dict | None = None
+    data: list[AccountListItem] | None = None
+
+
+@dataclass(slots=True)
+class AccountInfoResponse:
+    status: str | None = None
+    meta: dict | None = None
+    error: dict | None = None
+    data: dict[str, AccountInfo | None] | None = None
+
+
+@dataclass(slots=True)
+class TankStatsResponse:
+    status: str | None = None
+    meta: dict | None = None
+    error: dict | None = None
+    data: dict[str, list[TankStats] | None] | None = None
+
+
+@dataclass(slots=True)
+class ClanInfoResponse:
+    status: str | None = None
+    meta: dict | None = None
+    error: dict | None = None
+    data: dict[str, ClanInfo | None] | None = None
+
+
+@dataclass(slots=True)
+class VehiclesResponse:
+    status: str | None = None
+    meta: dict | None = None
+    error: dict | None = None
+    data: dict[str, Vehicle | None] | None = None
+
+
+MODELS: dict[str, type] = {
+    "account.list":             AccountListResponse,
+    "account.info":             AccountInfoResponse,
+    "tanks.stats":              TankStatsResponse,
+    "clans.info":               ClanInfoResponse,
+    "encyclopedia.vehicles":    VehiclesResponse,
+}
+"""Typed responses of API methods"""
+
+
+def getModel(api_method: str) -> type | None:
+    """Return the typed response of the method
+
+    Args:
+        api_method (str): The API method, such as `account.info`
+
+    Returns:
+        type | None: The model or `None` if the method has no model
+    """
+    return MODELS.get(api_method.lower())
+
+
+@lru_cache(maxsize=None)
+def _hints(model: type) -> tuple[tuple[str, Any], ...]:
+    hints = get_type_hints(model)
+    return tuple((f.name, hints[f.name]) for f in fields(model))
+
+
+def fromDict(obj: Any, tp: Any) -> Any:
+    """Convert a decoded JSON value into the model, following its type annotations
+
+    Args:
+        obj (Any): The decoded JSON value
+        tp (Any): The model or an annotation, such as `dict[str, AccountInfo | None]`
+
+    Returns:
+        Any: The converted value
+    """
+    if obj is None:
+        return None
+    origin = get_origin(tp)
+    if origin is Union or origin is types.UnionType:
+        tp = next(arg for arg in get_args(tp) if arg is not type(None))
+        origin = get_origin(tp)
+
+    if is_dataclass(tp):
+        return tp(**{name: fromDict(obj[name], hint) for name, hint in _hints(tp) if name in obj})
+    if origin is dict and get_args(tp):
+        value_tp = get_args(tp)[1]
+        return {k: fromDict(v, value_tp) for k, v in obj.items()}
+    if origin is list and get_args(tp):
+        item_tp = get_args(tp)[0]
+        return [fromDict(i, item_tp) for i in obj]
+    return obj
+
+
+@lru_cache(maxsize=None)
+def getDecoder(model: type, fallback: Callable[[bytes], Any]) -> Callable[[bytes], Any]:
+    """Return the function that decodes the response body into the model
+
+    Args:
+        model (type): The typed response
+        fallback (Callable[[bytes], Any]): The decoder of the application, used when `msgspec` is not installed
+
+    Returns:
+        Callable[[bytes], Any]: The decoding function
+    """
+    if msgspec:
+        return msgspec.json.Decoder(model).decode
+    return lambda data: fromDict(fallback(data), model)
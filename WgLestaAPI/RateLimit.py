@@ -0,0 +1,347 @@
+"""
+Client-side limits of requests per second and of requests in flight for the WgLestaAPI library
+"""
+from collections import deque
+from typing import Any
+import asyncio
+import multiprocessing
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket that spreads requests to keep them under the allowed number of requests per second.
+
+    Every request reserves a token and gets the time it has to wait before it can be sent. The reservation 
+    is made under a thread lock, so the same bucket can be used from several threads and from several event loops.
+    
+    Attributes:
+        rate (float): The number of requests allowed per second.
+        burst (int): The number of requests that can be sent at once after a pause.
+        requests (int): The total number of acquired tokens.
+        delayed (int): The number of requests that had to wait.
+        wait_time (float): The total time in seconds that requests waited.
+        max_wait (float): The longest time in seconds that one request waited.
+    """
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.requests = 0
+        self.delayed = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, burst={self.burst})"
+
+    def reserve(self) -> float:
+        """
+        Reserves one token.
+
+        Returns:
+            float: Seconds to wait before the request can be sent.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate) - 1
+            self._updated = now
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self.requests += 1
+            if delay:
+                self.delayed += 1
+                self.wait_time += delay
+                self.max_wait = max(self.max_wait, delay)
+            return delay
+
+    def setRate(self, rate: float) -> None:
+        """
+        Changes the number of requests allowed per second. The tokens collected so far are kept.
+
+        Args:
+            rate (float): The new number of requests per second.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = rate
+
+    def acquire(self) -> None:
+        """
+        Blocks the current thread until the request can be sent.
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquireAsync(self) -> None:
+        """
+        Suspends the current coroutine until the request can be sent.
+        """
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        """
+        Returns counters of the bucket.
+
+        Returns:
+            dict: The number of requests, the number of delayed requests, the total and the longest waiting time.
+        """
+        return {
+            "requests": self.requests,
+            "delayed": self.delayed,
+            "wait_time": self.wait_time,
+            "max_wait": self.max_wait,
+        }
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket in shared memory, used by several processes with the same `application_id`.
+
+    The rate, the state and the counters are kept in a `multiprocessing` array under a process lock, so the bucket must be 
+    passed to the processes when they are created, such as in the `initargs` of a `multiprocessing.Pool`.
+    """
+    _TOKENS, _UPDATED, _REQUESTS, _DELAYED, _WAIT_TIME, _MAX_WAIT, _RATE = range(7)
+
+    def __init__(self, rate: float, burst: int = 1, context: Any = None) -> None:
+        """
+        Initializes the bucket.
+
+        Args:
+            rate (float): The number of requests allowed per second.
+            burst (int, optional): The number of requests that can be sent at once after a pause (default is 1).
+            context (Any, optional): The `multiprocessing` context of the processes (default is the default context).
+        """
+        context = context if context is not None else multiprocessing.get_context()
+        self.burst = burst
+        self._state = context.RawArray("d", [float(burst), time.monotonic(), 0, 0, 0.0, 0.0, float(rate)])
+        self._lock = context.Lock()
+
+    def __str__(self) -> str:
+        return f"SharedTokenBucket(rate={self.rate}, burst={self.burst})"
+
+    def reserve(self) -> float:
+        """
+        Reserves one token.
+
+        Returns:
+            float: Seconds to wait before the request can be sent.
+        """
+        state = self._state
+        with self._lock:
+            now, rate = time.monotonic(), state[self._RATE]
+            tokens = min(self.burst, state[self._TOKENS] + (now - state[self._UPDATED]) * rate) - 1
+            state[self._TOKENS] = tokens
+            state[self._UPDATED] = now
+            delay = -tokens / rate if tokens < 0 else 0.0
+
+            state[self._REQUESTS] += 1
+            if delay:
+                state[self._DELAYED] += 1
+                state[self._WAIT_TIME] += delay
+                state[self._MAX_WAIT] = max(state[self._MAX_WAIT], delay)
+            return delay
+
+    def setRate(self, rate: float) -> None:
+        """
+        Changes the number of requests allowed per second in all processes. The tokens collected so far are kept.
+
+        Args:
+            rate (float): The new number of requests per second.
+        """
+        state = self._state
+        with self._lock:
+            now = time.monotonic()
+            state[self._TOKENS] = min(self.burst, state[self._TOKENS] + (now - state[self._UPDATED]) * state[self._RATE])
+            state[self._UPDATED] = now
+            state[self._RATE] = rate
+
+    @property
+    def rate(self) -> float:
+        return self._state[self._RATE]
+
+    @property
+    def requests(self) -> int:
+        return int(self._state[self._REQUESTS])
+
+    @property
+    def delayed(self) -> int:
+        return int(self._state[self._DELAYED])
+
+    @property
+    def wait_time(self) -> float:
+        return self._state[self._WAIT_TIME]
+
+    @property
+    def max_wait(self) -> float:
+        return self._state[self._MAX_WAIT]
+
+
+class AdaptiveConcurrency:
+    """
+    Adaptive limit of requests in flight of `AsyncApp` (additive increase, multiplicative decrease).
+
+    While the responses are successful and fast, the limit grows by `increase` per round trip in which it was 
+    reached. When a request is overloaded (a transient API error of `Constants.RETRYERRORS`, the HTTP status 429 
+    or 5xx, or an exception) or the smoothed latency exceeds `tolerance` times the lowest latency, the limit is 
+    multiplied by `backoff`. Requests sent before the last decrease do not decrease the limit again.
+
+    Attributes:
+        limit (float): The current limit, requests wait while `in_flight` reaches it.
+        min_limit (int): The lowest limit.
+        max_limit (int): The highest limit.
+        increase (float): The growth of the limit per round trip.
+        backoff (float): The factor of the limit on overload.
+        tolerance (float): The allowed ratio of the smoothed latency to the lowest latency.
+        in_flight (int): The number of requests in flight.
+        latency (float | None): The smoothed latency in seconds.
+        min_latency (float | None): The lowest latency in seconds, slowly rising to follow changes of the network.
+        decisions (deque[tuple[float, str, str, int]]): Recent changes of the limit: the `time.time()`, `increase` 
+            or `decrease`, the reason and the new limit.
+    """
+    SMOOTHING = 0.1
+    """The weight of the latest latency in the smoothed latency"""
+    MIN_LATENCY_DRIFT = 0.001
+    """The relative growth of the lowest latency per response"""
+
+    def __init__(self, 
+            initial: int = 8, 
+            min_limit: int = 1, 
+            max_limit: int = 256, 
+            increase: float = 1.0, 
+            backoff: float = 0.5, 
+            tolerance: float = 2.0,
+            history: int = 100
+        ) -> None:
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.in_flight = 0
+        self.latency = None
+        self.min_latency = None
+        self.decisions: deque[tuple[float, str, str, int]] = deque(maxlen=history)
+        self.increases = 0
+        self.decreases = 0
+
+        self._decreased_at = 0.0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    def __str__(self) -> str:
+        return f"AdaptiveConcurrency(limit={int(self.limit)}, in_flight={self.in_flight})"
+
+    async def acquire(self) -> None:
+        """
+        Suspends the current coroutine while the limit of requests in flight is reached.
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over to the cancelled request
+                self.in_flight -= 1
+                self._wakeUp()
+            raise
+
+    def release(self, started: float, overloaded: bool | None) -> None:
+        """
+        Releases the slot of a request and adjusts the limit.
+
+        Args:
+            started (float): The `time.monotonic()` when the request was sent.
+            overloaded (bool | None): Whether the request was overloaded, `None` if the request was cancelled.
+        """
+        saturated = self.in_flight >= int(self.limit)
+        self.in_flight -= 1
+        if overloaded is not None:
+            self._adjust(started, time.monotonic() - started, overloaded, saturated)
+        self._wakeUp()
+
+    def _adjust(self, started: float, latency: float, overloaded: bool, saturated: bool) -> None:
+        self.min_latency = latency if self.min_latency is None else min(latency, self.min_latency * (1 + self.MIN_LATENCY_DRIFT))
+        self.latency = latency if self.latency is None else self.latency + self.SMOOTHING * (latency - self.latency)
+
+        if overloaded:
+            reason = "overloaded"
+        elif self.latency > self.min_latency * self.tolerance:
+            reason = "latency"
+        else:
+            reason = None
+
+        if reason is not None:
+            if started >= self._decreased_at and self.limit > self.min_limit:
+                self._decreased_at = time.monotonic()
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self.decreases += 1
+                self.decisions.append((time.time(), "decrease", reason, int(self.limit)))
+        elif saturated and self.limit < self.max_limit:
+            previous = int(self.limit)
+            self.limit = min(float(self.max_limit), self.limit + self.increase / self.limit)
+            if int(self.limit) > previous:
+                self.increases += 1
+                self.decisions.append((time.time(), "increase", "healthy", int(self.limit)))
+
+    def _wakeUp(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def stats(self) -> dict:
+        """
+        Returns the state of the limit.
+
+        Returns:
+            dict: The current limit, requests in flight and waiting, the smoothed and the lowest latency, the numbers of increases and decreases.
+        """
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "latency": self.latency,
+            "min_latency": self.min_latency,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+_limiters: dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def getLimiter(application_id: str, rate: float, update: bool = False) -> TokenBucket:
+    """
+    Returns the bucket shared by all applications with the same `application_id`, creating it on first use.
+
+    Args:
+        application_id (str): The application ID for API access.
+        rate (float): The number of requests allowed per second.
+        update (bool, optional): Change the rate of an existing bucket, used when the rate is set explicitly (default is False).
+
+    Returns:
+        TokenBucket: The shared bucket.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(application_id)
+        if limiter is None:
+            limiter = _limiters[application_id] = TokenBucket(rate)
+        elif update and limiter.rate != rate:
+            limiter.setRate(rate)
+        return limiter
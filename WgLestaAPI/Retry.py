@@ -0,0 +1,216 @@
+"""
+Retries of failed API requests for the WgLestaAPI library
+"""
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable
+import asyncio
+import random
+import threading
+import time
+
+from . import Constants
+from . import Transport
+
+
+class RetryPolicy:
+    """
+    Retries of requests that failed for a transient reason with exponential backoff and full jitter.
+
+    A request is retried when the API returns `status: error` with one of `error_messages`, when the HTTP status 
+    is one of `statuses` or when the connection fails. The retries are limited by the number of attempts, by the 
+    deadline of one call and by the retry budget shared by all calls of the policy: every call deposits `budget` 
+    tokens and every retry withdraws one, so retries can not multiply the load when the API is down.
+
+    A response with the `Retry-After` header, such as `429 Too Many Requests`, is retried no earlier than the header 
+    asks, and is not retried if that time is beyond the deadline.
+
+    Attributes:
+        attempts (int): The maximum number of attempts of one call, including the first one.
+        backoff (float): The base delay in seconds before the first retry, doubled for every next retry.
+        max_backoff (float): The maximum delay in seconds before one retry.
+        deadline (float | None): The maximum time in seconds spent on one call including delays, `None` means no deadline.
+        budget (float): Retry tokens deposited by every call.
+        reserve (int): The maximum number of retry tokens, the budget starts full.
+        error_messages (tuple[str, ...]): API errors that are retried.
+        statuses (tuple[int, ...]): HTTP statuses that are retried.
+        retries (int): The total number of retries made.
+        exhausted (int): The number of retries refused by the budget.
+    """
+    def __init__(self, 
+            attempts: int = 4, 
+            backoff: float = 0.5, 
+            max_backoff: float = 10.0, 
+            deadline: float | None = 30.0, 
+            budget: float = 0.2, 
+            reserve: int = 10, 
+            error_messages: tuple[str, ...] = Constants.RETRYERRORS, 
+            statuses: tuple[int, ...] = (429, 500, 502, 503, 504)
+        ) -> None:
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.budget = budget
+        self.reserve = reserve
+        self.error_messages = error_messages
+        self.statuses = statuses
+        self.retries = 0
+        self.exhausted = 0
+
+        self._tokens = float(reserve)
+        self._lock = threading.Lock()
+
+    @property
+    def exceptions(self) -> tuple[type[BaseException], ...]:
+        """Exceptions of failed connections that are retried"""
+        return Transport.transportErrors()
+
+    def __str__(self) -> str:
+        return f"RetryPolicy(attempts={self.attempts}, backoff={self.backoff})"
+
+    def isRetryable(self, result: Any = None, exc: BaseException | None = None) -> bool:
+        """
+        Checks whether the result of one attempt must be retried.
+
+        Args:
+            result (Any, optional): The decoded response, the typed model or the raw HTTP response.
+            exc (BaseException | None, optional): The exception raised by the attempt.
+
+        Returns:
+            bool: `True` for transient errors.
+        """
+        if exc is not None:
+            return isinstance(exc, self.exceptions)
+        if isinstance(result, dict):
+            status, error = result.get("status"), result.get("error")
+        else:
+            status, error = getattr(result, "status", None), getattr(result, "error", None)
+        if isinstance(status, int):
+            return status in self.statuses
+        return status == "error" and isinstance(error, dict) and error.get("message") in self.error_messages
+
+    def getRetryAfter(self, result: Any) -> float | None:
+        """
+        Returns the delay asked by the `Retry-After` header of the raw HTTP response.
+
+        Args:
+            result (Any): The result of the failed attempt.
+
+        Returns:
+            float | None: Seconds to wait or `None` if there is no valid header.
+        """
+        headers = getattr(result, "headers", None)
+        value = headers.get("Retry-After") if headers is not None else None
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+    def getDelay(self, attempt: int, started: float, result: Any = None) -> float | None:
+        """
+        Returns the delay before the next retry and withdraws a retry token.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting from 1.
+            started (float): The `time.monotonic()` of the first attempt.
+            result (Any, optional): The result of the failed attempt, its `Retry-After` header is the lowest delay.
+
+        Returns:
+            float | None: Seconds to wait or `None` if the call must not be retried.
+        """
+        if attempt >= self.attempts:
+            return None
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+        retry_after = self.getRetryAfter(result) if result is not None else None
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if self.deadline is not None and time.monotonic() - started + delay > self.deadline:
+            return None
+        with self._lock:
+            if self._tokens < 1:
+                self.exhausted += 1
+                return None
+            self._tokens -= 1
+            self.retries += 1
+        return delay
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.reserve, self._tokens + self.budget)
+
+    def execute(self, send: Callable[[], Any], on_retry: Callable[[int, float, Any, BaseException | None], None] | None = None) -> Any:
+        """
+        Calls `send` and retries it while the result is a transient error.
+
+        Args:
+            send (Callable[[], Any]): The function that makes one attempt.
+            on_retry (Callable[[int, float, Any, BaseException | None], None] | None, optional): Called with the number of the failed attempt, the delay, the result and the exception before every retry.
+
+        Returns:
+            Any: The result of the last attempt.
+        """
+        self.deposit()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result, exc = send(), None
+            except Exception as e:
+                result, exc = None, e
+            delay = self.getDelay(attempt, started, result) if self.isRetryable(result, exc) else None
+            if delay is None:
+                if exc is not None:
+                    raise exc
+                return result
+            if on_retry is not None:
+                on_retry(attempt, delay, result, exc)
+            time.sleep(delay)
+
+    async def executeAsync(self, send: Callable[[], Awaitable[Any]], on_retry: Callable[[int, float, Any, BaseException | None], None] | None = None) -> Any:
+        """
+        Awaits `send` and retries it while the result is a transient error.
+
+        Args:
+            send (Callable[[], Awaitable[Any]]): The coroutine function that makes one attempt.
+            on_retry (Callable[[int, float, Any, BaseException | None], None] | None, optional): Called with the number of the failed attempt, the delay, the result and the exception before every retry.
+
+        Returns:
+            Any: The result of the last attempt.
+        """
+        self.deposit()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result, exc = await send(), None
+            except Exception as e:
+                result, exc = None, e
+            delay = self.getDelay(attempt, started, result) if self.isRetryable(result, exc) else None
+            if delay is None:
+                if exc is not None:
+                    raise exc
+                return result
+            if on_retry is not None:
+                on_retry(attempt, delay, result, exc)
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        """
+        Returns counters of the policy.
+
+        Returns:
+            dict: The number of retries, the number of retries refused by the budget and the retry tokens left.
+        """
+        return {
+            "retries": self.retries,
+            "exhausted": self.exhausted,
+            "tokens": self._tokens,
+        }
@@ -0,0 +1,284 @@
+"""
+Local snapshots of encyclopedia methods for the WgLestaAPI library
+
+The records of `encyclopedia.vehicles`, `encyclopedia.modules` and `encyclopedia.achievements` are downloaded once 
+per game version into a sqlite database indexed by tier, nation, type and name, so lookups are answered locally.
+"""
+from typing import Any, Iterable
+import json
+import sqlite3
+import threading
+import time
+
+from . import Constants
+from . import Decoders
+from . import Exceptions
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+FILTERS = ("tier", "nation", "type", "name")
+"""Indexed fields of the records"""
+
+
+def _dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def gameVersion(res: dict | Any) -> str:
+    """Return the version of the game from the response of `encyclopedia.info`
+
+    Raises:
+        Exceptions.ResponseIsNotSuccessful: If the API has not returned the information
+
+    Returns:
+        str: `game_version`, or `tanks_updated_at` for games without the version
+    """
+    if not isinstance(res, dict) or res.get("status") != "ok":
+        raise Exceptions.ResponseIsNotSuccessful(res)
+    data = res.get("data") or {}
+    return str(data.get("game_version") or data.get("tanks_updated_at") or "")
+
+
+class SnapshotStore:
+    """
+    Records of encyclopedia methods kept in a sqlite database, one snapshot per region, game and method. 
+    One database can keep the snapshots of all regions and games.
+
+    Attributes:
+        path (str): The path to the sqlite database file, `:memory:` keeps the records in memory.
+    """
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self.decode = Decoders.getDecoder()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                region TEXT, game TEXT, dataset TEXT, game_version TEXT, updated_at REAL, count INTEGER,
+                PRIMARY KEY (region, game, dataset)
+            );
+            CREATE TABLE IF NOT EXISTS records (
+                region TEXT, game TEXT, dataset TEXT, id TEXT, tier INTEGER, nation TEXT, type TEXT, name TEXT COLLATE NOCASE, data BLOB,
+                PRIMARY KEY (region, game, dataset, id)
+            );
+            CREATE INDEX IF NOT EXISTS records_tier ON records (region, game, dataset, tier);
+            CREATE INDEX IF NOT EXISTS records_nation ON records (region, game, dataset, nation);
+            CREATE INDEX IF NOT EXISTS records_type ON records (region, game, dataset, type);
+            CREATE INDEX IF NOT EXISTS records_name ON records (region, game, dataset, name);
+        """)
+
+    def __str__(self) -> str:
+        return f"SnapshotStore('{self.path}')"
+
+    def version(self, region: str, game_shortname: str, dataset: str) -> str | None:
+        """
+        Returns the game version of the snapshot.
+
+        Args:
+            region (str): The region.
+            game_shortname (str): The short name of the game.
+            dataset (str): The encyclopedia method, such as `encyclopedia.vehicles`.
+
+        Returns:
+            str | None: The version or `None` if there is no snapshot.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT game_version FROM snapshots WHERE region = ? AND game = ? AND dataset = ?", (region, game_shortname, dataset)
+            ).fetchone()
+        return row[0] if row else None
+
+    def replace(self, region: str, game_shortname: str, dataset: str, game_version: str, records: Iterable[tuple[Any, dict]]) -> int:
+        """
+        Replaces the snapshot in one transaction, so readers see either the old or the new records.
+
+        Args:
+            region (str): The region.
+            game_shortname (str): The short name of the game.
+            dataset (str): The encyclopedia method.
+            game_version (str): The game version of the records.
+            records (Iterable[tuple[Any, dict]]): Identifiers and records.
+
+        Returns:
+            int: The number of stored records.
+        """
+        rows = [
+            (region, game_shortname, dataset, str(record_id), record.get("tier"), record.get("nation"), record.get("type"), record.get("name"), _dumps(record))
+            for record_id, record in records
+        ]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM records WHERE region = ? AND game = ? AND dataset = ?", (region, game_shortname, dataset))
+            self._db.executemany("INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._db.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?)", (region, game_shortname, dataset, game_version, time.time(), len(rows))
+            )
+        return len(rows)
+
+    def get(self, region: str, game_shortname: str, dataset: str, record_id: Any) -> dict | None:
+        """
+        Returns the record by its identifier, such as the `tank_id` of a vehicle.
+
+        Returns:
+            dict | None: The record or `None` if there is no such record.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM records WHERE region = ? AND game = ? AND dataset = ? AND id = ?", (region, game_shortname, dataset, str(record_id))
+            ).fetchone()
+        return self.decode(row[0]) if row else None
+
+    def find(self, region: str, game_shortname: str, dataset: str, limit: int | None = None, **filters: Any) -> list[dict]:
+        """
+        Returns the records that match all filters.
+
+        Args:
+            region (str): The region.
+            game_shortname (str): The short name of the game.
+            dataset (str): The encyclopedia method.
+            limit (int | None, optional): The maximum number of records (default is all records).
+            **filters (Any): Values of `tier`, `nation`, `type` or `name` (case-insensitive), a list matches any of its values.
+
+        Raises:
+            TypeError: If a filter is not indexed.
+
+        Returns:
+            list[dict]: The records in the order of the API.
+        """
+        query = "SELECT data FROM records WHERE region = ? AND game = ? AND dataset = ?"
+        params: list = [region, game_shortname, dataset]
+        for field, value in filters.items():
+            if field not in FILTERS:
+                raise TypeError(f"The field \"{field}\" is not indexed. Use one of: {', '.join(FILTERS)}")
+            if value is None:
+                continue
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            query += f" AND {field} IN ({', '.join('?' * len(values))})"
+            params += values
+        query += " ORDER BY rowid"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        return [self.decode(row[0]) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class Snapshots:
+    """
+    Local snapshots of encyclopedia methods of the application. `refresh` downloads the records only when 
+    `encyclopedia.info` reports another game version than the stored snapshot, then `get` and `find` 
+    answer from the local store without requests.
+
+    Attributes:
+        app (Any): The `App` or `AsyncApp` instance.
+        store (SnapshotStore): The storage of the records.
+        datasets (dict[str, str]): Encyclopedia methods and the fields that identify their records.
+        game_version (str | None): The game version of the last refresh.
+    """
+    def __init__(self, app: Any, store: SnapshotStore | None = None, datasets: dict[str, str] = Constants.SNAPSHOTS) -> None:
+        self.app = app
+        self.store = store if store is not None else SnapshotStore()
+        self.datasets = datasets
+        self.game_version = None
+        app.snapshots = self
+
+    def __str__(self) -> str:
+        return f"Snapshots({self.store}, {', '.join(self.datasets)})"
+
+    def _outdated(self, game_version: str, force: bool) -> list[str]:
+        self.game_version = game_version
+        return [
+            dataset for dataset in self.datasets 
+            if force or self.store.version(self.app.region, self.app.game_shortname, dataset) != game_version
+        ]
+
+    def _replace(self, dataset: str, records: Iterable[dict]) -> None:
+        id_field = self.datasets[dataset]
+        self.store.replace(
+            self.app.region, self.app.game_shortname, dataset, self.game_version, 
+            ((record[id_field], record) for record in records)
+        )
+
+    def refresh(self, force: bool = False) -> list[str]:
+        """
+        Downloads the methods whose snapshots are missing or of another game version with the synchronous `App`.
+
+        Args:
+            force (bool, optional): Download all methods regardless of the version (default is False).
+
+        Raises:
+            Exceptions.ResponseIsNotSuccessful: If the API has not returned the version or a page.
+
+        Returns:
+            list[str]: The refreshed methods.
+        """
+        # the cache of the application is bypassed, so the refresh always sees the current data
+        outdated = self._outdated(gameVersion(self.app.execute("encyclopedia.info", cached=False)), force)
+        for dataset in outdated:
+            self._replace(dataset, list(self.app.iterate(dataset, cached=False)))
+        return outdated
+
+    async def refreshAsync(self, force: bool = False) -> list[str]:
+        """
+        Downloads the methods whose snapshots are missing or of another game version with the `AsyncApp`.
+
+        Args:
+            force (bool, optional): Download all methods regardless of the version (default is False).
+
+        Raises:
+            Exceptions.ResponseIsNotSuccessful: If the API has not returned the version or a page.
+
+        Returns:
+            list[str]: The refreshed methods.
+        """
+        outdated = self._outdated(gameVersion(await self.app.execute("encyclopedia.info", cached=False)), force)
+        for dataset in outdated:
+            self._replace(dataset, [record async for record in self.app.iterate(dataset, cached=False)])
+        return outdated
+
+    def get(self, dataset: str, record_id: Any) -> dict | None:
+        """
+        Returns the record of the method by its identifier.
+
+        Args:
+            dataset (str): The encyclopedia method, such as `encyclopedia.vehicles`.
+            record_id (Any): The identifier, such as `tank_id`.
+
+        Returns:
+            dict | None: The record or `None` if there is no such record.
+        """
+        return self.store.get(self.app.region, self.app.game_shortname, dataset, record_id)
+
+    def find(self, dataset: str, limit: int | None = None, **filters: Any) -> list[dict]:
+        """
+        Returns the records of the method that match all filters, such as `find("encyclopedia.vehicles", tier=10, nation="ussr")`.
+
+        Args:
+            dataset (str): The encyclopedia method.
+            limit (int | None, optional): The maximum number of records (default is all records).
+            **filters (Any): Values of `tier`, `nation`, `type` or `name`, a list matches any of its values.
+
+        Returns:
+            list[dict]: The records.
+        """
+        return self.store.find(self.app.region, self.app.game_shortname, dataset, limit, **filters)
+
+    def vehicle(self, tank_id: int) -> dict | None:
+        return self.get("encyclopedia.vehicles", tank_id)
+
+    def vehicles(self, limit: int | None = None, **filters: Any) -> list[dict]:
+        return self.find("encyclopedia.vehicles", limit, **filters)
+
+    def modules(self, limit: int | None = None, **filters: Any) -> list[dict]:
+        return self.find("encyclopedia.modules", limit, **filters)
+
+    def achievements(self, limit: int | None = None, **filters: Any) -> list[dict]:
+        return self.find("encyclopedia.achievements", limit, **filters)
@@ -0,0 +1,386 @@
+"""
+Storage and background prolongation of user access tokens for the WgLestaAPI library
+"""
+from dataclasses import dataclass, replace
+from typing import Any
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+from . import Constants, Decoders, Utils
+
+
+@dataclass(slots=True)
+class Token:
+    account_id: int
+    access_token: str
+    expires_at: int
+    refresh_at: float = 0.0
+    """The time when the token must be prolongated, set by `TokenManager`"""
+
+
+class MemoryTokenStore:
+    """
+    Tokens kept in memory of the process.
+    """
+    def __init__(self) -> None:
+        self._tokens: dict[int, Token] = {}
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        return f"MemoryTokenStore({len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def get(self, account_id: int) -> Token | None:
+        """
+        Returns the token of the account.
+
+        Args:
+            account_id (int): The account ID.
+
+        Returns:
+            Token | None: The token or `None` if the account has no token.
+        """
+        return self._tokens.get(account_id)
+
+    def set(self, token: Token) -> None:
+        with self._lock:
+            self._tokens[token.account_id] = token
+
+    def delete(self, account_id: int) -> None:
+        with self._lock:
+            self._tokens.pop(account_id, None)
+
+    def due(self, now: float, limit: int) -> list[Token]:
+        """
+        Returns the tokens that must be prolongated.
+
+        Args:
+            now (float): The current time.
+            limit (int): The maximum number of tokens.
+
+        Returns:
+            list[Token]: Tokens with `refresh_at` before `now`, the earliest first.
+        """
+        with self._lock:
+            tokens = [token for token in self._tokens.values() if token.refresh_at <= now]
+        tokens.sort(key=lambda token: token.refresh_at)
+        return tokens[:limit]
+
+
+class SqliteTokenStore:
+    """
+    Tokens kept in a sqlite database file, so they survive restarts of the application.
+
+    Attributes:
+        path (str): The path to the sqlite database file.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS tokens (account_id INTEGER PRIMARY KEY, access_token TEXT, expires_at INTEGER, refresh_at REAL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS tokens_refresh_at ON tokens (refresh_at)")
+        self._db.commit()
+
+    def __str__(self) -> str:
+        return f"SqliteTokenStore('{self.path}')"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM tokens").fetchone()[0]
+
+    def get(self, account_id: int) -> Token | None:
+        with self._lock:
+            row = self._db.execute("SELECT * FROM tokens WHERE account_id = ?", (account_id,)).fetchone()
+        return Token(*row) if row else None
+
+    def set(self, token: Token) -> None:
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO tokens VALUES (?, ?, ?, ?)", (token.account_id, token.access_token, token.expires_at, token.refresh_at))
+            self._db.commit()
+
+    def delete(self, account_id: int) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM tokens WHERE account_id = ?", (account_id,))
+            self._db.commit()
+
+    def due(self, now: float, limit: int) -> list[Token]:
+        with self._lock:
+            rows = self._db.execute("SELECT * FROM tokens WHERE refresh_at <= ? ORDER BY refresh_at LIMIT ?", (now, limit)).fetchall()
+        return [Token(*row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class RedisTokenStore:
+    """
+    Tokens kept in Redis, shared by several processes. Works with any client that has the `hget`, `hset`, `hdel`,
+    `hlen`, `zadd`, `zrem` and `zrangebyscore` methods of `redis.Redis`.
+
+    Attributes:
+        client (Any): The Redis client.
+        prefix (str): The prefix of the keys.
+    """
+    def __init__(self, client: Any, prefix: str = "wglestaapi:tokens") -> None:
+        self.client = client
+        self.prefix = prefix
+        self._tokens = f"{prefix}:data"
+        self._schedule = f"{prefix}:refresh_at"
+
+    def __str__(self) -> str:
+        return f"RedisTokenStore('{self.prefix}')"
+
+    def __len__(self) -> int:
+        return self.client.hlen(self._tokens)
+
+    def get(self, account_id: int) -> Token | None:
+        value = self.client.hget(self._tokens, str(account_id))
+        return Token(**json.loads(value)) if value else None
+
+    def set(self, token: Token) -> None:
+        value = json.dumps({"account_id": token.account_id, "access_token": token.access_token, "expires_at": token.expires_at, "refresh_at": token.refresh_at})
+        self.client.hset(self._tokens, str(token.account_id), value)
+        self.client.zadd(self._schedule, {str(token.account_id): token.refresh_at})
+
+    def delete(self, account_id: int) -> None:
+        self.client.hdel(self._tokens, str(account_id))
+        self.client.zrem(self._schedule, str(account_id))
+
+    def due(self, now: float, limit: int) -> list[Token]:
+        account_ids = self.client.zrangebyscore(self._schedule, "-inf", now, start=0, num=limit)
+        return [token for account_id in account_ids if (token := self.get(int(account_id))) is not None]
+
+
+class TokenManager:
+    """
+    Keeps `access_token`s of many accounts, adds the token of the account to the requests of the application
+    and prolongates the tokens in the background before they expire.
+
+    A request gets the token when it has one `account_id` and no `access_token`. Every token is prolongated
+    `refresh_before` seconds before `expires_at` minus a fixed offset of the account within `spread` seconds, so
+    tokens received at the same time are not prolongated at the same time, but not earlier than one `interval` after 
+    the token is stored. Every sweep prolongates at most `batch_size` tokens, and the requests are limited by the limit 
+    of requests per second of the application. Responses of `auth.prolongate` are decoded as JSON regardless of the 
+    `decoder` of the application.
+
+    Attributes:
+        app (Any): The `App` or `AsyncApp` instance.
+        store (Any): The storage of tokens: `MemoryTokenStore`, `SqliteTokenStore`, `RedisTokenStore` or your own with the same methods.
+        refresh_before (float): Seconds before `expires_at` to prolongate the token.
+        spread (float): Seconds the prolongation of tokens with the same `expires_at` is spread over.
+        interval (float): Seconds between sweeps.
+        batch_size (int): The maximum number of tokens prolongated by one sweep.
+        expires_at (int | None): The `expires_at` parameter of `auth.prolongate`, `None` uses the default of API.
+        prolongated (int): The number of prolongated tokens.
+        failed (int): The number of tokens that could not be prolongated and were removed.
+        errors (int): The number of background sweeps that failed, such as on a lost connection to the store.
+    """
+    def __init__(self,
+            app: Any,
+            store: Any = None,
+            refresh_before: float = 86400.0,
+            spread: float = 3600.0,
+            interval: float = 60.0,
+            batch_size: int = 50,
+            expires_at: int | None = None
+        ) -> None:
+        self.app = app
+        self.store = store if store is not None else MemoryTokenStore()
+        self.refresh_before = refresh_before
+        self.spread = spread
+        self.interval = interval
+        self.batch_size = batch_size
+        self.expires_at = expires_at
+        self.prolongated = 0
+        self.failed = 0
+        self.errors = 0
+
+        self._decode = Decoders.getDecoder()
+        self._thread: threading.Thread | None = None
+        self._task: asyncio.Task | None = None
+        self._stopped = threading.Event()
+        app.tokens = self
+
+    def __str__(self) -> str:
+        return f"TokenManager({self.store})"
+
+    def add(self, account_id: int, access_token: str, expires_at: int) -> Token:
+        """
+        Stores the token of the account, such as the one received after `auth.login`.
+
+        Args:
+            account_id (int): The account ID.
+            access_token (str): The access token.
+            expires_at (int): The UNIX time when the token expires.
+
+        Returns:
+            Token: The stored token.
+        """
+        offset = zlib.crc32(str(account_id).encode()) % int(self.spread) if self.spread >= 1 else 0
+        # a token that expires within `refresh_before` waits one interval, so it is not prolongated by every sweep
+        refresh_at = max(expires_at - self.refresh_before - offset, time.time() + self.interval)
+        token = Token(int(account_id), access_token, int(expires_at), refresh_at)
+        self.store.set(token)
+        return token
+
+    def remove(self, account_id: int) -> None:
+        self.store.delete(int(account_id))
+
+    def getToken(self, account_id: int) -> str | None:
+        """
+        Returns the valid token of the account.
+
+        Args:
+            account_id (int): The account ID.
+
+        Returns:
+            str | None: The access token or `None` if the account has no valid token.
+        """
+        token = self.store.get(int(account_id))
+        return token.access_token if token is not None and token.expires_at > time.time() else None
+
+    def inject(self, api_method: str, params: dict) -> dict:
+        """
+        Returns the query parameters with the `access_token` of the account, if the request is for one account.
+
+        Args:
+            api_method (str): The API method.
+            params (dict): The query parameters.
+
+        Returns:
+            dict: The same parameters or a copy with the `access_token`.
+        """
+        account_id = params.get("account_id")
+        if "access_token" in params or account_id is None or api_method.startswith("auth."):
+            return params
+        if isinstance(account_id, str):
+            if not account_id.isdigit():
+                return params
+        elif not isinstance(account_id, int):
+            return params
+        access_token = self.getToken(int(account_id))
+        return params if access_token is None else {**params, "access_token": access_token}
+
+    def _params(self, token: Token) -> dict:
+        params = {"access_token": token.access_token}
+        if self.expires_at is not None:
+            params["expires_at"] = self.expires_at
+        return params
+
+    def _request(self, token: Token) -> tuple[str, str, bytes | None]:
+        # auth.* methods are served by the API of World of Tanks for applications of every game, see `urlProlongate`
+        return Utils.buildRequest(self.app, "auth.prolongate", Constants.TYPEREQUESTS.POST, self._params(token), Utils.authBaseUrl(self.app))
+
+    def _prolongate(self, token: Token) -> Any:
+        type_request, api_url, body = self._request(token)
+        return Utils.requestSync(self.app, "auth.prolongate", type_request, api_url, self._decode, body)
+
+    async def _prolongateAsync(self, token: Token) -> Any:
+        type_request, api_url, body = self._request(token)
+        return await Utils.requestAsync(self.app, "auth.prolongate", type_request, api_url, self._decode, body)
+
+    def _store(self, token: Token, res: Any) -> None:
+        if isinstance(res, dict) and res.get("status") == "ok":
+            data = res["data"]
+            self.add(token.account_id, data["access_token"], data["expires_at"])
+            self.prolongated += 1
+        elif isinstance(res, dict) and (res.get("error") or {}).get("message") not in Constants.RETRYERRORS:
+            self.remove(token.account_id)
+            self.failed += 1
+        else:
+            # transient errors postpone the token to the next sweep
+            self.store.set(replace(token, refresh_at=time.time() + self.interval))
+
+    def sweep(self) -> int:
+        """
+        Prolongates the tokens that are due with the synchronous `App`.
+
+        Returns:
+            int: The number of tokens sent to `auth.prolongate`.
+        """
+        tokens = self.store.due(time.time(), self.batch_size)
+        for token in tokens:
+            try:
+                res = self._prolongate(token)
+            except Exception as e:
+                res = e
+            self._store(token, res)
+        return len(tokens)
+
+    async def sweepAsync(self) -> int:
+        """
+        Prolongates the tokens that are due concurrently with the `AsyncApp`.
+
+        Returns:
+            int: The number of tokens sent to `auth.prolongate`.
+        """
+        tokens = self.store.due(time.time(), self.batch_size)
+        results = await asyncio.gather(
+            *[self._prolongateAsync(token) for token in tokens],
+            return_exceptions=True
+        )
+        for token, res in zip(tokens, results):
+            self._store(token, res)
+        return len(tokens)
+
+    def start(self) -> None:
+        """
+        Starts the background sweeps: a daemon thread for `App` or a task of the running event loop for `AsyncApp`.
+        """
+        self._stopped.clear()
+        if self.app.method_execution == Constants.METHODEXECUTION.ASYNC:
+            self._task = asyncio.ensure_future(self._runAsync())
+        else:
+            self._thread = threading.Thread(target=self._run, name="WgLestaAPI-TokenManager", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background sweeps.
+        """
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                swept = self.sweep()
+            except Exception:
+                # an error of one sweep must not stop the prolongation, the next sweep tries again
+                self.errors += 1
+                swept = 0
+            # a full batch means more tokens are due, so the next sweep starts at once
+            if swept < self.batch_size:
+                self._stopped.wait(self.interval)
+
+    async def _runAsync(self) -> None:
+        while True:
+            try:
+                swept = await self.sweepAsync()
+            except Exception:
+                self.errors += 1
+                swept = 0
+            if swept < self.batch_size:
+                await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        """
+        Returns counters of the manager.
+
+        Returns:
+            dict: The number of stored, prolongated and failed tokens and failed sweeps.
+        """
+        return {"tokens": len(self.store), "prolongated": self.prolongated, "failed": self.failed, "errors": self.errors}
@@ -0,0 +1,440 @@
+"""
+HTTP transports of the WgLestaAPI library
+
+`urllib3`, `aiohttp` and `httpx` are imported by the transports that use them, so a synchronous application 
+never imports `aiohttp`.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+import asyncio
+import importlib.util
+import sys
+import time
+
+from . import Constants
+from . import Exceptions
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+def supportedEncodings() -> tuple[str, ...]:
+    """Return the content encodings that can be decoded by the installed packages
+
+    Returns:
+        tuple[str, ...]: `gzip` and `deflate`, and `br` if `brotli` or `brotlicffi` is installed
+    """
+    encodings = ("gzip", "deflate")
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        encodings += ("br",)
+    return encodings
+
+
+def transportErrors() -> tuple[type[BaseException], ...]:
+    """Return the exceptions of the HTTP clients that mean a failed connection, for the clients that are imported
+
+    Returns:
+        tuple[type[BaseException], ...]: Classes of exceptions
+    """
+    errors: tuple[type[BaseException], ...] = (ConnectionError, asyncio.TimeoutError)
+    if "urllib3" in sys.modules:
+        errors += (sys.modules["urllib3"].exceptions.HTTPError,)
+    if "aiohttp" in sys.modules:
+        errors += (sys.modules["aiohttp"].ClientError,)
+    return errors
+
+
+class TransportConfig:
+    """
+    Settings of the HTTP connections shared by `App` and `AsyncApp`.
+
+    Responses of the API are compressed very well, so compression is requested for every content encoding that can
+    be decoded. The connections are kept alive and reused by the pool of every host. With `http2` the requests are
+    sent by `httpx` with HTTP/2, where all requests to one host are multiplexed over one connection.
+
+    Attributes:
+        accept_encoding (tuple[str, ...]): Content encodings requested from the API, an empty tuple disables compression.
+        connect_timeout (float | None): Seconds to establish a connection, `None` means no timeout.
+        read_timeout (float | None): Seconds to wait for the data of a response, `None` means no timeout.
+        pool_size (int): The number of pooled connections to one host.
+        pool_block (bool): Wait for a free connection when all connections to the host are busy instead of opening a new one (synchronous requests only).
+        limit (int): The total number of simultaneous connections, `0` means no limit (asynchronous and HTTP/2 requests only).
+        keepalive_timeout (float | None): Seconds to keep an idle connection alive for reuse (asynchronous and HTTP/2 requests only).
+        ttl_dns_cache (int | None): Seconds to cache resolved DNS records, `None` caches them forever (asynchronous requests only).
+        http2 (bool): Send requests with HTTP/2, requires the `httpx[http2]` package.
+    """
+    def __init__(self,
+            accept_encoding: tuple[str, ...] | None = None,
+            connect_timeout: float | None = 10.0,
+            read_timeout: float | None = 60.0,
+            pool_size: int = 10,
+            pool_block: bool = False,
+            limit: int = 100,
+            keepalive_timeout: float | None = 30.0,
+            ttl_dns_cache: int | None = 300,
+            http2: bool = False
+        ) -> None:
+        self.accept_encoding = supportedEncodings() if accept_encoding is None else tuple(accept_encoding)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_size = pool_size
+        self.pool_block = pool_block
+        self.limit = limit
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.http2 = http2
+
+    def __str__(self) -> str:
+        return f"TransportConfig(pool_size={self.pool_size}, http2={self.http2})"
+
+    def headers(self) -> dict[str, str]:
+        """
+        Returns the headers sent with every request.
+
+        Returns:
+            dict[str, str]: The `Accept-Encoding` header, or no headers if compression is disabled.
+        """
+        return {"Accept-Encoding": ", ".join(self.accept_encoding)} if self.accept_encoding else {}
+
+
+class Response:
+    """
+    The HTTP response returned by every transport.
+
+    Attributes:
+        status (int): The HTTP status.
+        headers (Any): The headers of the response.
+        body (bytes): The decompressed body of the response.
+        raw (Any): The response of the underlying HTTP client.
+    """
+    __slots__ = ("status", "headers", "body", "raw")
+
+    def __init__(self, status: int, headers: Any, body: bytes, raw: Any = None) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.raw = self if raw is None else raw
+
+
+class BaseTransport:
+    """
+    The interface of synchronous transports. Pass an instance of a subclass as `transport` of `App` to send 
+    the requests with another HTTP client.
+    """
+    def request(self, type_request: Constants.TYPEREQUESTS, url: str, headers: dict | None = None, body: bytes | None = None) -> Response:
+        """
+        Sends a request.
+
+        Args:
+            type_request (Constants.TYPEREQUESTS): The type of HTTP request.
+            url (str): The URL of the request.
+            headers (dict | None, optional): Additional headers of the request.
+            body (bytes | None, optional): The form-encoded body of a `POST` request.
+
+        Returns:
+            Response: The response.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+
+
+class BaseAsyncTransport:
+    """
+    The interface of asynchronous transports. Pass an instance of a subclass as `transport` of `AsyncApp` to send 
+    the requests with another HTTP client.
+    """
+    async def request(self, type_request: Constants.TYPEREQUESTS, url: str, headers: dict | None = None, body: bytes | None = None) -> Response:
+        """
+        Sends a request.
+
+        Args:
+            type_request (Constants.TYPEREQUESTS): The type of HTTP request.
+            url (str): The URL of the request.
+            headers (dict | None, optional): Additional headers of the request.
+            body (bytes | None, optional): The form-encoded body of a `POST` request.
+
+        Returns:
+            Response: The response.
+        """
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+
+
+class Urllib3Transport(BaseTransport):
+    """
+    Synchronous requests with a `urllib3.PoolManager`. Idle connections are kept alive until the server closes them.
+    """
+    def __init__(self, config: TransportConfig) -> None:
+        import urllib3
+
+        self.config = config
+        self.http = urllib3.PoolManager(
+            maxsize=config.pool_size,
+            block=config.pool_block,
+            headers=config.headers(),
+            timeout=urllib3.Timeout(connect=config.connect_timeout, read=config.read_timeout),
+        )
+
+    def request(self, type_request: Constants.TYPEREQUESTS, url: str, headers: dict | None = None, body: bytes | None = None) -> Response:
+        """
+        Sends a request.
+
+        Args:
+            type_request (Constants.TYPEREQUESTS): The type of HTTP request.
+            url (str): The URL of the request.
+            headers (dict | None, optional): Additional headers of the request.
+            body (bytes | None, optional): The form-encoded body of a `POST` request.
+
+        Returns:
+            Response: The response.
+        """
+        res = self.http.request(type_request, url, body=body, headers=self._headers(headers))
+        return Response(res.status, res.headers, res.data, res)
+
+    def _headers(self, headers: dict | None) -> dict | None:
+        # urllib3 replaces the default headers of the pool with the headers of the request
+        return {**self.http.headers, **headers} if headers else None
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        self.http.clear()
+
+
+class AiohttpTransport(BaseAsyncTransport):
+    """
+    Asynchronous requests with one long-lived `aiohttp.ClientSession`, created on the first request.
+
+    The session and its connections belong to the event loop they were created in, so the session is created 
+    again in every new event loop, such as in every `asyncio.run` with the same application.
+    """
+    def __init__(self, config: TransportConfig, session: aiohttp.ClientSession | None = None) -> None:
+        self.config = config
+        self.session = session
+        self.own_session = session is None
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def getSession(self) -> aiohttp.ClientSession:
+        """
+        Returns the HTTP session, creating it on first use, after it was closed or in another event loop.
+
+        Returns:
+            aiohttp.ClientSession: The session used for all requests of the transport.
+        """
+        loop = asyncio.get_running_loop()
+        if self.own_session and self.session is not None and self._loop is not loop:
+            self._release()
+        if self.session is None or self.session.closed:
+            import aiohttp
+
+            self.own_session = True
+            connector = aiohttp.TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.config.pool_size,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=self.config.ttl_dns_cache,
+            )
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.config.connect_timeout, sock_read=self.config.read_timeout)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.config.headers())
+            self._loop = loop
+        return self.session
+
+    def _release(self) -> None:
+        # the session of another event loop can not be awaited here: a running loop closes it itself, 
+        # and the connections of a stopped loop are dropped without waiting
+        session, loop = self.session, self._loop
+        self.session, self._loop = None, None
+        if session.closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            connector._close()
+
+    async def request(self, type_request: Constants.TYPEREQUESTS, url: str, headers: dict | None = None, body: bytes | None = None) -> Response:
+        """
+        Sends a request.
+
+        Args:
+            type_request (Constants.TYPEREQUESTS): The type of HTTP request.
+            url (str): The URL of the request.
+            headers (dict | None, optional): Additional headers of the request.
+            body (bytes | None, optional): The form-encoded body of a `POST` request.
+
+        Returns:
+            Response: The response.
+        """
+        async with self.getSession().request(type_request, url, headers=headers, data=body) as response:
+            return Response(response.status, response.headers, await response.read(), response)
+
+    async def aclose(self) -> None:
+        """
+        Closes the HTTP session and all of its pooled connections, unless the session is external.
+        """
+        if self.own_session and self.session is not None and not self.session.closed:
+            if self._loop is asyncio.get_running_loop():
+                await self.session.close()
+            else:
+                self._release()
+        self.session, self._loop = None, None
+
+
+def _httpx() -> Any:
+    try:
+        import httpx
+    except ImportError:
+        raise Exceptions.PackageIsNotInstalled("httpx[http2]", "HTTP/2")
+    return httpx
+
+
+def _httpxOptions(httpx: Any, config: TransportConfig) -> dict:
+    return dict(
+        http2=True,
+        headers=config.headers(),
+        timeout=httpx.Timeout(config.read_timeout, connect=config.connect_timeout),
+        limits=httpx.Limits(
+            max_connections=config.limit or None,
+            max_keepalive_connections=config.pool_size,
+            keepalive_expiry=config.keepalive_timeout
+        ),
+    )
+
+
+class HttpxTransport(BaseTransport):
+    """
+    Synchronous HTTP/2 requests with a `httpx.Client`. Connection errors are raised as `ConnectionError` and `TimeoutError`.
+    """
+    def __init__(self, config: TransportConfig) -> None:
+        self.config = config
+        self.httpx = _httpx()
+        self.client = self.httpx.Client(**_httpxOptions(self.httpx, config))
+
+    def request(self, type_request: Constants.TYPEREQUESTS, url: str, headers: dict | None = None, body: bytes | None = None) -> Response:
+        """
+        Sends a request.
+
+        Args:
+            type_request (Constants.TYPEREQUESTS): The type of HTTP request.
+            url (str): The URL of the request.
+            headers (dict | None, optional): Additional headers of the request.
+            body (bytes | None, optional): The form-encoded body of a `POST` request.
+
+        Returns:
+            Response: The response.
+        """
+        try:
+            res = self.client.request(type_request, url, headers=headers, content=body)
+        except self.httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except self.httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        return Response(res.status_code, res.headers, res.content, res)
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        self.client.close()
+
+
+class HttpxAsyncTransport(BaseAsyncTransport):
+    """
+    Asynchronous HTTP/2 requests with a `httpx.AsyncClient`. Connection errors are raised as `ConnectionError` and `TimeoutError`.
+    """
+    def __init__(self, config: TransportConfig) -> None:
+        self.config = config
+        self.httpx = _httpx()
+        self.client = None
+
+    async def request(self, type_request: Constants.TYPEREQUESTS, url: str, headers: dict | None = None, body: bytes | None = None) -> Response:
+        """
+        Sends a request.
+
+        Args:
+            type_request (Constants.TYPEREQUESTS): The type of HTTP request.
+            url (str): The URL of the request.
+            headers (dict | None, optional): Additional headers of the request.
+            body (bytes | None, optional): The form-encoded body of a `POST` request.
+
+        Returns:
+            Response: The response.
+        """
+        if self.client is None or self.client.is_closed:
+            self.client = self.httpx.AsyncClient(**_httpxOptions(self.httpx, self.config))
+        try:
+            res = await self.client.request(type_request, url, headers=headers, content=body)
+        except self.httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except self.httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        return Response(res.status_code, res.headers, res.content, res)
+
+    async def aclose(self) -> None:
+        """
+        Closes the client and all of its connections.
+        """
+        if self.client is not None:
+            await self.client.aclose()
+        self.client = None
+
+
+class MockTransport(BaseTransport):
+    """
+    Synchronous in-process requests to a fake API without sockets, see `FakeApi.FakeApi`.
+    """
+    def __init__(self, api: Any) -> None:
+        self.api = api
+
+    def request(self, type_request: Constants.TYPEREQUESTS, url: str, headers: dict | None = None, body: bytes | None = None) -> Response:
+        delay = self.api.sampleLatency()
+        if delay:
+            time.sleep(delay)
+        return self.api.respond(type_request, url, body)
+
+
+class AsyncMockTransport(BaseAsyncTransport):
+    """
+    Asynchronous in-process requests to a fake API without sockets, see `FakeApi.FakeApi`.
+    """
+    def __init__(self, api: Any) -> None:
+        self.api = api
+
+    async def request(self, type_request: Constants.TYPEREQUESTS, url: str, headers: dict | None = None, body: bytes | None = None) -> Response:
+        delay = self.api.sampleLatency()
+        if delay:
+            await asyncio.sleep(delay)
+        return self.api.respond(type_request, url, body)
+
+
+def createTransport(
+        transport: TransportConfig | BaseTransport | BaseAsyncTransport, 
+        method_execution: Constants.METHODEXECUTION
+    ) -> BaseTransport | BaseAsyncTransport:
+    """Return the transport for the settings and the type of the application
+
+    Args:
+        transport (TransportConfig | BaseTransport | BaseAsyncTransport): The settings of the connections or a ready transport, which is returned as is.
+        method_execution (Constants.METHODEXECUTION): The type of the application.
+
+    Returns:
+        BaseTransport | BaseAsyncTransport: `Urllib3Transport` or `AiohttpTransport`, or `HttpxTransport` or `HttpxAsyncTransport` with HTTP/2.
+    """
+    if not isinstance(transport, TransportConfig):
+        return transport
+    config = transport
+    if method_execution == Constants.METHODEXECUTION.ASYNC:
+        return HttpxAsyncTransport(config) if config.http2 else AiohttpTransport(config)
+    return HttpxTransport(config) if config.http2 else Urllib3Transport(config)
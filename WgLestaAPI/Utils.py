@@ -1,10 +1,20 @@
-from typing import Any, Callable
-import aiohttp
-import urllib3
-import json
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator
+from collections import deque
+from functools import lru_cache
+from urllib.parse import quote_plus
+import asyncio
+import math
+import re
+import time
 
 from . import Constants
 from . import Exceptions
+from . import Models
+
+if TYPE_CHECKING:
+    import aiohttp
+    import urllib3
 
 
 def maskString(s: str) -> str:
@@ -12,30 +22,94 @@ def maskString(s: str) -> str:
     return f'{s[:l]}...{s[-l:]}'
 
 
+def apiHolder(region: str) -> str:
+    """Return the API holder of the region
+
+    Args:
+        region (str): The region for the API access
+
+    Returns:
+        str: `Constants.APIHOLDERS.LESTA` for the CIS regions and `Constants.APIHOLDERS.WG` for others
+    """
+    return Constants.APIHOLDERS.LESTA if region in Constants.REGION.CIS else Constants.APIHOLDERS.WG
+
+
+@lru_cache(maxsize=None)
+def checkQuery(region: str, game_shortname: str, api_method: str) -> None:
+    """Check that the game, the region and the method are valid. 
+    The result is cached, so every combination is checked only once
+
+    Raises:
+        Exceptions.ShortnameIsNotDefined: If the game is not defined
+        Exceptions.RegionDoesNotExisting: If the game is not available in the region
+        Exceptions.IncorrectMethodDeclaration: If the method is not written in dot-notation
+    """
+    if game_shortname not in Constants.GAMENAMES.SHORTNAMES.ALL:
+        raise Exceptions.ShortnameIsNotDefined(game_shortname)
+
+    game_section = Constants.SELECTOR[game_shortname]
+    if region not in game_section["region"]:
+        raise Exceptions.RegionDoesNotExisting(region, game_shortname)
+    
+    if "." not in api_method or \
+        len(api_method.split(".")) != 2:
+            raise Exceptions.IncorrectMethodDeclaration(api_method)
+
+
 def validateQuery(f: Callable):
     def wrapper(*args, **kwargs):
         app_instance = kwargs.get("app_instance") if kwargs.get("app_instance") else args[0]
-        region = app_instance.region
-        game_shortname = app_instance.game_shortname
         api_method: str = kwargs.get("api_method") if kwargs.get("api_method") else args[1]
-        
-        if game_shortname not in Constants.GAMENAMES.SHORTNAMES.ALL:
-            raise Exceptions.ShortnameIsNotDefined(game_shortname)
-
-        game_section = Constants.SELECTOR[game_shortname]
-        if region not in game_section["region"]:
-            raise Exceptions.RegionDoesNotExisting(region, game_shortname)
-        
-        if "." not in api_method or \
-            len(api_method.split(".")) != 2:
-                raise Exceptions.IncorrectMethodDeclaration(api_method)
-
+        checkQuery(app_instance.region, app_instance.game_shortname, api_method)
         return f(*args, **kwargs)
     return wrapper
 
 
+def normalizeParams(d: dict) -> dict[str, str]:
+    """Convert values of query parameters to strings as they are sent to API. 
+    Lists are joined by comma and booleans are written in lower case
+
+    Args:
+        d (dict): Query parameters
+
+    Returns:
+        dict[str, str]: Normalised query parameters
+    """
+    res: dict[str, str] = {}
+    for k, v in d.items():
+        if type(v) is str:
+            res[k] = v
+        elif isinstance(v, bool):
+            res[k] = "true" if v else "false"
+        elif isinstance(v, (int, float)):
+            res[k] = str(v)
+        elif isinstance(v, Iterable) and not isinstance(v, (str, bytes)):
+            res[k] = ",".join(str(i) for i in v)
+        else:
+            res[k] = str(v)
+    return res
+
+
+QUERY_SAFE = re.compile(r"[\w.~,:/-]*", re.ASCII)
+"""Values of query parameters that are sent without URL-encoding"""
+
+
+@lru_cache(maxsize=4096)
+def quoteValue(v: str) -> str:
+    """URL-encode the value of a query parameter, keeping commas of lists readable
+
+    Args:
+        v (str): The normalised value
+
+    Returns:
+        str: The encoded value
+    """
+    return v if QUERY_SAFE.fullmatch(v) else quote_plus(v, safe=",:/")
+
+
 def compileQuery(d: dict) -> str:
-    """Comvert `dict` to url query string such as `?key1=value1&key2=value2`
+    """Comvert `dict` to url query string such as `?key1=value1&key2=value2`. 
+    Values are URL-encoded and lists are joined by comma
 
     Args:
         d (dict): Dictionary that need to convert
@@ -43,23 +117,266 @@ def compileQuery(d: dict) -> str:
     Returns:
         str: Query string
     """
-    res: str = "?"
-    for k, v in d.items():
-        res += f"{k}={v}&"
-    return res[:-1]
+    if not d:
+        return ""
+    return "?" + "&".join([f"{k}={quoteValue(v)}" for k, v in normalizeParams(d).items()])
 
 
-def constructUrl(application_id: str, region: str, api_method: str, game_shortname: str, **kwargs) -> str:
+@lru_cache(maxsize=None)
+def baseUrl(region: str, game_shortname: str) -> str:
+    """Return the URL of the API of the game in the region, such as `https://api.worldoftanks.eu/wot/`
+
+    Args:
+        region (str): The region for the API access
+        game_shortname (str): The short name of the game
+
+    Returns:
+        str: The base URL
+    """
     game_section = Constants.SELECTOR[game_shortname]
-    method_block, method_name = api_method.split(".")
-    query_url: str = compileQuery({"application_id": application_id, **kwargs})
-    
     return "https://{api}.{game_longname}.{region}/{game_shortname}/".format(
         api = game_section["api_prefix"],
         region = region,
         game_shortname = game_shortname.replace(Constants.CIS_PREFIX, ""),
         game_longname = game_section["game_longname"],
-    ) + f"{method_block}/{method_name}/{query_url}"
+    )
+
+
+@lru_cache(maxsize=None)
+def methodPath(api_method: str) -> str:
+    """Return the path of the method, such as `account/info/` for `account.info`
+
+    Args:
+        api_method (str): The API method in dot-notation
+
+    Returns:
+        str: The path of the method
+    """
+    method_block, method_name = api_method.lower().split(".")
+    return f"{method_block}/{method_name}/"
+
+
+def authBaseUrl(app_instance: Any) -> str:
+    """Return the base URL of `auth.*` methods. They are served by the API of World of Tanks (Мир танков in CIS) 
+    for applications of every game, the same as the URLs of `urlLogin` and `urlProlongate`. A custom `base_url`, 
+    such as the one of `FakeApi.FakeApiServer`, keeps its host and gets the path of that game
+
+    Args:
+        app_instance (Any): The application instance
+
+    Returns:
+        str: The base URL, such as `https://api.worldoftanks.eu/wot/`
+    """
+    region, base_url = app_instance.region, app_instance.base_url
+    game_shortname = Constants.GAMENAMES.SHORTNAMES.TANKI if region in Constants.REGION.CIS else Constants.GAMENAMES.SHORTNAMES.WOT
+    if base_url is None or (app_instance.game_shortname in Constants.SELECTOR and base_url == baseUrl(region, app_instance.game_shortname)):
+        return baseUrl(region, game_shortname)
+    return base_url.rstrip("/").rsplit("/", 1)[0] + "/" + game_shortname.replace(Constants.CIS_PREFIX, "") + "/"
+
+
+def constructUrl(application_id: str, region: str, api_method: str, game_shortname: str, **kwargs) -> str:
+    return baseUrl(region, game_shortname) + methodPath(api_method) + compileQuery({"application_id": application_id, **kwargs})
+
+
+def buildRequest(
+        app_instance: Any, 
+        api_method: str, 
+        type_request: Constants.TYPEREQUESTS, 
+        params: dict, 
+        base_url: str | None = None
+    ) -> tuple[str, str, bytes | None]:
+    """Build the request of the method. The parameters of `POST` requests are sent in a form-encoded body, 
+    and a `GET` request with a query longer than `Constants.MAX_QUERY_LENGTH` is sent as `POST`
+
+    Args:
+        app_instance (Any): The application instance
+        api_method (str): The API method in dot-notation
+        type_request (Constants.TYPEREQUESTS): The requested type of HTTP request
+        params (dict): The query parameters without the `application_id`
+        base_url (str | None, optional): The base URL of the method (default is `base_url` of the application)
+
+    Returns:
+        tuple[str, str, bytes | None]: The type of HTTP request, the URL and the body
+    """
+    query = compileQuery({"application_id": app_instance.application_id, **params})
+    url = (base_url or app_instance.base_url) + methodPath(api_method)
+    if type_request == Constants.TYPEREQUESTS.GET and len(query) <= Constants.MAX_QUERY_LENGTH:
+        return type_request, url + query, None
+    return Constants.TYPEREQUESTS.POST, url, query[1:].encode()
+
+
+def batchParam(params: dict) -> str:
+    """Return the name of the first `*_id` parameter passed as an iterable, such as `account_id=[1, 2, 3]`
+
+    Raises:
+        Exceptions.BatchParameterIsNotDefined: If there is no such parameter
+    """
+    for key, value in params.items():
+        if key.endswith(Constants.BATCH_PARAM_SUFFIX) and isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+            return key
+    raise Exceptions.BatchParameterIsNotDefined(", ".join(params))
+
+
+def splitBatches(params: dict, batch_size: int = Constants.MAX_IDS_PER_REQUEST) -> list[dict]:
+    """Split the list of identifiers from the query parameters into sets of parameters with at most `batch_size` identifiers each
+
+    The list is taken from the first `*_id` parameter (for example `account_id` or `clan_id`) passed as an iterable. 
+    Duplicated identifiers are sent only once.
+
+    Args:
+        params (dict): Query parameters of the method
+        batch_size (int, optional): The maximum number of identifiers in one request (default is `Constants.MAX_IDS_PER_REQUEST`)
+
+    Returns:
+        list[dict]: Query parameters for each request with identifiers joined by comma
+    """
+    key = batchParam(params)
+    ids = list(dict.fromkeys(str(i) for i in params[key]))
+    return [{**params, key: ",".join(ids[i:i + batch_size])} for i in range(0, len(ids), batch_size)]
+
+
+def mergeResponses(responses: list[dict | Any]) -> dict | Any:
+    """Merge the `data` sections of several API responses into one response. 
+    Lists under the same key are concatenated, such as the vehicles of one account from `tanks.stats` batched by `tank_id`
+
+    Args:
+        responses (list[dict | Any]): The API responses of every batch
+
+    Returns:
+        dict | Any: The merged response or the first response that is not successful
+    """
+    meta: dict = {}
+    data: dict = {}
+    for res in responses:
+        if not isinstance(res, dict) or res.get("status") != "ok":
+            return res
+        meta = {**res.get("meta", {}), **meta}
+        for key, value in (res.get("data") or {}).items():
+            known = data.get(key)
+            if isinstance(known, list) and isinstance(value, list):
+                data[key] = known + value
+            elif value is not None or key not in data:
+                data[key] = value
+    return {"status": "ok", "meta": {**meta, "count": len(data)}, "data": data}
+
+
+def isResponseOk(res: Any) -> bool:
+    """Check that the decoded response, either a dictionary or a typed model, has `status: ok`"""
+    if isinstance(res, dict):
+        return res.get("status") == "ok"
+    return getattr(res, "status", None) == "ok"
+
+
+def getCached(
+        app_instance: Any, 
+        api_method: str, 
+        game_shortname: Constants.GAMENAMES.SHORTNAMES, 
+        type_request: Constants.TYPEREQUESTS, 
+        params: dict,
+        cached: bool = True
+    ) -> tuple[str | None, float, dict | None]:
+    """Look up the response in the cache of the application. Only `GET` requests of methods with a time to live are cached. 
+    With `cached=False` the lookup is skipped, but the key is returned, so the fresh response replaces the cached one
+
+    Returns:
+        tuple[str | None, float, dict | None]: The cache key (`None` if the response must not be cached), the time to live and the cached response
+    """
+    if app_instance.cache is None or type_request != Constants.TYPEREQUESTS.GET:
+        return None, 0, None
+    ttl = app_instance.cache.getTtl(api_method)
+    if not ttl:
+        return None, 0, None
+    cache_key = app_instance.cache.makeKey(app_instance.region, game_shortname, api_method, params)
+    return cache_key, ttl, app_instance.cache.get(cache_key) if cached else None
+
+
+def isOverloaded(res: dict | Any) -> bool:
+    """Check that the response is a sign of overload: a transient API error of `Constants.RETRYERRORS` or the HTTP status 429 or 5xx
+
+    Returns:
+        bool: `True` if the request should have been sent later
+    """
+    if isinstance(res, dict):
+        error = res.get("error")
+        return res.get("status") == "error" and isinstance(error, dict) and error.get("message") in Constants.RETRYERRORS
+    status = getattr(res, "status", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+def getResponseModel(app_instance: Any, api_method: str, typed: bool | None) -> type | None:
+    """Return the typed response of the method if typed responses are requested for the call or for the whole application
+
+    Returns:
+        type | None: The model or `None` if the response must be returned as a dictionary
+    """
+    if typed is None:
+        typed = app_instance.typed
+    return Models.getModel(api_method) if typed else None
+
+
+def readResponse(res: Any, stored: tuple | None, conditional: Any, key: tuple, decode: Callable[[bytes], Any]) -> dict | Any:
+    """Decode the response of the transport, or take the stored body of a not modified response
+
+    Returns:
+        dict | Any: The decoded response or the raw HTTP response if it can not be decoded
+    """
+    if stored is not None and res.status == 304:
+        return conditional.getBody(stored)
+    try:
+        data = decode(res.body)
+    except Exception:
+        return res.raw
+    
+    if conditional is not None and isResponseOk(data):
+        conditional.set(key, res.headers, data)
+    return data
+
+
+def sendSync(
+        app_instance: Any, 
+        api_method: str, 
+        type_request: Constants.TYPEREQUESTS, 
+        api_url: str, 
+        decode: Callable[[bytes], Any],
+        body: bytes | None = None
+    ) -> dict | Any | urllib3.BaseHTTPResponse:
+    if body is None:
+        conditional = app_instance.conditional if type_request == Constants.TYPEREQUESTS.GET else None
+        stored = conditional.get((api_url, decode)) if conditional is not None else None
+        headers = stored[0] if stored is not None else None
+    else:
+        conditional, stored, headers = None, None, Constants.FORM_HEADERS
+
+    if app_instance.limiter:
+        app_instance.limiter.acquire()
+    hooks = app_instance.hooks
+    if hooks is None:
+        res = app_instance.transport.request(type_request, api_url, headers, body)
+    else:
+        event = hooks.start(app_instance, api_method, type_request, api_url)
+        try:
+            res = app_instance.transport.request(type_request, api_url, headers, body)
+        except Exception as e:
+            hooks.error(event, e)
+            raise
+    data = readResponse(res, stored, conditional, (api_url, decode), decode)
+    if hooks is not None:
+        hooks.response(event, res, data)
+    return data
+
+
+def requestSync(
+        app_instance: Any, 
+        api_method: str, 
+        type_request: Constants.TYPEREQUESTS, 
+        api_url: str, 
+        decode: Callable[[bytes], Any],
+        body: bytes | None = None
+    ) -> dict | Any | urllib3.BaseHTTPResponse:
+    if app_instance.retry is None:
+        return sendSync(app_instance, api_method, type_request, api_url, decode, body)
+    on_retry = app_instance.hooks.retry(app_instance, api_method, type_request, api_url) if app_instance.hooks is not None else None
+    return app_instance.retry.execute(lambda: sendSync(app_instance, api_method, type_request, api_url, decode, body), on_retry)
 
 
 @validateQuery
@@ -68,14 +385,135 @@ def methodSyncExecute(
         api_method: str, 
         game_shortname: Constants.GAMENAMES.SHORTNAMES, 
         type_request: Constants.TYPEREQUESTS = "GET",
+        typed: bool | None = None,
+        cached: bool = True,
         **kwargs: dict[str, Any]
-    ) -> dict | urllib3.BaseHTTPResponse:
-    api_url = constructUrl(app_instance.application_id, app_instance.region, api_method, game_shortname, **kwargs)
-    res = app_instance.http.request(type_request, api_url.lower())
+    ) -> dict | Any | urllib3.BaseHTTPResponse:
+    if app_instance.tokens is not None:
+        kwargs = app_instance.tokens.inject(api_method, kwargs)
+    model = getResponseModel(app_instance, api_method, typed)
+    if model is None:
+        cache_key, ttl, res = getCached(app_instance, api_method, game_shortname, type_request, kwargs, cached)
+        if res is not None:
+            return res
+        decode = app_instance.decode
+    else:
+        cache_key, ttl = None, 0
+        decode = Models.getDecoder(model, app_instance.decode)
+
+    type_request, api_url, body = buildRequest(app_instance, api_method, type_request, kwargs)
+    data = requestSync(app_instance, api_method, type_request, api_url, decode, body)
+    
+    if cache_key is not None and isinstance(data, dict) and data.get("status") == "ok":
+        app_instance.cache.set(cache_key, data, ttl)
+    return data
+
+
+async def sendAsync(
+        app_instance: Any, 
+        api_method: str, 
+        type_request: Constants.TYPEREQUESTS, 
+        api_url: str, 
+        decode: Callable[[bytes], Any],
+        body: bytes | None = None
+    ) -> dict | Any | aiohttp.ClientResponse:
+    if body is None:
+        conditional = app_instance.conditional if type_request == Constants.TYPEREQUESTS.GET else None
+        stored = conditional.get((api_url, decode)) if conditional is not None else None
+        headers = stored[0] if stored is not None else None
+    else:
+        conditional, stored, headers = None, None, Constants.FORM_HEADERS
+
+    concurrency = app_instance.concurrency
+    if concurrency is None:
+        if app_instance.limiter:
+            await app_instance.limiter.acquireAsync()
+        return await fetchAsync(app_instance, api_method, type_request, api_url, decode, body, headers, stored, conditional)
+
+    await concurrency.acquire()
+    started, overloaded = time.monotonic(), None
     try:
-        return json.loads(res.data)
+        if app_instance.limiter:
+            await app_instance.limiter.acquireAsync()
+        started = time.monotonic()
+        data = await fetchAsync(app_instance, api_method, type_request, api_url, decode, body, headers, stored, conditional)
+        overloaded = isOverloaded(data)
+        return data
     except Exception:
-        return res
+        overloaded = True
+        raise
+    finally:
+        concurrency.release(started, overloaded)
+
+
+async def fetchAsync(
+        app_instance: Any, 
+        api_method: str, 
+        type_request: Constants.TYPEREQUESTS, 
+        api_url: str, 
+        decode: Callable[[bytes], Any],
+        body: bytes | None,
+        headers: dict | None,
+        stored: tuple | None,
+        conditional: Any
+    ) -> dict | Any | aiohttp.ClientResponse:
+    hooks = app_instance.hooks
+    if hooks is None:
+        res = await app_instance.transport.request(type_request, api_url, headers, body)
+    else:
+        event = hooks.start(app_instance, api_method, type_request, api_url)
+        try:
+            res = await app_instance.transport.request(type_request, api_url, headers, body)
+        except Exception as e:
+            hooks.error(event, e)
+            raise
+    data = readResponse(res, stored, conditional, (api_url, decode), decode)
+    if hooks is not None:
+        hooks.response(event, res, data)
+    return data
+
+
+async def requestAsync(
+        app_instance: Any, 
+        api_method: str, 
+        type_request: Constants.TYPEREQUESTS, 
+        api_url: str, 
+        decode: Callable[[bytes], Any],
+        body: bytes | None = None
+    ) -> dict | Any | aiohttp.ClientResponse:
+    if app_instance.retry is None:
+        return await sendAsync(app_instance, api_method, type_request, api_url, decode, body)
+    on_retry = app_instance.hooks.retry(app_instance, api_method, type_request, api_url) if app_instance.hooks is not None else None
+    return await app_instance.retry.executeAsync(lambda: sendAsync(app_instance, api_method, type_request, api_url, decode, body), on_retry)
+
+
+async def requestAsyncSingleFlight(
+        app_instance: Any, 
+        api_method: str, 
+        type_request: Constants.TYPEREQUESTS, 
+        api_url: str, 
+        decode: Callable[[bytes], Any]
+    ) -> dict | Any | aiohttp.ClientResponse:
+    """Send one HTTP request for all identical requests that are in flight at the same time. 
+    Every caller gets the same result object, so it must not be modified
+
+    Args:
+        app_instance (Any): The `AsyncApp` instance
+        api_method (str): The API method, passed to the hooks
+        type_request (Constants.TYPEREQUESTS): The type of HTTP request
+        api_url (str): The built URL, which is the key of the request together with the decoder
+        decode (Callable[[bytes], Any]): The decoder of the response body
+
+    Returns:
+        dict | Any | aiohttp.ClientResponse: The API response, either as a dictionary, a typed model or raw HTTP response
+    """
+    key = (api_url, decode)
+    task = app_instance.inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(requestAsync(app_instance, api_method, type_request, api_url, decode))
+        app_instance.inflight[key] = task
+        task.add_done_callback(lambda _: app_instance.inflight.pop(key, None))
+    return await asyncio.shield(task)
 
 
 @validateQuery
@@ -84,95 +522,784 @@ async def methodAsyncExecute(
         api_method: str, 
         game_shortname: Constants.GAMENAMES.SHORTNAMES, 
         type_request: Constants.TYPEREQUESTS = "GET",
+        typed: bool | None = None,
+        cached: bool = True,
         **kwargs: dict[str, Any]
-    ) -> dict | aiohttp.ClientResponse:
-    api_url = constructUrl(app_instance.application_id, app_instance.region, api_method, game_shortname, **kwargs)
-    async with aiohttp.ClientSession() as session:
-        async with session.request(type_request, api_url.lower()) as response:
-            try:
-                return await response.json()
-            except Exception:
-                return response
+    ) -> dict | Any | aiohttp.ClientResponse:
+    if app_instance.tokens is not None:
+        kwargs = app_instance.tokens.inject(api_method, kwargs)
+    model = getResponseModel(app_instance, api_method, typed)
+    if model is None:
+        cache_key, ttl, res = getCached(app_instance, api_method, game_shortname, type_request, kwargs, cached)
+        if res is not None:
+            return res
+        decode = app_instance.decode
+    else:
+        cache_key, ttl = None, 0
+        decode = Models.getDecoder(model, app_instance.decode)
 
+    type_request, api_url, body = buildRequest(app_instance, api_method, type_request, kwargs)
+    if body is None:
+        data = await requestAsyncSingleFlight(app_instance, api_method, type_request, api_url, decode)
+    else:
+        data = await requestAsync(app_instance, api_method, type_request, api_url, decode, body)
+    
+    if cache_key is not None and isinstance(data, dict) and data.get("status") == "ok":
+        app_instance.cache.set(cache_key, data, ttl)
+    return data
 
-class MethodBlock:
-    def __init__(self, 
-            app_instance: Any,
-            method_block: str
-        ) -> None:
+
+def methodSyncExecuteMany(
+        app_instance: Any,
+        api_method: str, 
+        game_shortname: Constants.GAMENAMES.SHORTNAMES, 
+        type_request: Constants.TYPEREQUESTS = "GET",
+        batch_size: int = Constants.MAX_IDS_PER_REQUEST,
+        typed: bool | None = None,
+        **kwargs: dict[str, Any]
+    ) -> dict | Any | urllib3.BaseHTTPResponse:
+    res = mergeResponses([
+        methodSyncExecute(app_instance, api_method, game_shortname, type_request, False, **params) 
+        for params in splitBatches(kwargs, batch_size)
+    ])
+    model = getResponseModel(app_instance, api_method, typed)
+    return Models.fromDict(res, model) if model and isinstance(res, dict) else res
+
+
+async def methodAsyncExecuteMany(
+        app_instance: Any,
+        api_method: str, 
+        game_shortname: Constants.GAMENAMES.SHORTNAMES, 
+        type_request: Constants.TYPEREQUESTS = "GET",
+        batch_size: int = Constants.MAX_IDS_PER_REQUEST,
+        typed: bool | None = None,
+        **kwargs: dict[str, Any]
+    ) -> dict | Any | aiohttp.ClientResponse:
+    res = mergeResponses(await asyncio.gather(*[
+        methodAsyncExecute(app_instance, api_method, game_shortname, type_request, False, **params) 
+        for params in splitBatches(kwargs, batch_size)
+    ]))
+    model = getResponseModel(app_instance, api_method, typed)
+    return Models.fromDict(res, model) if model and isinstance(res, dict) else res
+
+
+def pageRecords(res: dict | Any) -> list:
+    """Return the records of one page of the response
+
+    Args:
+        res (dict | Any): The API response
+
+    Raises:
+        Exceptions.ResponseIsNotSuccessful: If the API has not returned the page
+
+    Returns:
+        list: Items of the `data` list or values of the `data` dictionary
+    """
+    if not isinstance(res, dict) or res.get("status") != "ok":
+        raise Exceptions.ResponseIsNotSuccessful(res)
+    data = res.get("data") or []
+    return [i for i in data.values() if i is not None] if isinstance(data, dict) else data
+
+
+def pagesTotal(res: dict, limit: Any = None) -> int | None:
+    """Return the number of pages from the `meta` section of the first page
+
+    Args:
+        res (dict): The API response with the first page
+        limit (Any, optional): The `limit` parameter of the request
+
+    Returns:
+        int | None: The number of pages or `None` if the method is not paginated
+    """
+    meta = res.get("meta") or {}
+    if meta.get("page_total") is not None:
+        return int(meta["page_total"])
+    page_size = int(limit or meta.get("limit") or meta.get("count") or 0)
+    if meta.get("total") is not None and page_size:
+        return math.ceil(int(meta["total"]) / page_size)
+    return None
+
+
+def methodSyncIterate(
+        app_instance: Any,
+        api_method: str, 
+        game_shortname: Constants.GAMENAMES.SHORTNAMES, 
+        type_request: Constants.TYPEREQUESTS = "GET",
+        page_no: int = 1,
+        cached: bool = True,
+        **kwargs: dict[str, Any]
+    ) -> Iterator[dict]:
+    res = methodSyncExecute(app_instance, api_method, game_shortname, type_request, False, cached, page_no=page_no, **kwargs)
+    yield from pageRecords(res)
+
+    total = pagesTotal(res, kwargs.get("limit"))
+    for page in range(page_no + 1, (total or 0) + 1):
+        yield from pageRecords(methodSyncExecute(app_instance, api_method, game_shortname, type_request, False, cached, page_no=page, **kwargs))
+
+
+async def methodAsyncIterate(
+        app_instance: Any,
+        api_method: str, 
+        game_shortname: Constants.GAMENAMES.SHORTNAMES, 
+        type_request: Constants.TYPEREQUESTS = "GET",
+        page_no: int = 1,
+        prefetch: int = 2,
+        cached: bool = True,
+        **kwargs: dict[str, Any]
+    ) -> AsyncIterator[dict]:
+    res = await methodAsyncExecute(app_instance, api_method, game_shortname, type_request, False, cached, page_no=page_no, **kwargs)
+    records = pageRecords(res)
+    
+    pages = iter(range(page_no + 1, (pagesTotal(res, kwargs.get("limit")) or 0) + 1))
+    pending: deque[asyncio.Task] = deque()
+
+    def schedule() -> None:
+        page = next(pages, None)
+        if page is not None:
+            pending.append(asyncio.ensure_future(methodAsyncExecute(app_instance, api_method, game_shortname, type_request, False, cached, page_no=page, **kwargs)))
+    
+    try:
+        for _ in range(max(prefetch, 1)):
+            schedule()
+        for record in records:
+            yield record
+        while pending:
+            res = await pending.popleft()
+            schedule()
+            for record in pageRecords(res):
+                yield record
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def deltaParams(kwargs: dict, timestamp_fields: tuple[str, ...]) -> tuple[str, dict]:
+    """Return the name of the identifiers parameter and the parameters of the full request, with `fields` extended by `timestamp_fields`"""
+    id_param = batchParam(kwargs)
+    if kwargs.get("fields"):
+        fields = normalizeParams({"fields": kwargs["fields"]})["fields"].split(",")
+        kwargs = {**kwargs, "fields": ",".join(dict.fromkeys([*fields, *timestamp_fields]))}
+    return id_param, kwargs
+
+
+def mergeDelta(known: dict, probe: dict | Any, timestamp_fields: tuple[str, ...]) -> tuple[list[str], dict]:
+    """Compare timestamps of the probe response with the known records
+
+    Returns:
+        tuple[list[str], dict]: Identifiers of new and changed records and the known records that did not change
+    """
+    changed, unchanged = [], {}
+    for k, rec in (probe.get("data") or {}).items():
+        old = known.get(k)
+        if rec is not None and old is not None and all(old.get(f) == rec.get(f) for f in timestamp_fields):
+            unchanged[k] = old
+        elif rec is not None:
+            changed.append(k)
+        else:
+            unchanged[k] = None
+    return changed, unchanged
+
+
+def methodSyncExecuteDelta(
+        app_instance: Any,
+        api_method: str, 
+        game_shortname: Constants.GAMENAMES.SHORTNAMES, 
+        known: dict,
+        type_request: Constants.TYPEREQUESTS = "GET",
+        timestamp_fields: tuple[str, ...] = Constants.DELTA_FIELDS,
+        **kwargs: dict[str, Any]
+    ) -> dict | Any | urllib3.BaseHTTPResponse:
+    known = {str(k): v for k, v in known.items()}
+    id_param, params = deltaParams(kwargs, timestamp_fields)
+    probe = methodSyncExecuteMany(app_instance, api_method, game_shortname, type_request, typed=False, **{**kwargs, "fields": ",".join(timestamp_fields)})
+    if not isResponseOk(probe):
+        return probe
+    
+    changed, unchanged = mergeDelta(known, probe, timestamp_fields)
+    res = {"status": "ok", "meta": {}, "data": {}}
+    if changed:
+        res = methodSyncExecuteMany(app_instance, api_method, game_shortname, type_request, typed=False, **{**params, id_param: changed})
+        if not isResponseOk(res):
+            return res
+    data = {**unchanged, **res["data"]}
+    return {"status": "ok", "meta": {**res["meta"], "count": len(data), "changed": len(changed)}, "data": data}
+
+
+async def methodAsyncExecuteDelta(
+        app_instance: Any,
+        api_method: str, 
+        game_shortname: Constants.GAMENAMES.SHORTNAMES, 
+        known: dict,
+        type_request: Constants.TYPEREQUESTS = "GET",
+        timestamp_fields: tuple[str, ...] = Constants.DELTA_FIELDS,
+        **kwargs: dict[str, Any]
+    ) -> dict | Any | aiohttp.ClientResponse:
+    known = {str(k): v for k, v in known.items()}
+    id_param, params = deltaParams(kwargs, timestamp_fields)
+    probe = await methodAsyncExecuteMany(app_instance, api_method, game_shortname, type_request, typed=False, **{**kwargs, "fields": ",".join(timestamp_fields)})
+    if not isResponseOk(probe):
+        return probe
+    
+    changed, unchanged = mergeDelta(known, probe, timestamp_fields)
+    res = {"status": "ok", "meta": {}, "data": {}}
+    if changed:
+        res = await methodAsyncExecuteMany(app_instance, api_method, game_shortname, type_request, typed=False, **{**params, id_param: changed})
+        if not isResponseOk(res):
+            return res
+    data = {**unchanged, **res["data"]}
+    return {"status": "ok", "meta": {**res["meta"], "count": len(data), "changed": len(changed)}, "data": data}
+
+
+FIELD_PATH = re.compile(r"\w+(\.\w+)*", re.ASCII)
+
+
+class Projection:
+    """
+    The compiled selection of fields of a method, see `compileProjection`.
+
+    Attributes:
+        fields (str): The `fields` parameter of the request.
+        extra (tuple[str, ...]): Fields of `Constants.EXTRA_FIELDS` required by the selected paths.
+        tree (dict): The selected paths as nested dictionaries, `None` marks a whole value.
+    """
+    __slots__ = ("fields", "extra", "tree")
+
+    def __init__(self, fields: str, extra: tuple[str, ...], tree: dict) -> None:
+        self.fields = fields
+        self.extra = extra
+        self.tree = tree
+
+    def __str__(self) -> str:
+        return f"Projection('{self.fields}')"
+
+    def query(self, params: dict) -> dict:
+        """Return the query parameters with the `fields` of the projection and the `extra` fields added to the given ones"""
+        params = {**params, "fields": self.fields}
+        if self.extra:
+            extra = params.get("extra") or ()
+            extra = extra.split(",") if isinstance(extra, str) else list(extra)
+            params["extra"] = extra + [e for e in self.extra if e not in extra]
+        return params
+
+
+@lru_cache(maxsize=None)
+def compileProjection(api_method: str, paths: tuple[str, ...]) -> Projection:
+    """Validate the paths of fields and compile them into the parameters of the request and the tree of the projection. 
+    The result is cached, so every selection of the method is validated only once
+
+    Args:
+        api_method (str): The API method in dot-notation
+        paths (tuple[str, ...]): Paths of fields, such as `statistics.all.battles`
+
+    Raises:
+        Exceptions.FieldPathIsNotValid: If a path is empty or is not written in dot-notation
+
+    Returns:
+        Projection: The compiled projection
+    """
+    if not paths:
+        raise Exceptions.FieldPathIsNotValid("", api_method)
+    for path in paths:
+        if not isinstance(path, str) or not FIELD_PATH.fullmatch(path):
+            raise Exceptions.FieldPathIsNotValid(path, api_method)
+
+    selected = []
+    for path in sorted(set(paths)):
+        # a path inside an already selected field adds nothing
+        if not any(path.startswith(parent + ".") for parent in selected):
+            selected.append(path)
+
+    tree = {}
+    for path in selected:
+        *parents, leaf = path.split(".")
+        node = tree
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = None
+
+    extra = tuple(
+        e for e in Constants.EXTRA_FIELDS.get(api_method.lower(), ())
+        if any(path == e or path.startswith(e + ".") for path in selected)
+    )
+    return Projection(",".join(selected), extra, tree)
+
+
+def projectRecord(record: Any, tree: dict) -> Any:
+    """Keep only the fields of the tree in the record, lists of records are projected item by item"""
+    if isinstance(record, dict):
+        result = {}
+        for key, subtree in tree.items():
+            if key in record:
+                result[key] = record[key] if subtree is None else projectRecord(record[key], subtree)
+        return result
+    if isinstance(record, list):
+        return [projectRecord(item, tree) for item in record]
+    return record
+
+
+def projectResponse(res: dict | Any, tree: dict) -> dict | Any:
+    """Project every record of the `data` section of a successful response"""
+    if not isResponseOk(res) or not isinstance(res, dict):
+        return res
+    data = res["data"]
+    if isinstance(data, dict):
+        data = {key: projectRecord(record, tree) for key, record in data.items()}
+    elif isinstance(data, list):
+        data = [projectRecord(record, tree) for record in data]
+    return {**res, "data": data}
+
+
+class Method:
+    """
+    The API method of `App` called with dot-notation, such as `app.account.info(...)`. 
+    Methods are created once per application and method name, and cached by `MethodBlock`.
+    """
+    __slots__ = ("app_instance", "api_method")
+
+    def __init__(self, app_instance: Any, api_method: str) -> None:
         self.app_instance = app_instance
-        self.method_block = method_block
+        self.api_method = api_method
+
+    def __str__(self) -> str:
+        return f"Method('{self.api_method}')"
+
+    def __call__(self, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            typed: bool | None = None,
+            **kwargs: Any
+            ) -> dict | Any | urllib3.BaseHTTPResponse:
+        """
+        Executes selected method from the official API. 
+        
+        Args:
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            typed (bool | None, optional): Return a typed model from `Models` if the method has one (default is the `typed` option of the application). Typed models are decoded straight from the response body, so such calls bypass the `cache` of the application.
+            **kwargs (Any): Additional query parameters.
+
+        Returns:
+            dict | Any | urllib3.BaseHTTPResponse: The API response, either as a dictionary, a typed model or raw HTTP response.
+        """
+        return methodSyncExecute(
+            app_instance=self.app_instance,
+            api_method=self.api_method, 
+            game_shortname=self.app_instance.game_shortname, 
+            type_request=type_request,
+            typed=typed,
+            **kwargs
+        )
+    
+    def select(self, *paths: str) -> Selection:
+        """
+        Selects the fields of the records, such as `app.account.info.select("nickname", "statistics.all.battles")`. 
+        The paths are sent as the `fields` and `extra` parameters and the records are returned with the selected fields only.
+
+        Args:
+            *paths (str): Paths of fields in dot-notation.
+
+        Raises:
+            Exceptions.FieldPathIsNotValid: If a path is not valid.
+
+        Returns:
+            Selection: The method with the projection.
+        """
+        return Selection(self, compileProjection(self.api_method, paths))
+    
+    def many(self, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            batch_size: int = Constants.MAX_IDS_PER_REQUEST,
+            typed: bool | None = None,
+            **kwargs: Any
+            ) -> dict | Any | urllib3.BaseHTTPResponse:
+        """
+        Executes selected method for a list of identifiers of any length, such as `account_id=[...]`. 
+        The identifiers are split into batches of `batch_size`, requested one by one and merged into one response.
+        
+        Args:
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            batch_size (int, optional): The maximum number of identifiers in one request (default is 100).
+            typed (bool | None, optional): Return a typed model from `Models` if the method has one (default is the `typed` option of the application).
+            **kwargs (Any): Additional query parameters.
+
+        Returns:
+            dict | Any | urllib3.BaseHTTPResponse: The merged API response (a typed model if requested) or the first unsuccessful response.
+        """
+        return methodSyncExecuteMany(
+            app_instance=self.app_instance,
+            api_method=self.api_method, 
+            game_shortname=self.app_instance.game_shortname, 
+            type_request=type_request,
+            batch_size=batch_size,
+            typed=typed,
+            **kwargs
+        )
+    
+    def iter(self, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            page_no: int = 1,
+            **kwargs: Any
+            ) -> Iterator[dict]:
+        """
+        Iterates over the records of all pages of the selected method, such as `clans.list`. 
+        Pages are requested one by one while the records are consumed, following `page_total` or `total` from the `meta` section.
+        
+        Args:
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            page_no (int, optional): The first page (default is 1).
+            **kwargs (Any): Additional query parameters, such as `limit`.
+
+        Raises:
+            Exceptions.ResponseIsNotSuccessful: If the API has not returned a page.
+
+        Yields:
+            dict: Items of the `data` list or values of the `data` dictionary of every page.
+        """
+        return methodSyncIterate(
+            app_instance=self.app_instance,
+            api_method=self.api_method, 
+            game_shortname=self.app_instance.game_shortname, 
+            type_request=type_request,
+            page_no=page_no,
+            **kwargs
+        )
+    
+    def delta(self, 
+            known: dict,
+            type_request: Constants.TYPEREQUESTS = "GET",
+            timestamp_fields: tuple[str, ...] = Constants.DELTA_FIELDS,
+            **kwargs: Any
+            ) -> dict | urllib3.BaseHTTPResponse:
+        """
+        Refreshes known records, such as results of `account.info`, downloading in full only the records whose timestamps have changed. 
+        At first only `timestamp_fields` of all identifiers are requested, then the new and changed records are requested with all parameters.
         
+        Args:
+            known (dict): Records from the previous refresh, keyed by identifier. They must contain `timestamp_fields`.
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            timestamp_fields (tuple[str, ...], optional): Fields that change with the record (default is `updated_at` and `last_battle_time`).
+            **kwargs (Any): Additional query parameters with a list of identifiers, such as `account_id=[...]`.
+
+        Returns:
+            dict | urllib3.BaseHTTPResponse: The response with unchanged known records and fresh changed records, `meta.changed` is the number of fresh records.
+        """
+        return methodSyncExecuteDelta(
+            app_instance=self.app_instance,
+            api_method=self.api_method, 
+            game_shortname=self.app_instance.game_shortname, 
+            known=known,
+            type_request=type_request,
+            timestamp_fields=timestamp_fields,
+            **kwargs
+        )
+
+
+class AsyncMethod:
+    """
+    The API method of `AsyncApp` called with dot-notation, such as `await app.account.info(...)`. 
+    Methods are created once per application and method name, and cached by `AsyncMethodBlock`.
+    """
+    __slots__ = ("app_instance", "api_method")
+
+    def __init__(self, app_instance: Any, api_method: str) -> None:
+        self.app_instance = app_instance
+        self.api_method = api_method
+
     def __str__(self) -> str:
-        return f"MethodBlock('{self.method_block}')"
+        return f"AsyncMethod('{self.api_method}')"
+
+    async def __call__(self, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            typed: bool | None = None,
+            **kwargs: Any
+            ) -> dict | Any | aiohttp.ClientResponse:
+        """
+        Executes selected method from the official API. 
+        
+        Args:
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            typed (bool | None, optional): Return a typed model from `Models` if the method has one (default is the `typed` option of the application). Typed models are decoded straight from the response body, so such calls bypass the `cache` of the application.
+            **kwargs (Any): Additional query parameters.
+
+        Returns:
+            dict | Any | aiohttp.ClientResponse: The API response, either as a dictionary, a typed model or raw HTTP response.
+        """
+        return await methodAsyncExecute(
+            app_instance=self.app_instance,
+            api_method=self.api_method, 
+            game_shortname=self.app_instance.game_shortname, 
+            type_request=type_request,
+            typed=typed,
+            **kwargs
+        )
     
-    def __getattr__(self, method_name: str):
-        """Applies dot-notation for methods like `appInstance.methodBlock.methodName(*args, **kwargs)`
+    def select(self, *paths: str) -> AsyncSelection:
+        """
+        Selects the fields of the records, such as `app.account.info.select("nickname", "statistics.all.battles")`. 
+        The paths are sent as the `fields` and `extra` parameters and the records are returned with the selected fields only.
 
         Args:
-            method_name (str): Method name from the official documentation
+            *paths (str): Paths of fields in dot-notation.
+
+        Raises:
+            Exceptions.FieldPathIsNotValid: If a path is not valid.
+
+        Returns:
+            AsyncSelection: The method with the projection.
+        """
+        return AsyncSelection(self, compileProjection(self.api_method, paths))
+    
+    async def many(self, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            batch_size: int = Constants.MAX_IDS_PER_REQUEST,
+            typed: bool | None = None,
+            **kwargs: Any
+            ) -> dict | Any | aiohttp.ClientResponse:
+        """
+        Executes selected method for a list of identifiers of any length, such as `account_id=[...]`. 
+        The identifiers are split into batches of `batch_size`, requested concurrently and merged into one response.
+        
+        Args:
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            batch_size (int, optional): The maximum number of identifiers in one request (default is 100).
+            typed (bool | None, optional): Return a typed model from `Models` if the method has one (default is the `typed` option of the application).
+            **kwargs (Any): Additional query parameters.
+
+        Returns:
+            dict | Any | aiohttp.ClientResponse: The merged API response (a typed model if requested) or the first unsuccessful response.
+        """
+        return await methodAsyncExecuteMany(
+            app_instance=self.app_instance,
+            api_method=self.api_method, 
+            game_shortname=self.app_instance.game_shortname, 
+            type_request=type_request,
+            batch_size=batch_size,
+            typed=typed,
+            **kwargs
+        )
+    
+    def iter(self, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            page_no: int = 1,
+            prefetch: int = 2,
+            **kwargs: Any
+            ) -> AsyncIterator[dict]:
+        """
+        Asynchronously iterates over the records of all pages of the selected method, such as `clans.list`. 
+        While the records of one page are consumed, the next `prefetch` pages are requested concurrently.
+        
+        Args:
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            page_no (int, optional): The first page (default is 1).
+            prefetch (int, optional): The number of pages requested ahead (default is 2).
+            **kwargs (Any): Additional query parameters, such as `limit`.
+
+        Raises:
+            Exceptions.ResponseIsNotSuccessful: If the API has not returned a page.
+
+        Yields:
+            dict: Items of the `data` list or values of the `data` dictionary of every page.
+        """
+        return methodAsyncIterate(
+            app_instance=self.app_instance,
+            api_method=self.api_method, 
+            game_shortname=self.app_instance.game_shortname, 
+            type_request=type_request,
+            page_no=page_no,
+            prefetch=prefetch,
+            **kwargs
+        )
+    
+    async def delta(self, 
+            known: dict,
+            type_request: Constants.TYPEREQUESTS = "GET",
+            timestamp_fields: tuple[str, ...] = Constants.DELTA_FIELDS,
+            **kwargs: Any
+            ) -> dict | aiohttp.ClientResponse:
+        """
+        Refreshes known records, such as results of `account.info`, downloading in full only the records whose timestamps have changed. 
+        At first only `timestamp_fields` of all identifiers are requested, then the new and changed records are requested with all parameters.
+        
+        Args:
+            known (dict): Records from the previous refresh, keyed by identifier. They must contain `timestamp_fields`.
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            timestamp_fields (tuple[str, ...], optional): Fields that change with the record (default is `updated_at` and `last_battle_time`).
+            **kwargs (Any): Additional query parameters with a list of identifiers, such as `account_id=[...]`.
+
+        Returns:
+            dict | aiohttp.ClientResponse: The response with unchanged known records and fresh changed records, `meta.changed` is the number of fresh records.
+        """
+        return await methodAsyncExecuteDelta(
+            app_instance=self.app_instance,
+            api_method=self.api_method, 
+            game_shortname=self.app_instance.game_shortname, 
+            known=known,
+            type_request=type_request,
+            timestamp_fields=timestamp_fields,
+            **kwargs
+        )
+
+
+class Selection:
+    """
+    The method of `App` with selected fields, created by `Method.select`.
+    """
+    __slots__ = ("method", "projection")
+
+    def __init__(self, method: Method, projection: Projection) -> None:
+        self.method = method
+        self.projection = projection
+
+    def __str__(self) -> str:
+        return f"Selection('{self.method.api_method}', '{self.projection.fields}')"
+
+    def __call__(self, type_request: Constants.TYPEREQUESTS = "GET", **kwargs: Any) -> dict | Any | urllib3.BaseHTTPResponse:
+        """
+        Executes the method and returns the records with the selected fields.
+
+        Args:
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            **kwargs (Any): Additional query parameters, `fields` is replaced by the selected fields.
+
+        Returns:
+            dict | Any | urllib3.BaseHTTPResponse: The projected API response or the unsuccessful response as is.
+        """
+        return projectResponse(self.method(type_request, False, **self.projection.query(kwargs)), self.projection.tree)
+
+    def many(self, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            batch_size: int = Constants.MAX_IDS_PER_REQUEST,
+            **kwargs: Any
+            ) -> dict | Any | urllib3.BaseHTTPResponse:
+        """
+        Executes the method for a list of identifiers of any length, see `Method.many`, and returns the records with the selected fields.
         """
-        def dynamicMethod(
-                type_request: Constants.TYPEREQUESTS = "GET",
-                **kwargs: Any
-                ) -> dict | urllib3.BaseHTTPResponse:
-            """
-            Executes selected method from the official API. 
-            
-            Args:
-                type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
-                **kwargs (Any): Additional query parameters.
-
-            Returns:
-                dict | urllib3.BaseHTTPResponse: The API response, either as a dictionary or raw HTTP response.
-            """
-            return methodSyncExecute(
-                app_instance=self.app_instance,
-                api_method=f'{self.method_block}.{method_name}', 
-                game_shortname=self.app_instance.game_shortname, 
-                type_request=type_request,
-                **kwargs
-            )
-        return dynamicMethod
-
-
-class AsyncMethodBlock:
+        return projectResponse(self.method.many(type_request, batch_size, False, **self.projection.query(kwargs)), self.projection.tree)
+
+
+class AsyncSelection:
+    """
+    The method of `AsyncApp` with selected fields, created by `AsyncMethod.select`.
+    """
+    __slots__ = ("method", "projection")
+
+    def __init__(self, method: AsyncMethod, projection: Projection) -> None:
+        self.method = method
+        self.projection = projection
+
+    def __str__(self) -> str:
+        return f"AsyncSelection('{self.method.api_method}', '{self.projection.fields}')"
+
+    async def __call__(self, type_request: Constants.TYPEREQUESTS = "GET", **kwargs: Any) -> dict | Any | aiohttp.ClientResponse:
+        """
+        Executes the method and returns the records with the selected fields.
+
+        Args:
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            **kwargs (Any): Additional query parameters, `fields` is replaced by the selected fields.
+
+        Returns:
+            dict | Any | aiohttp.ClientResponse: The projected API response or the unsuccessful response as is.
+        """
+        return projectResponse(await self.method(type_request, False, **self.projection.query(kwargs)), self.projection.tree)
+
+    async def many(self, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            batch_size: int = Constants.MAX_IDS_PER_REQUEST,
+            **kwargs: Any
+            ) -> dict | Any | aiohttp.ClientResponse:
+        """
+        Executes the method for a list of identifiers of any length, see `AsyncMethod.many`, and returns the records with the selected fields.
+        """
+        return projectResponse(await self.method.many(type_request, batch_size, False, **self.projection.query(kwargs)), self.projection.tree)
+
+
+class FanOutMethod:
+    """
+    The API method of `FanOutApp` called with dot-notation, such as `await fanOutApp.clans.list(...)`.
+    """
+    __slots__ = ("app_instance", "api_method")
+
+    def __init__(self, app_instance: Any, api_method: str) -> None:
+        self.app_instance = app_instance
+        self.api_method = api_method
+
+    def __str__(self) -> str:
+        return f"FanOutMethod('{self.api_method}')"
+
+    async def __call__(self, 
+            type_request: Constants.TYPEREQUESTS = "GET",
+            targets: list[str] | None = None,
+            **kwargs: Any
+            ) -> dict:
+        """
+        Executes selected method from the official API in every target concurrently. 
+        
+        Args:
+            type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
+            targets (list[str] | None, optional): Keys of the targets, such as `eu.wot` (default is all targets).
+            **kwargs (Any): Additional query parameters.
+
+        Returns:
+            dict: The merged response with `data` and `errors` keyed by `region.game_shortname`.
+        """
+        return await self.app_instance.execute(self.api_method, type_request, targets, **kwargs)
+
+
+class MethodBlock:
+    """
+    The block of API methods, such as `account`, that creates the methods on first access and caches them.
+    """
+    __slots__ = ("app_instance", "method_block", "methods")
+    method_class = Method
+
     def __init__(self, 
             app_instance: Any,
             method_block: str
         ) -> None:
         self.app_instance = app_instance
         self.method_block = method_block
-    
+        self.methods: dict[str, Any] = {}
+        
     def __str__(self) -> str:
-        return f"AsyncMethodBlock('{self.method_block}')"
+        return f"{type(self).__name__}('{self.method_block}')"
     
-    def __getattr__(self, method_name: str):
+    def __getattr__(self, method_name: str) -> Method:
         """Applies dot-notation for methods like `appInstance.methodBlock.methodName(*args, **kwargs)`
 
         Args:
             method_name (str): Method name from the official documentation
         """
-        async def dynamicMethod(
-                type_request: Constants.TYPEREQUESTS = "GET",
-                **kwargs: Any
-                ) -> dict | aiohttp.ClientResponse:
-            """
-            Executes selected method from the official API. 
-            
-            Args:
-                type_request (Constants.TYPEREQUESTS, optional): The type of HTTP request (default is "GET").
-                **kwargs (Any): Additional query parameters.
-
-            Returns:
-                dict | aiohttp.ClientResponse: The API response, either as a dictionary or raw HTTP response.
-            """
-            return await methodAsyncExecute(
-                app_instance=self.app_instance,
-                api_method=f'{self.method_block}.{method_name}', 
-                game_shortname=self.app_instance.game_shortname, 
-                type_request=type_request,
-                **kwargs
-            )
-        return dynamicMethod
+        if method_name.startswith("__"):
+            raise AttributeError(method_name)
+        method = self.methods.get(method_name)
+        if method is None:
+            method = self.methods[method_name] = self.method_class(self.app_instance, f'{self.method_block}.{method_name}')
+        return method
+
+
+class AsyncMethodBlock(MethodBlock):
+    __slots__ = ()
+    method_class = AsyncMethod
+
+
+class FanOutMethodBlock(MethodBlock):
+    __slots__ = ()
+    method_class = FanOutMethod
 
+
+def getMethodBlock(app_instance: Any, method_block: str, block_class: type) -> MethodBlock:
+    """Return the method block of the application, creating it on first access. 
+    The block is stored in the instance dictionary, so next accesses do not reach `__getattr__` at all
+
+    Args:
+        app_instance (Any): The application
+        method_block (str): The name of the block, such as `account`
+        block_class (type): `MethodBlock`, `AsyncMethodBlock` or `FanOutMethodBlock`
+
+    Returns:
+        MethodBlock: The cached block
+    """
+    if method_block.startswith("_"):
+        raise AttributeError(method_block)
+    block = block_class(app_instance, method_block)
+    app_instance.__dict__[method_block] = block
+    return block
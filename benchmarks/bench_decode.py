@@ -0,0 +1,63 @@
+"""
+Decoding time and memory of large responses
+
+The payloads are the full `encyclopedia.vehicles` and `account.info` for 100 accounts of the fake API.
+
+    asv run --bench bench_decode
+"""
+import tracemalloc
+
+from WgLestaAPI import Constants
+from WgLestaAPI import Decoders
+from WgLestaAPI import Exceptions
+from WgLestaAPI import FakeApi
+from WgLestaAPI import Models
+
+
+PAYLOADS = {
+    "encyclopedia.vehicles": "http://localhost/wot/encyclopedia/vehicles/?limit=1000",
+    "account.info": "http://localhost/wot/account/info/?account_id=" + ",".join(str(563982544 + i) for i in range(100)),
+}
+
+
+def payload(api_method: str) -> bytes:
+    return FakeApi.FakeApi().respond("GET", PAYLOADS[api_method]).body
+
+
+def decoder(name: str, api_method: str):
+    if name == "typed":
+        return Models.getDecoder(Models.getModel(api_method), Decoders.getDecoder())
+    try:
+        return Decoders.getDecoder(name)
+    except Exceptions.DecoderIsNotAvailable:
+        raise NotImplementedError(name)
+
+
+class DecodeSuite:
+    params = [list(PAYLOADS), [Constants.DECODERS.ORJSON, Constants.DECODERS.MSGSPEC, Constants.DECODERS.JSON, "typed"]]
+    param_names = ["api_method", "decoder"]
+
+    def setup(self, api_method: str, name: str) -> None:
+        self.body = payload(api_method)
+        self.decode = decoder(name, api_method)
+
+    def time_decode(self, api_method: str, name: str) -> None:
+        self.decode(self.body)
+
+    def peakmem_decode(self, api_method: str, name: str) -> None:
+        self.decode(self.body)
+
+    def track_response_bytes(self, api_method: str, name: str) -> int:
+        tracemalloc.start()
+        try:
+            response = self.decode(self.body)
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del response
+        return size
+    track_response_bytes.unit = "bytes"
+
+    def track_body_bytes(self, api_method: str, name: str) -> int:
+        return len(self.body)
+    track_body_bytes.unit = "bytes"
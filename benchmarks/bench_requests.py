@@ -0,0 +1,98 @@
+"""
+Throughput of the request pipeline against the fake API served on the local host
+
+Every benchmark sends `REQUESTS` requests for `account.info` with the default transports, so the numbers include 
+the HTTP stack, decoding and the library overhead. The limit of requests per second is disabled.
+
+    asv run --bench bench_requests
+"""
+import asyncio
+
+from WgLestaAPI import Application
+from WgLestaAPI import Constants
+from WgLestaAPI import FakeApi
+from WgLestaAPI import Transport
+
+
+APPLICATION_ID = "0123456789abcdef0123456789abcdef"
+REQUESTS = 200
+
+
+def syncApp(server: FakeApi.FakeApiServer | None = None, **kwargs) -> Application.App:
+    app = Application.App(APPLICATION_ID, Constants.REGION.EU, Constants.GAMENAMES.SHORTNAMES.WOT, rate_limit=0, **kwargs)
+    if server is not None:
+        app.base_url = server.baseUrl(Constants.GAMENAMES.SHORTNAMES.WOT)
+    return app
+
+
+def asyncApp(server: FakeApi.FakeApiServer | None = None, **kwargs) -> Application.AsyncApp:
+    app = Application.AsyncApp(APPLICATION_ID, Constants.REGION.EU, Constants.GAMENAMES.SHORTNAMES.WOT, rate_limit=0, **kwargs)
+    if server is not None:
+        app.base_url = server.baseUrl(Constants.GAMENAMES.SHORTNAMES.WOT)
+    return app
+
+
+async def gatherBounded(app: Application.AsyncApp, concurrency: int, requests: int = REQUESTS) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(account_id: int) -> None:
+        async with semaphore:
+            await app.account.info(account_id=account_id)
+
+    async with app:
+        await asyncio.gather(*[one(i) for i in range(requests)])
+
+
+class ThroughputSuite:
+    """Sequential and parallel requests of `App` against concurrent requests of `AsyncApp`"""
+    timeout = 120
+
+    def setup(self) -> None:
+        self.server = FakeApi.FakeApiServer()
+        self.server.start()
+
+    def teardown(self) -> None:
+        self.server.stop()
+
+    def time_sync_sequential(self) -> None:
+        with syncApp(self.server) as app:
+            for i in range(REQUESTS):
+                app.account.info(account_id=i)
+
+    def time_sync_map(self) -> None:
+        with syncApp(self.server, workers=16) as app:
+            app.map("account.info", [{"account_id": i} for i in range(REQUESTS)])
+
+    def time_async_gather(self) -> None:
+        asyncio.run(gatherBounded(asyncApp(self.server), 16))
+
+
+class ConcurrencySuite:
+    """Scaling of `AsyncApp` with the number of requests in flight, the fake API responds in 10 ms"""
+    params = [1, 4, 16, 64, 256]
+    param_names = ["concurrency"]
+    timeout = 120
+
+    def setup(self, concurrency: int) -> None:
+        self.server = FakeApi.FakeApiServer(FakeApi.FakeApi(latency=0.01))
+        self.server.start()
+
+    def teardown(self, concurrency: int) -> None:
+        self.server.stop()
+
+    def time_async_concurrency(self, concurrency: int) -> None:
+        config = Transport.TransportConfig(pool_size=concurrency, limit=concurrency)
+        asyncio.run(gatherBounded(asyncApp(self.server, transport=config), concurrency))
+
+
+class OverheadSuite:
+    """The library overhead of one request without sockets, through the in-process transports"""
+
+    def setup(self) -> None:
+        self.app = syncApp(transport=Transport.MockTransport(FakeApi.FakeApi()))
+
+    def time_sync_mock(self) -> None:
+        self.app.account.info(account_id=563982544)
+
+    def time_async_mock(self) -> None:
+        asyncio.run(gatherBounded(asyncApp(transport=Transport.AsyncMockTransport(FakeApi.FakeApi())), 64))
@@ -0,0 +1,79 @@
+"""
+Import time of the library and the per-call overhead of the dot-notation, which dominate short-lived jobs
+
+Run from the root of the repository:
+
+    python benchmarks/bench_startup.py
+
+or as a part of the `asv` suite:
+
+    asv run --bench bench_startup
+"""
+import os
+import subprocess
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from WgLestaAPI import Application
+from WgLestaAPI import Constants
+
+
+IMPORTS = {
+    "sync": "from WgLestaAPI.Application import App",
+    "async": "from WgLestaAPI.Application import AsyncApp\nAsyncApp('0123456789abcdef', 'eu', 'wot')",
+}
+
+
+def timeraw_import_sync() -> str:
+    return IMPORTS["sync"]
+
+
+def timeraw_import_async() -> str:
+    return IMPORTS["async"]
+
+
+class DotNotationSuite:
+    """Access to a method of the application through the method block"""
+
+    def setup(self) -> None:
+        self.app = Application.App("0123456789abcdef", Constants.REGION.EU, Constants.GAMENAMES.SHORTNAMES.WOT)
+        self.async_app = Application.AsyncApp("0123456789abcdef", Constants.REGION.EU, Constants.GAMENAMES.SHORTNAMES.WOT)
+
+    def time_method_lookup(self) -> None:
+        self.app.account.info
+
+    def time_async_method_lookup(self) -> None:
+        self.async_app.account.info
+
+    def time_app_init(self) -> None:
+        Application.App("0123456789abcdef", Constants.REGION.EU, Constants.GAMENAMES.SHORTNAMES.WOT)
+
+
+def importTime(code: str, repeat: int = 10) -> tuple[float, list[str]]:
+    """Return the best time of running the code in a fresh interpreter and the HTTP clients it has imported"""
+    script = (
+        "import sys, time\n"
+        "started = time.perf_counter()\n"
+        f"{code}\n"
+        "print(time.perf_counter() - started)\n"
+        "print(','.join(m for m in ('urllib3', 'aiohttp', 'httpx') if m in sys.modules))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs = [subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, cwd=root, check=True).stdout.split("\n") for _ in range(repeat)]
+    return min(float(run[0]) for run in runs), runs[0][1].split(",")
+
+
+def main(number: int = 1_000_000) -> None:
+    for name, code in IMPORTS.items():
+        seconds, modules = importTime(code)
+        print(f"import {name:>5}: {seconds * 1e3:.1f} ms, HTTP clients: {', '.join(filter(None, modules)) or 'none'}")
+    suite = DotNotationSuite()
+    suite.setup()
+    seconds = min(timeit.repeat(suite.time_method_lookup, number=number, repeat=5))
+    print(f"app.account.info: {seconds / number * 1e9:.0f} ns per access")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Micro-benchmark of the per-call overhead of validating a query and building its URL
+
+Run from the root of the repository:
+
+    python benchmarks/bench_url.py
+
+or as a part of the `asv` suite:
+
+    asv run --bench bench_url
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from WgLestaAPI import Constants
+from WgLestaAPI import Exceptions
+from WgLestaAPI import Utils
+
+
+APPLICATION_ID = "0123456789abcdef0123456789abcdef"
+PARAMS = {"account_id": "563982544,563982545,563982546", "fields": "nickname,statistics.all.battles", "language": "en"}
+
+
+def legacyUrl(region: str, game_shortname: str, api_method: str, **kwargs) -> str:
+    """Validation and URL building as they were done on every call before the URL templates were cached"""
+    if game_shortname not in Constants.GAMENAMES.SHORTNAMES.ALL:
+        raise Exceptions.ShortnameIsNotDefined(game_shortname)
+    game_section = Constants.SELECTOR[game_shortname]
+    if region not in game_section["region"]:
+        raise Exceptions.RegionDoesNotExisting(region, game_shortname)
+    if "." not in api_method or len(api_method.split(".")) != 2:
+        raise Exceptions.IncorrectMethodDeclaration(api_method)
+
+    method_block, method_name = api_method.split(".")
+    query_url = "?"
+    for k, v in {"application_id": APPLICATION_ID, **kwargs}.items():
+        query_url += f"{k}={v}&"
+    return ("https://{api}.{game_longname}.{region}/{game_shortname}/".format(
+        api = game_section["api_prefix"],
+        region = region,
+        game_shortname = game_shortname.replace(Constants.CIS_PREFIX, ""),
+        game_longname = game_section["game_longname"],
+    ) + f"{method_block}/{method_name}/{query_url[:-1]}").lower()
+
+
+def currentUrl(region: str, game_shortname: str, api_method: str, **kwargs) -> str:
+    """Validation and URL building as they are done by `methodSyncExecute` and `methodAsyncExecute`"""
+    Utils.checkQuery(region, game_shortname, api_method)
+    return Utils.baseUrl(region, game_shortname) + Utils.methodPath(api_method) + Utils.compileQuery({"application_id": APPLICATION_ID, **kwargs})
+
+
+class UrlSuite:
+    """Per-call overhead of the query validation and the URL building"""
+
+    def setup(self) -> None:
+        self.validated = Utils.validateQuery(lambda app_instance, api_method, game_shortname, **kwargs: None)
+        self.app = type("AppStub", (), {"region": Constants.REGION.EU, "game_shortname": Constants.GAMENAMES.SHORTNAMES.WOT})()
+
+    def time_legacy_url(self) -> None:
+        legacyUrl(Constants.REGION.EU, Constants.GAMENAMES.SHORTNAMES.WOT, "account.info", **PARAMS)
+
+    def time_construct_url(self) -> None:
+        Utils.constructUrl(APPLICATION_ID, Constants.REGION.EU, "account.info", Constants.GAMENAMES.SHORTNAMES.WOT, **PARAMS)
+
+    def time_current_url(self) -> None:
+        currentUrl(Constants.REGION.EU, Constants.GAMENAMES.SHORTNAMES.WOT, "account.info", **PARAMS)
+
+    def time_validate_query(self) -> None:
+        self.validated(self.app, "account.info", Constants.GAMENAMES.SHORTNAMES.WOT, **PARAMS)
+
+    def time_compile_query(self) -> None:
+        Utils.compileQuery({"application_id": APPLICATION_ID, **PARAMS})
+
+
+def main(number: int = 100_000) -> None:
+    for name, f in (("before", legacyUrl), ("after", currentUrl)):
+        seconds = min(timeit.repeat(lambda: f(Constants.REGION.EU, Constants.GAMENAMES.SHORTNAMES.WOT, "account.info", **PARAMS), number=number, repeat=5))
+        print(f"{name:>6}: {seconds / number * 1e6:.2f} us per call")
+
+
+if __name__ == "__main__":
+    main()
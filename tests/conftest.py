@@ -0,0 +1,93 @@
+"""
+Shared fixtures: applications on the fake API without sockets
+"""
+from typing import Any, Callable
+
+import pytest
+
+from WgLestaAPI import Application, FakeApi, Transport
+
+
+APPLICATION_ID = "abcdefghijklmnop"
+
+
+class RecordingTransport(Transport.MockTransport):
+    """
+    `MockTransport` that keeps every sent request as `(type_request, url, headers, body)`.
+    """
+    def __init__(self, api: FakeApi.FakeApi) -> None:
+        super().__init__(api)
+        self.requests: list[tuple] = []
+
+    @property
+    def urls(self) -> list[str]:
+        return [request[1] for request in self.requests]
+
+    @property
+    def types(self) -> list[str]:
+        return [request[0] for request in self.requests]
+
+    def request(self, type_request, url, headers=None, body=None):
+        self.requests.append((type_request, url, headers, body))
+        return super().request(type_request, url, headers, body)
+
+
+class AsyncRecordingTransport(Transport.AsyncMockTransport):
+    """
+    `AsyncMockTransport` that keeps every sent request as `(type_request, url, headers, body)`.
+    """
+    def __init__(self, api: FakeApi.FakeApi) -> None:
+        super().__init__(api)
+        self.requests: list[tuple] = []
+
+    @property
+    def urls(self) -> list[str]:
+        return [request[1] for request in self.requests]
+
+    @property
+    def types(self) -> list[str]:
+        return [request[0] for request in self.requests]
+
+    async def request(self, type_request, url, headers=None, body=None):
+        self.requests.append((type_request, url, headers, body))
+        return await super().request(type_request, url, headers, body)
+
+
+@pytest.fixture
+def api() -> FakeApi.FakeApi:
+    return FakeApi.FakeApi(seed=1)
+
+
+@pytest.fixture
+def transport(api: FakeApi.FakeApi) -> RecordingTransport:
+    return RecordingTransport(api)
+
+
+@pytest.fixture
+def asyncTransport(api: FakeApi.FakeApi) -> AsyncRecordingTransport:
+    return AsyncRecordingTransport(api)
+
+
+@pytest.fixture
+def makeApp(api: FakeApi.FakeApi) -> Callable[..., Application.App]:
+    """
+    Returns a factory of `App` on `RecordingTransport` of the `api` fixture without the limit of requests per second.
+    Any argument of `App` can be overridden, such as `rate_limit=None` for the default limit.
+    """
+    def make(game_shortname: str = "wot", region: str = "eu", application_id: str = APPLICATION_ID, **kwargs: Any) -> Application.App:
+        kwargs.setdefault("rate_limit", 0)
+        kwargs.setdefault("transport", RecordingTransport(api))
+        return Application.App(application_id, region, game_shortname, **kwargs)
+    return make
+
+
+@pytest.fixture
+def makeAsyncApp(api: FakeApi.FakeApi) -> Callable[..., Application.AsyncApp]:
+    """
+    Returns a factory of `AsyncApp` on `AsyncRecordingTransport` of the `api` fixture without the limit of requests per second.
+    """
+    def make(game_shortname: str = "wot", region: str = "eu", application_id: str = APPLICATION_ID, **kwargs: Any) -> Application.AsyncApp:
+        kwargs.setdefault("rate_limit", 0)
+        kwargs.setdefault("transport", AsyncRecordingTransport(api))
+        return Application.AsyncApp(application_id, region, game_shortname, **kwargs)
+    return make
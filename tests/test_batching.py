@@ -0,0 +1,48 @@
+"""
+Requests for many identifiers split into batches
+"""
+import asyncio
+
+from WgLestaAPI import FakeApi, Utils
+
+
+def tankIds(account_id: int) -> list[int]:
+    return [record["tank_id"] for record in FakeApi.tankStats(account_id)]
+
+
+def testMergeConcatenatesListsOfOneKey():
+    responses = [
+        {"status": "ok", "meta": {"count": 1}, "data": {"1": [{"tank_id": 1}]}},
+        {"status": "ok", "meta": {"count": 1}, "data": {"1": [{"tank_id": 2}], "2": None}},
+    ]
+    res = Utils.mergeResponses(responses)
+    assert res["data"] == {"1": [{"tank_id": 1}, {"tank_id": 2}], "2": None}
+
+
+def testManyByTankIdKeepsAllBatches(makeApp):
+    account_id = 3
+    expected = tankIds(account_id)
+
+    res = makeApp().tanks.stats.many(account_id=account_id, tank_id=range(1, FakeApi.VEHICLES_TOTAL + 1), batch_size=100)
+
+    assert res["status"] == "ok"
+    assert [record["tank_id"] for record in res["data"][str(account_id)]] == expected
+
+
+def testManyByTankIdAsync(makeAsyncApp):
+    account_id = 7
+    expected = tankIds(account_id)
+
+    async def main() -> dict:
+        return await makeAsyncApp().tanks.stats.many(account_id=account_id, tank_id=range(1, FakeApi.VEHICLES_TOTAL + 1), batch_size=50)
+
+    res = asyncio.run(main())
+    assert sorted(record["tank_id"] for record in res["data"][str(account_id)]) == expected
+
+
+def testManyByAccountId(makeApp):
+    app = makeApp()
+    res = app.account.info.many(account_id=range(1, 251), fields="nickname")
+    assert res["meta"]["count"] == 250
+    assert res["data"]["250"] == {"nickname": "player_250"}
+    assert len(app.transport.requests) == 3
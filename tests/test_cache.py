@@ -0,0 +1,102 @@
+"""
+Cache of responses and conditional requests with validators of responses
+"""
+import asyncio
+import time
+
+import orjson
+
+from WgLestaAPI import Cache, Transport
+
+
+BODY = orjson.dumps({"status": "ok", "meta": {"count": 1}, "data": {"1": {"nickname": "player"}}})
+
+
+class EvictingTransport(Transport.BaseTransport):
+    """Answers `304` to conditional requests after another response has evicted the stored one"""
+    def __init__(self, conditional: Cache.ConditionalCache) -> None:
+        self.conditional = conditional
+
+    def request(self, type_request, url, headers=None, body=None):
+        if headers and "If-None-Match" in headers:
+            self.conditional.set(("evicting", None), {"ETag": "other"}, {})
+            return Transport.Response(304, {}, b"")
+        return Transport.Response(200, {"ETag": "v1"}, BODY)
+
+
+class AsyncEvictingTransport(Transport.BaseAsyncTransport):
+    def __init__(self, conditional: Cache.ConditionalCache) -> None:
+        self.sync = EvictingTransport(conditional)
+
+    async def request(self, type_request, url, headers=None, body=None):
+        return self.sync.request(type_request, url, headers, body)
+
+
+def testNotModifiedAfterEviction(makeApp):
+    conditional = Cache.ConditionalCache(maxsize=1)
+    app = makeApp(conditional=conditional, transport=EvictingTransport(conditional))
+
+    first = app.execute("account.info", account_id=1)
+    second = app.execute("account.info", account_id=1)
+    assert second == first
+    assert conditional.revalidated == 1
+
+
+def testNotModifiedAfterEvictionAsync(makeAsyncApp):
+    conditional = Cache.ConditionalCache(maxsize=1)
+    app = makeAsyncApp(conditional=conditional, transport=AsyncEvictingTransport(conditional))
+
+    async def main():
+        first = await app.execute("account.info", account_id=1)
+        second = await app.execute("account.info", account_id=1)
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert second == first
+    assert conditional.revalidated == 1
+
+
+def testCacheHitWithinTtl(makeApp):
+    cache = Cache.ResponseCache()
+    app = makeApp(cache=cache)
+
+    first = app.execute("encyclopedia.vehicles", tier=10)
+    assert app.execute("encyclopedia.vehicles", tier=10) is first
+    app.execute("encyclopedia.vehicles", tier=8)
+    app.execute("account.info", account_id=1)
+    app.execute("account.info", account_id=1)
+
+    assert len(app.transport.requests) == 4
+    assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 0, "size": 2}
+
+
+def testCacheExpiresAfterTtl(makeApp):
+    app = makeApp(cache=Cache.ResponseCache(ttls={"encyclopedia": 0.05}))
+
+    app.execute("encyclopedia.info")
+    app.execute("encyclopedia.info")
+    time.sleep(0.06)
+    app.execute("encyclopedia.info")
+
+    assert len(app.transport.requests) == 2
+
+
+def testCacheEvictsLeastRecentlyUsed():
+    cache = Cache.ResponseCache(maxsize=2)
+    for key in ("a", "b"):
+        cache.set(key, {"key": key}, 60)
+    cache.get("a")
+    cache.set("c", {"key": "c"}, 60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"key": "a"} and cache.get("c") == {"key": "c"}
+    assert cache.evictions == 1
+
+
+def testCacheBackendWarmStart(tmp_path, makeApp):
+    path = str(tmp_path / "cache.sqlite3")
+    makeApp(cache=Cache.ResponseCache(backend=Cache.SqliteBackend(path))).execute("encyclopedia.info")
+
+    app = makeApp(cache=Cache.ResponseCache(backend=Cache.SqliteBackend(path)))
+    assert app.execute("encyclopedia.info")["status"] == "ok"
+    assert app.transport.requests == []
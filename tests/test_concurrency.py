@@ -0,0 +1,102 @@
+"""
+Adaptive limit of requests in flight of AsyncApp
+"""
+import asyncio
+import time
+
+from WgLestaAPI import RateLimit
+
+
+async def request(concurrency: RateLimit.AdaptiveConcurrency, latency: float = 0.01, overloaded: bool = False) -> None:
+    """Holds a slot for one turn of the event loop and reports the given latency"""
+    await concurrency.acquire()
+    started = time.monotonic()
+    await asyncio.sleep(0)
+    concurrency.release(started - latency, overloaded)
+
+
+def testLimitGrowsWhileSaturatedAndHealthy():
+    concurrency = RateLimit.AdaptiveConcurrency(initial=2, max_limit=8)
+
+    async def main() -> None:
+        await asyncio.gather(*[request(concurrency) for _ in range(200)])
+
+    asyncio.run(main())
+    assert concurrency.limit == 8
+    assert [decision[1:] for decision in concurrency.decisions] == [("increase", "healthy", limit) for limit in range(3, 9)]
+    assert concurrency.stats()["in_flight"] == 0 and concurrency.stats()["waiting"] == 0
+
+
+def testLimitDoesNotGrowBelowIt():
+    concurrency = RateLimit.AdaptiveConcurrency(initial=4)
+
+    async def main() -> None:
+        for _ in range(50):
+            await request(concurrency)
+
+    asyncio.run(main())
+    assert concurrency.limit == 4 and concurrency.increases == 0
+
+
+def testOverloadHalvesLimitOncePerWindow():
+    concurrency = RateLimit.AdaptiveConcurrency(initial=16, min_limit=3)
+
+    async def main() -> None:
+        await concurrency.acquire()
+        await concurrency.acquire()
+        before = time.monotonic()
+        concurrency.release(before, True)
+        concurrency.release(before - 1, True)
+        assert concurrency.limit == 8
+
+        for expected in (4, 3, 3):
+            await request(concurrency, latency=0, overloaded=True)
+            assert concurrency.limit == expected
+
+    asyncio.run(main())
+    assert [decision[1:] for decision in concurrency.decisions] == [("decrease", "overloaded", 8), ("decrease", "overloaded", 4), ("decrease", "overloaded", 3)]
+
+
+def testLatencyAboveToleranceDecreasesLimit():
+    concurrency = RateLimit.AdaptiveConcurrency(initial=10, tolerance=2.0)
+
+    async def main() -> None:
+        await request(concurrency, latency=0.01)
+        while not concurrency.decreases:
+            await request(concurrency, latency=0.1)
+
+    asyncio.run(main())
+    assert concurrency.limit == 5
+    assert concurrency.decisions[-1][1:3] == ("decrease", "latency")
+    assert concurrency.latency > 2 * concurrency.min_latency
+
+
+def testCancelledWaiterFreesItsSlot():
+    concurrency = RateLimit.AdaptiveConcurrency(initial=1)
+
+    async def main() -> None:
+        await concurrency.acquire()
+        waiter = asyncio.ensure_future(concurrency.acquire())
+        await asyncio.sleep(0)
+        concurrency.release(time.monotonic(), None)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        await asyncio.wait_for(concurrency.acquire(), 1)
+        concurrency.release(time.monotonic(), None)
+
+    asyncio.run(main())
+    assert concurrency.in_flight == 0
+
+
+def testAsyncAppBacksOffOnErrors(api, makeAsyncApp):
+    api.error_rate = 1.0
+    app = makeAsyncApp(concurrency=RateLimit.AdaptiveConcurrency(initial=8))
+
+    async def main() -> None:
+        await asyncio.gather(*[app.account.info(account_id=i) for i in range(1, 41)])
+
+    asyncio.run(main())
+    assert app.concurrency.limit < 8 and app.concurrency.decreases
+    assert app.concurrency.in_flight == 0
+    assert api.requests == 40
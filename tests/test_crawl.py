@@ -0,0 +1,55 @@
+"""
+Bulk crawls over MockTransport
+"""
+import asyncio
+
+import pytest
+
+from WgLestaAPI import Crawl, Exceptions
+
+
+def testCrawlWritesEveryRecord(tmp_path, makeAsyncApp):
+    ids = tmp_path / "ids.txt"
+    ids.write_text("\n".join(str(i) for i in range(1, 1001)) + "\n\n")
+    records = {}
+    crawler = Crawl.Crawler(makeAsyncApp(), "account.info", ids, Crawl.CallbackSink(records.update), workers=4, fields="nickname")
+
+    stats = asyncio.run(crawler.run())
+
+    assert len(records) == 1000
+    assert stats.batches_done == 10 and stats.batches_failed == 0
+
+
+def testSinkErrorStopsCrawl(makeAsyncApp):
+    def fail(data: dict) -> None:
+        raise OSError("No space left on device")
+
+    crawler = Crawl.Crawler(makeAsyncApp(), "account.info", range(1, 100001), Crawl.CallbackSink(fail), workers=2)
+
+    async def main() -> None:
+        await asyncio.wait_for(crawler.run(), timeout=5)
+
+    with pytest.raises(OSError, match="No space left"):
+        asyncio.run(main())
+
+
+def testFailedBatchesKeepLastError(api, makeAsyncApp):
+    api.error_rate = 1.0
+    crawler = Crawl.Crawler(makeAsyncApp(), "account.info", range(1, 301), Crawl.CallbackSink(lambda data: None))
+
+    stats = asyncio.run(crawler.run())
+
+    assert stats.batches_failed == 3
+    assert stats.last_error["error"]["message"] == "SOURCE_NOT_AVAILABLE"
+
+
+def testSingleIdMethodBatchSize(makeAsyncApp):
+    records = {}
+    crawler = Crawl.Crawler(makeAsyncApp(), "tanks.stats", range(1, 21), Crawl.CallbackSink(records.update))
+    assert crawler.batch_size == 1
+
+    stats = asyncio.run(crawler.run())
+    assert len(records) == 20 and stats.batches_failed == 0
+
+    with pytest.raises(Exceptions.BatchSizeIsNotSupported):
+        Crawl.Crawler(makeAsyncApp(), "tanks.stats", range(1, 21), Crawl.CallbackSink(records.update), batch_size=100)
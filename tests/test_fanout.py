@@ -0,0 +1,97 @@
+"""
+Requests to several regions and games at once
+"""
+import asyncio
+
+from urllib.parse import urlsplit
+
+from WgLestaAPI import Application, Constants, Transport, Utils
+
+
+class FailingTransport(Transport.AsyncMockTransport):
+    """Drops the connections to the hosts of `failing` and counts simultaneous requests to every host"""
+    def __init__(self, api, failing: tuple[str, ...] = ()) -> None:
+        super().__init__(api)
+        self.failing = failing
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    async def request(self, type_request, url, headers=None, body=None):
+        host = urlsplit(url).hostname
+        if host in self.failing:
+            raise ConnectionRefusedError(host)
+        self.active[host] = self.active.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        try:
+            return await super().request(type_request, url, headers, body)
+        finally:
+            self.active[host] -= 1
+
+
+def makeFanOut(transport, concurrency: int = 1) -> Application.FanOutApp:
+    targets = [("eu", "wot"), ("eu", "wows"), ("com", "wot")]
+    return Application.FanOutApp({Constants.APIHOLDERS.WG: "abcdefghijklmnop"}, targets, concurrency, transport, rate_limit=0)
+
+
+def testFanOutMergesTargets(asyncTransport):
+    app = makeFanOut(asyncTransport, concurrency=2)
+    res = asyncio.run(app.account.info(account_id=1, fields="nickname"))
+
+    assert res["status"] == "ok"
+    assert set(res["data"]) == {"eu.wot", "eu.wows", "com.wot"}
+    assert len(app.transport.requests) == 3
+
+
+def testFanOutInSeveralEventLoops(api, asyncTransport):
+    api.latency = 0.001
+    app = makeFanOut(asyncTransport)
+
+    for _ in range(3):
+        res = asyncio.run(app.execute("account.info", account_id=1))
+        assert res["meta"]["count"] == 3
+
+
+def testFanOutPartialResponse(api):
+    transport = FailingTransport(api, failing=("api.worldofwarships.eu",))
+    res = asyncio.run(makeFanOut(transport).account.info(account_id=1))
+
+    assert res["status"] == "partial" and res["meta"] == {"count": 2}
+    assert set(res["data"]) == {"eu.wot", "com.wot"}
+    assert isinstance(res["errors"]["eu.wows"], ConnectionRefusedError)
+
+
+def testFanOutErrorResponse(api):
+    api.error_rate = 1.0
+    res = asyncio.run(makeFanOut(Transport.AsyncMockTransport(api)).account.info(account_id=1))
+
+    assert res["status"] == "error" and res["data"] == {}
+    assert {error["message"] for error in res["errors"].values()} == {"SOURCE_NOT_AVAILABLE"}
+
+
+def testFanOutSelectedTargets(asyncTransport):
+    app = makeFanOut(asyncTransport)
+    res = asyncio.run(app.execute("account.info", targets=["com.wot"], account_id=1))
+
+    assert list(res["data"]) == ["com.wot"]
+    assert [urlsplit(url).hostname for url in app.transport.urls] == ["api.worldoftanks.com"]
+
+
+def testFanOutConcurrencyPerRegion(api):
+    api.latency = 0.005
+    transport = FailingTransport(api)
+    app = Application.FanOutApp(
+        {Constants.APIHOLDERS.WG: "abcdefghijklmnop"}, [("eu", "wot"), ("com", "wot")], {"eu": 1, "com": 3}, transport, rate_limit=0
+    )
+
+    async def main() -> None:
+        await asyncio.gather(*[app.account.info(account_id=i) for i in range(6)])
+
+    asyncio.run(main())
+    assert transport.peak == {"api.worldoftanks.eu": 1, "api.worldoftanks.com": 3}
+
+
+def testFanOutDefaultTargets(asyncTransport):
+    app = Application.FanOutApp({Constants.APIHOLDERS.LESTA: "abcdefghijklmnop"}, transport=asyncTransport)
+
+    assert app.apps
+    assert all(Utils.apiHolder(target.region) == Constants.APIHOLDERS.LESTA for target in app.apps.values())
@@ -0,0 +1,102 @@
+"""
+Events of API requests dispatched to hooks
+"""
+import asyncio
+
+import pytest
+
+from WgLestaAPI import Constants, Exceptions, Hooks, Retry, Transport
+
+
+class Recorder:
+    """Adapter that keeps the name and the state of every event at the moment it was emitted"""
+    def __init__(self) -> None:
+        self.events: list[dict] = []
+
+    @property
+    def names(self) -> list[str]:
+        return [event["name"] for event in self.events]
+
+    def record(self, event: Hooks.Event) -> None:
+        self.events.append({name: getattr(event, name) for name in Hooks.Event.__slots__ if name != "context"})
+
+    beforeRequest = afterResponse = onError = onRetry = record
+
+
+class BrokenTransport(Transport.BaseTransport):
+    def request(self, type_request, url, headers=None, body=None):
+        raise ConnectionRefusedError("connection refused")
+
+
+def makeHooks() -> tuple[Hooks.Hooks, Recorder]:
+    hooks = Hooks.Hooks()
+    return hooks, hooks.attach(Recorder())
+
+
+def testSuccessfulRequest(makeApp):
+    hooks, recorder = makeHooks()
+    makeApp(hooks=hooks).account.info(account_id=1)
+
+    assert recorder.names == [Constants.HOOKS.BEFORE_REQUEST, Constants.HOOKS.AFTER_RESPONSE]
+    before, after = recorder.events
+    assert before["api_method"] == "account.info" and before["status"] is None
+    assert after["status"] == 200 and after["api_status"] == "ok" and after["size"] > 0 and after["latency"] >= 0
+    assert after["region"] == "eu" and after["game_shortname"] == "wot"
+
+
+def testApiErrorEmitsOnError(api, makeApp):
+    api.error_rate = 1.0
+    hooks, recorder = makeHooks()
+    makeApp(hooks=hooks).account.info(account_id=1)
+
+    assert recorder.names == [Constants.HOOKS.BEFORE_REQUEST, Constants.HOOKS.AFTER_RESPONSE, Constants.HOOKS.ON_ERROR]
+    assert recorder.events[-1]["error_code"] == 504
+    assert recorder.events[-1]["error_message"] == "SOURCE_NOT_AVAILABLE"
+
+
+def testExceptionEmitsOnError(makeApp):
+    hooks, recorder = makeHooks()
+    with pytest.raises(ConnectionRefusedError):
+        makeApp(hooks=hooks, transport=BrokenTransport()).account.info(account_id=1)
+
+    assert recorder.names == [Constants.HOOKS.BEFORE_REQUEST, Constants.HOOKS.ON_ERROR]
+    assert isinstance(recorder.events[-1]["exception"], ConnectionRefusedError)
+
+
+def testRetryEmitsOnRetry(api, makeApp):
+    api.error_rate = 1.0
+    hooks, recorder = makeHooks()
+    makeApp(hooks=hooks, retry=Retry.RetryPolicy(attempts=3, backoff=0.001)).account.info(account_id=1)
+
+    retries = [event for event in recorder.events if event["name"] == Constants.HOOKS.ON_RETRY]
+    assert [event["attempt"] for event in retries] == [1, 2]
+    assert all(event["error_message"] == "SOURCE_NOT_AVAILABLE" and event["delay"] >= 0 for event in retries)
+    assert recorder.names.count(Constants.HOOKS.BEFORE_REQUEST) == 3
+
+
+def testAddHookAndRemove(makeApp):
+    app = makeApp()
+    assert app.hooks is None
+
+    methods = []
+    callback = lambda event: methods.append(event.api_method)
+    app.addHook(Constants.HOOKS.AFTER_RESPONSE, callback)
+    app.account.info(account_id=1)
+    app.hooks.remove(Constants.HOOKS.AFTER_RESPONSE, callback)
+    app.account.info(account_id=1)
+
+    assert methods == ["account.info"]
+
+
+def testUnknownHookIsRejected(makeApp):
+    with pytest.raises(Exceptions.HookIsNotDefined):
+        makeApp().addHook("after_request", print)
+
+
+def testHooksAsync(api, makeAsyncApp):
+    api.error_rate = 1.0
+    hooks, recorder = makeHooks()
+    asyncio.run(makeAsyncApp(hooks=hooks).account.info(account_id=1))
+
+    assert recorder.names == [Constants.HOOKS.BEFORE_REQUEST, Constants.HOOKS.AFTER_RESPONSE, Constants.HOOKS.ON_ERROR]
+    assert recorder.events[-1]["error_code"] == 504
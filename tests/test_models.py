@@ -0,0 +1,66 @@
+"""
+Typed responses decoded into slotted models
+"""
+import asyncio
+
+import pytest
+
+from WgLestaAPI import Models
+
+
+@pytest.fixture(params=["msgspec", "fallback"])
+def decoding(request, monkeypatch):
+    """Runs the test with `msgspec` and with the fallback conversion of the application decoder"""
+    if request.param == "fallback":
+        monkeypatch.setattr(Models, "msgspec", None)
+    Models.getDecoder.cache_clear()
+    yield request.param
+    Models.getDecoder.cache_clear()
+
+
+def testTypedAccountInfo(decoding, makeApp):
+    res = makeApp(typed=True).account.info(account_id=[1, 2])
+
+    assert isinstance(res, Models.AccountInfoResponse)
+    assert res.status == "ok" and res.meta == {"count": 2}
+    assert isinstance(res.data["1"], Models.AccountInfo)
+    assert res.data["2"].nickname == "player_2"
+    assert not hasattr(res.data["1"], "__dict__")
+
+
+def testTypedListAndNestedLists(decoding, makeApp):
+    app = makeApp()
+    accounts = app.execute("account.list", typed=True, search="tanker", limit=3)
+    stats = app.execute("tanks.stats", typed=True, account_id=1)
+
+    assert [item.nickname for item in accounts.data] == ["tanker_0", "tanker_1", "tanker_2"]
+    assert stats.data["1"] and all(isinstance(item, Models.TankStats) for item in stats.data["1"])
+
+
+def testUnknownFieldsAreDroppedAndMissingAreNone(decoding, makeApp):
+    res = makeApp(typed=True).account.info(account_id=1, fields="nickname,private")
+
+    assert res.data["1"].nickname == "player_1"
+    assert res.data["1"].clan_id is None
+
+
+def testTypedErrorResponse(decoding, api, makeApp):
+    api.error_rate = 1.0
+    res = makeApp(typed=True).account.info(account_id=1)
+
+    assert res.status == "error" and res.data is None
+    assert res.error["message"] == "SOURCE_NOT_AVAILABLE"
+
+
+def testMethodsWithoutModelStayDictionaries(decoding, makeApp):
+    app = makeApp(typed=True)
+    assert app.execute("encyclopedia.info")["status"] == "ok"
+    assert isinstance(app.execute("account.info", typed=False, account_id=1), dict)
+
+
+def testTypedAsync(decoding, makeAsyncApp):
+    app = makeAsyncApp(typed=True)
+    res = asyncio.run(app.execute("clans.info", clan_id=7))
+
+    assert isinstance(res.data["7"], Models.ClanInfo)
+    assert res.data["7"].clan_id == 7
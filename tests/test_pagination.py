@@ -0,0 +1,65 @@
+"""
+Streaming of the records of all pages of paginated methods
+"""
+import asyncio
+from itertools import islice
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from WgLestaAPI import Exceptions, FakeApi
+
+
+def pageNumbers(urls: list[str]) -> list[int]:
+    return [int(parse_qs(urlsplit(url).query)["page_no"][0]) for url in urls]
+
+
+def testIterateAllPages(makeApp):
+    app = makeApp()
+    records = list(app.encyclopedia.modules.iter(limit=100))
+
+    assert [record["module_id"] for record in records] == list(range(1, FakeApi.MODULES_TOTAL + 1))
+    assert pageNumbers(app.transport.urls) == list(range(1, 21))
+
+
+def testIterateRequestsPagesLazily(makeApp):
+    app = makeApp()
+    records = app.iterate("encyclopedia.vehicles", page_no=3, limit=100)
+
+    assert [record["tank_id"] for record in islice(records, 150)][-1] == 350
+    assert pageNumbers(app.transport.urls) == [3, 4]
+
+
+def testIterateRaisesOnFailedPage(api, makeApp):
+    records = makeApp().encyclopedia.vehicles.iter(limit=100)
+    next(records)
+    api.error_rate = 1.0
+
+    with pytest.raises(Exceptions.ResponseIsNotSuccessful):
+        list(records)
+
+
+def testIterateAsyncAllPages(makeAsyncApp):
+    app = makeAsyncApp()
+
+    async def main() -> list[dict]:
+        return [record async for record in app.encyclopedia.vehicles.iter(limit=100, prefetch=3)]
+
+    records = asyncio.run(main())
+    assert [record["tank_id"] for record in records] == list(range(1, FakeApi.VEHICLES_TOTAL + 1))
+    assert sorted(pageNumbers(app.transport.urls)) == list(range(1, 9))
+
+
+def testIterateAsyncPrefetchIsBounded(api, makeAsyncApp):
+    api.latency = 0.01
+    app = makeAsyncApp()
+
+    async def main() -> None:
+        records = app.iterate("encyclopedia.vehicles", limit=100, prefetch=2)
+        async for _ in records:
+            await asyncio.sleep(0.05)
+            break
+        await records.aclose()
+
+    asyncio.run(main())
+    assert sorted(pageNumbers(app.transport.urls)) == [1, 2, 3]
@@ -0,0 +1,20 @@
+"""
+Parallel requests of the synchronous App on a pool of threads
+"""
+import pytest
+
+from WgLestaAPI import Exceptions
+
+
+def testMapKeepsOrder(makeApp):
+    app = makeApp(workers=4)
+    with app:
+        res = app.map("account.info", [{"account_id": i, "fields": "nickname"} for i in range(1, 21)], workers=8)
+    assert [next(iter(r["data"].values()))["nickname"] for r in res] == [f"player_{i}" for i in range(1, 21)]
+
+
+def testMapWorkersAboveBlockingPool(makeApp):
+    app = makeApp(workers=4, transport=None)
+    with pytest.raises(Exceptions.WorkersExceedConnectionPool, match="pool of 4 connections"):
+        app.map("account.info", [{"account_id": 1}], workers=8)
+    app.close()
@@ -0,0 +1,57 @@
+"""
+Oversized queries sent as POST requests with a form-encoded body
+"""
+import asyncio
+from urllib.parse import parse_qs
+
+from WgLestaAPI import Constants, Utils
+
+
+ACCOUNT_IDS = list(range(500000000, 500000400))
+
+
+def testShortQueryStaysGet(makeApp):
+    app = makeApp()
+    app.account.info(account_id=[1, 2, 3])
+
+    type_request, url, _, body = app.transport.requests[0]
+    assert type_request == Constants.TYPEREQUESTS.GET and body is None
+    assert url.endswith("?application_id=abcdefghijklmnop&account_id=1,2,3")
+
+
+def testLongQueryIsSentAsPost(makeApp):
+    app = makeApp()
+    res = app.account.info(account_id=ACCOUNT_IDS, fields="nickname")
+
+    type_request, url, _, body = app.transport.requests[0]
+    assert len(Utils.compileQuery({"account_id": ACCOUNT_IDS})) > Constants.MAX_QUERY_LENGTH
+    assert type_request == Constants.TYPEREQUESTS.POST
+    assert url == Utils.baseUrl("eu", "wot") + "account/info/"
+    assert parse_qs(body.decode())["account_id"] == [",".join(map(str, ACCOUNT_IDS))]
+    assert res["meta"]["count"] == len(ACCOUNT_IDS)
+
+
+def testQueryAtTheLimitStaysGet(makeApp):
+    app = makeApp()
+    query = Utils.compileQuery({"application_id": app.application_id, "search": ""})
+    app.account.list(search="a" * (Constants.MAX_QUERY_LENGTH - len(query)))
+    app.account.list(search="a" * (Constants.MAX_QUERY_LENGTH - len(query) + 1))
+
+    assert app.transport.types == [Constants.TYPEREQUESTS.GET, Constants.TYPEREQUESTS.POST]
+
+
+def testPostRequestHasBody(makeApp):
+    app = makeApp()
+    app.execute("account.info", Constants.TYPEREQUESTS.POST, account_id=1)
+
+    type_request, url, _, body = app.transport.requests[0]
+    assert type_request == Constants.TYPEREQUESTS.POST and "?" not in url
+    assert parse_qs(body.decode()) == {"application_id": ["abcdefghijklmnop"], "account_id": ["1"]}
+
+
+def testLongQueryIsSentAsPostAsync(makeAsyncApp):
+    app = makeAsyncApp()
+    res = asyncio.run(app.account.info(account_id=ACCOUNT_IDS, fields="nickname"))
+
+    assert app.transport.types == [Constants.TYPEREQUESTS.POST]
+    assert res["data"][str(ACCOUNT_IDS[-1])] == {"nickname": f"player_{ACCOUNT_IDS[-1]}"}
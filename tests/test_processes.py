@@ -0,0 +1,77 @@
+"""
+Requests on a pool of processes sharing one limit of requests per second
+"""
+import multiprocessing
+import time
+
+import pytest
+
+from WgLestaAPI import Application, Exceptions, Transport
+
+
+pytestmark = pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="the fake API is passed to forked processes")
+
+
+def nickname(res: dict) -> str:
+    return next(iter(res["data"].values()))["nickname"]
+
+
+@pytest.fixture
+def makePool(api):
+    pools = []
+
+    def make(processes: int = 2, rate_limit: float = 0, **kwargs) -> Application.ProcessPoolApp:
+        pool = Application.ProcessPoolApp(
+            "abcdefghijklmnop", "eu", "wot", processes, rate_limit, "fork", transport=Transport.MockTransport(api), **kwargs
+        )
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+def testImapKeepsOrder(makePool):
+    pool = makePool()
+    res = pool.imap("account.info", ({"account_id": i} for i in range(1, 21)), transform=nickname)
+
+    assert list(res) == [f"player_{i}" for i in range(1, 21)]
+
+
+def testImapUnorderedYieldsEveryResult(makePool):
+    pool = makePool(processes=3)
+    res = pool.imap("account.info", [{"account_id": i} for i in range(1, 21)], transform=nickname, ordered=False, chunksize=4)
+
+    assert sorted(res) == sorted(f"player_{i}" for i in range(1, 21))
+
+
+def testImapStreamsResultsUnderSharedLimit(makePool):
+    pool = makePool(rate_limit=20)
+    started = time.monotonic()
+    arrivals = [time.monotonic() - started for _ in pool.imap("account.info", [{"account_id": i} for i in range(1, 11)])]
+
+    assert arrivals[-1] >= 0.4
+    assert arrivals[0] < arrivals[-1] / 2
+    assert pool.stats()["requests"] == 10
+
+
+def testMapReturnsDecodedResponses(makePool):
+    res = makePool().map("account.info", [{"account_id": 1, "fields": "nickname"}])
+    assert res == [{"status": "ok", "meta": {"count": 1}, "data": {"1": {"nickname": "player_1"}}}]
+
+
+def testFailedRequestInWorker(makePool):
+    pool = makePool()
+    with pytest.raises(Exceptions.RequestFailedInWorker, match="IncorrectMethodDeclaration"):
+        pool.map("account", [{"account_id": 1}])
+
+    res = list(pool.imap("account", [{"account_id": 1}], return_exceptions=True))
+    assert isinstance(res[0], Exceptions.RequestFailedInWorker) and res[0].api_method == "account"
+
+
+def testExecuteManyMergesBatches(makePool):
+    res = makePool().executeMany("account.info", account_id=range(1, 251), fields="nickname")
+
+    assert res["status"] == "ok" and res["meta"]["count"] == 250
+    assert res["data"]["250"] == {"nickname": "player_250"}
@@ -0,0 +1,77 @@
+"""
+Selection of fields sent as `fields` and `extra` and applied to the records
+"""
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from WgLestaAPI import Exceptions, Utils
+
+
+def query(url: str) -> dict[str, str]:
+    return {key: values[0] for key, values in parse_qs(urlsplit(url).query).items()}
+
+
+def testSelectSendsFieldsAndProjects(makeApp):
+    app = makeApp()
+    res = app.account.info.select("nickname", "statistics.all.battles")(account_id=[1, 2])
+
+    assert query(app.transport.urls[0])["fields"] == "nickname,statistics.all.battles"
+    assert "extra" not in query(app.transport.urls[0])
+    assert set(res["data"]) == {"1", "2"}
+    assert set(res["data"]["1"]) == {"nickname", "statistics"}
+    assert list(res["data"]["1"]["statistics"]) == ["all"] and list(res["data"]["1"]["statistics"]["all"]) == ["battles"]
+
+
+def testSelectAddsRequiredExtra(makeApp):
+    app = makeApp()
+    app.account.info.select("statistics.random.battles", "private.rented", "nickname")(account_id=1, extra="statistics.epic")
+
+    params = query(app.transport.urls[0])
+    assert params["fields"] == "nickname,private.rented,statistics.random.battles"
+    assert params["extra"] == "statistics.epic,private.rented,statistics.random"
+
+
+def testNestedPathsOfSelectedFieldAreMerged():
+    projection = Utils.compileProjection("account.info", ("statistics", "statistics.all.wins", "nickname"))
+
+    assert projection.fields == "nickname,statistics"
+    assert projection.tree == {"nickname": None, "statistics": None}
+    assert Utils.compileProjection("account.info", ("statistics", "statistics.all.wins", "nickname")) is projection
+
+
+def testProjectionOfListsOfRecords(makeApp):
+    res = makeApp().tanks.stats.select("tank_id", "all.battles")(account_id=1)
+
+    records = res["data"]["1"]
+    assert records and all(set(record) == {"tank_id", "all"} and list(record["all"]) == ["battles"] for record in records)
+
+
+def testManyWithSelection(makeApp):
+    app = makeApp()
+    res = app.account.info.select("nickname").many(account_id=range(1, 251))
+
+    assert len(app.transport.requests) == 3
+    assert res["data"]["250"] == {"nickname": "player_250"}
+
+
+def testUnsuccessfulResponseIsNotProjected(api, makeApp):
+    api.error_rate = 1.0
+    res = makeApp().account.info.select("nickname")(account_id=1)
+
+    assert res["status"] == "error" and res["error"]["message"] == "SOURCE_NOT_AVAILABLE"
+
+
+@pytest.mark.parametrize("paths", [(), ("",), ("statistics..all",), ("nickname,clan_id",), (1,)])
+def testInvalidPathsAreRejected(paths, makeApp):
+    with pytest.raises(Exceptions.FieldPathIsNotValid):
+        makeApp().account.info.select(*paths)
+
+
+def testSelectAsync(makeAsyncApp):
+    app = makeAsyncApp()
+    res = asyncio.run(app.clans.info.select("tag", "members_count")(clan_id=5))
+
+    assert query(app.transport.urls[0])["fields"] == "members_count,tag"
+    assert set(res["data"]["5"]) == {"tag", "members_count"}
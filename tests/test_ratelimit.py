@@ -0,0 +1,45 @@
+"""
+Client-side limit of requests per second
+"""
+import multiprocessing
+
+from WgLestaAPI import RateLimit
+
+
+def testExplicitRateUpdatesSharedBucket(makeApp):
+    default = makeApp(application_id="ratelimit-explicit", rate_limit=None)
+    assert default.limiter.rate == 10
+
+    faster = makeApp(application_id="ratelimit-explicit", rate_limit=20)
+    assert faster.limiter is default.limiter
+    assert default.limiter.rate == 20
+
+
+def testDefaultRateKeepsSharedBucket(makeApp):
+    makeApp(application_id="ratelimit-default", rate_limit=5)
+    app = makeApp(application_id="ratelimit-default", rate_limit=None)
+    assert app.limiter.rate == 5
+
+
+def testSetRateKeepsTokens():
+    bucket = RateLimit.TokenBucket(1000, burst=5)
+    bucket.setRate(1)
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+    assert bucket.reserve() > 0
+
+
+def setSharedRate(bucket: RateLimit.SharedTokenBucket, rate: float) -> None:
+    bucket.setRate(rate)
+
+
+def testSharedSetRateInAllProcesses():
+    context = multiprocessing.get_context("spawn")
+    bucket = RateLimit.SharedTokenBucket(1000, burst=5, context=context)
+    process = context.Process(target=setSharedRate, args=(bucket, 1))
+    process.start()
+    process.join(30)
+
+    assert process.exitcode == 0
+    assert bucket.rate == 1
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+    assert bucket.reserve() > 0
@@ -0,0 +1,121 @@
+"""
+Retries of transient failures
+"""
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from WgLestaAPI import Retry, Transport
+
+
+class StatusTransport(Transport.MockTransport):
+    """Answers the queued HTTP statuses with an HTML body before passing requests to the fake API"""
+    def __init__(self, api, statuses: list[int], headers: dict | None = None) -> None:
+        super().__init__(api)
+        self.statuses = statuses
+        self.headers = headers or {}
+        self.sent = 0
+
+    def request(self, type_request, url, headers=None, body=None):
+        self.sent += 1
+        if self.statuses:
+            return Transport.Response(self.statuses.pop(0), {"Content-Type": "text/html", **self.headers}, b"<html></html>")
+        return super().request(type_request, url, headers, body)
+
+
+def testTooManyRequestsIsRetried(api, makeApp):
+    policy = Retry.RetryPolicy(backoff=0.001)
+    transport = StatusTransport(api, [429, 503], {"Retry-After": "0"})
+    res = makeApp(retry=policy, transport=transport).account.info(account_id=1)
+
+    assert res["status"] == "ok"
+    assert transport.sent == 3 and policy.retries == 2
+
+
+def testRetryAfterIsTheLowestDelay():
+    policy = Retry.RetryPolicy(backoff=0.001)
+    response = Transport.Response(429, {"Retry-After": "2"}, b"")
+    assert policy.getDelay(1, time.monotonic(), response) >= 2
+
+    date = Transport.Response(429, {"Retry-After": formatdate(time.time() + 5, usegmt=True)}, b"")
+    assert 3 <= policy.getRetryAfter(date) <= 5
+
+
+def testRetryAfterBeyondDeadline():
+    policy = Retry.RetryPolicy(deadline=1)
+    response = Transport.Response(429, {"Retry-After": "5"}, b"")
+    assert policy.getDelay(1, time.monotonic(), response) is None
+
+
+class DroppingTransport(Transport.AsyncMockTransport):
+    """Drops the connection of the first `failures` requests"""
+    def __init__(self, api, failures: int) -> None:
+        super().__init__(api)
+        self.failures = failures
+        self.sent = 0
+
+    async def request(self, type_request, url, headers=None, body=None):
+        self.sent += 1
+        if self.sent <= self.failures:
+            raise ConnectionResetError("connection reset by peer")
+        return await super().request(type_request, url, headers, body)
+
+
+def testAttemptsReturnTheLastError(api, makeApp):
+    api.error_rate = 1.0
+    policy = Retry.RetryPolicy(attempts=3, backoff=0.001)
+    res = makeApp(retry=policy).account.info(account_id=1)
+
+    assert res["error"]["message"] == "SOURCE_NOT_AVAILABLE"
+    assert api.requests == 3 and policy.retries == 2
+
+
+def testBudgetLimitsRetries(api, makeApp):
+    api.error_rate = 1.0
+    policy = Retry.RetryPolicy(attempts=10, backoff=0.001, budget=0, reserve=2)
+    app = makeApp(retry=policy)
+
+    app.account.info(account_id=1)
+    app.account.info(account_id=2)
+
+    assert api.requests == 4
+    assert policy.stats() == {"retries": 2, "exhausted": 2, "tokens": 0}
+
+
+def testBudgetIsRefilledByCalls():
+    policy = Retry.RetryPolicy(budget=0.5, reserve=1)
+    policy.getDelay(1, time.monotonic())
+    assert policy.getDelay(1, time.monotonic()) is None
+
+    policy.deposit()
+    policy.deposit()
+    assert policy.getDelay(1, time.monotonic()) is not None
+
+
+def testDeadlineStopsRetries(api, makeApp):
+    api.error_rate = 1.0
+    policy = Retry.RetryPolicy(attempts=10, backoff=0.2, max_backoff=0.2, deadline=0)
+    started = time.monotonic()
+    makeApp(retry=policy).account.info(account_id=1)
+
+    assert api.requests == 1 and policy.retries == 0
+    assert time.monotonic() - started < 0.2
+
+
+def testConnectionErrorsAreRetriedAsync(api, makeAsyncApp):
+    policy = Retry.RetryPolicy(backoff=0.001)
+    transport = DroppingTransport(api, failures=2)
+    res = asyncio.run(makeAsyncApp(retry=policy, transport=transport).account.info(account_id=1))
+
+    assert res["status"] == "ok"
+    assert transport.sent == 3 and policy.retries == 2
+
+
+def testConnectionErrorIsRaisedAfterAttemptsAsync(api, makeAsyncApp):
+    policy = Retry.RetryPolicy(attempts=2, backoff=0.001)
+    app = makeAsyncApp(retry=policy, transport=DroppingTransport(api, failures=5))
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(app.account.info(account_id=1))
@@ -0,0 +1,57 @@
+"""
+Coalescing of identical requests in flight of AsyncApp
+"""
+import asyncio
+
+from WgLestaAPI import Constants
+
+
+def testIdenticalRequestsShareOneRequest(api, makeAsyncApp):
+    api.latency = 0.01
+    app = makeAsyncApp()
+
+    async def main() -> list:
+        return await asyncio.gather(*[app.account.info(account_id=1) for _ in range(10)], app.account.info(account_id=2))
+
+    results = asyncio.run(main())
+    assert all(res is results[0] for res in results[:10])
+    assert results[10]["data"]["2"]["account_id"] == 2
+    assert len(app.transport.requests) == 2
+    assert app.inflight == {}
+
+
+def testFinishedRequestIsSentAgain(makeAsyncApp):
+    app = makeAsyncApp()
+
+    async def main() -> None:
+        await app.account.info(account_id=1)
+        await app.account.info(account_id=1)
+
+    asyncio.run(main())
+    assert len(app.transport.requests) == 2
+
+
+def testPostRequestsAreNotCoalesced(api, makeAsyncApp):
+    api.latency = 0.01
+    app = makeAsyncApp()
+
+    async def main() -> list:
+        return await asyncio.gather(*[app.account.info(Constants.TYPEREQUESTS.POST, account_id=1) for _ in range(3)])
+
+    asyncio.run(main())
+    assert len(app.transport.requests) == 3
+
+
+def testCancelledCallerKeepsSharedRequest(api, makeAsyncApp):
+    api.latency = 0.02
+    app = makeAsyncApp()
+
+    async def main() -> dict:
+        first = asyncio.ensure_future(app.account.info(account_id=1))
+        second = asyncio.ensure_future(app.account.info(account_id=1))
+        await asyncio.sleep(0.005)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main())["status"] == "ok"
+    assert len(app.transport.requests) == 1
@@ -0,0 +1,19 @@
+"""
+Local snapshots of the encyclopedia
+"""
+from WgLestaAPI import Cache, Constants
+from WgLestaAPI.Snapshots import Snapshots, SnapshotStore
+
+
+def testRefreshBypassesCache(api, makeApp):
+    app = makeApp(cache=Cache.ResponseCache())
+    snapshots = Snapshots(app, SnapshotStore(":memory:"))
+    datasets = list(Constants.SNAPSHOTS)
+
+    assert snapshots.refresh() == datasets
+    assert snapshots.refresh() == []
+
+    api.game_version = "2.0.0"
+    assert snapshots.refresh() == datasets
+    assert set(app.transport.types) == {Constants.TYPEREQUESTS.GET}
+    assert app.execute("encyclopedia.info")["data"]["game_version"] == "2.0.0"
@@ -0,0 +1,66 @@
+"""
+Background prolongation of user access tokens
+"""
+import asyncio
+import time
+
+from WgLestaAPI import Constants, Tokens, Utils
+
+
+class BrokenStore(Tokens.MemoryTokenStore):
+    def due(self, now, limit):
+        raise ConnectionError("the store is not available")
+
+
+def addDue(manager: Tokens.TokenManager, account_id: int = 1) -> None:
+    manager.store.set(Tokens.Token(account_id, "token", int(time.time()) + 3600, 0.0))
+
+
+def testProlongateOnAuthGame(makeApp):
+    app = makeApp("wows")
+    manager = Tokens.TokenManager(app)
+    addDue(manager)
+
+    assert manager.sweep() == 1
+    assert app.transport.urls == [Utils.baseUrl("eu", "wot") + "auth/prolongate/"]
+    assert manager.prolongated == 1
+
+
+def testProlongateOnAuthGameAsync(makeAsyncApp):
+    app = makeAsyncApp("wows")
+    manager = Tokens.TokenManager(app)
+    addDue(manager)
+
+    assert asyncio.run(manager.sweepAsync()) == 1
+    assert app.transport.urls == [Utils.baseUrl("eu", "wot") + "auth/prolongate/"]
+    assert manager.prolongated == 1
+
+
+def testBackgroundSweepsSurviveErrors(makeApp):
+    manager = Tokens.TokenManager(makeApp(), BrokenStore(), interval=0.01)
+    manager.start()
+    try:
+        deadline = time.monotonic() + 5
+        while manager.errors < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert manager.errors >= 2
+        assert manager.stats()["errors"] == manager.errors
+    finally:
+        manager.stop()
+
+
+def testProlongateWithRawDecoder(makeApp):
+    manager = Tokens.TokenManager(makeApp(decoder=Constants.DECODERS.RAW))
+    addDue(manager)
+
+    assert manager.sweep() == 1
+    assert manager.prolongated == 1
+    assert manager.getToken(1).startswith("token_")
+
+
+def testExpiringTokenWaitsOneInterval(makeApp):
+    manager = Tokens.TokenManager(makeApp(), interval=60)
+    token = manager.add(1, "token", int(time.time()) + 10)
+
+    assert token.refresh_at >= time.time() + 59
+    assert manager.sweep() == 0
@@ -0,0 +1,110 @@
+"""
+Transports over HTTP against the fake API server
+"""
+import asyncio
+import gzip
+import importlib.util
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from WgLestaAPI import Constants, Exceptions, FakeApi, Transport
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    """Answers with the gzip-compressed responses of the fake API and keeps `Accept-Encoding` and the client port of every request"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.seen.append((self.headers.get("Accept-Encoding"), self.client_address[1]))
+        body = gzip.compress(self.server.api.respond("GET", self.path).body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def gzipServer(api):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+    server.api, server.seen = api, []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def testAsyncAppInSeveralEventLoops(api, makeAsyncApp):
+    with FakeApi.FakeApiServer(api) as server:
+        app = makeAsyncApp(transport=None)
+        app.base_url = server.baseUrl("wot")
+
+        sessions = []
+
+        async def nickname() -> str:
+            res = await app.account.info(account_id=1, fields="nickname")
+            sessions.append(app.transport.session)
+            return res["data"]["1"]["nickname"]
+
+        assert [asyncio.run(nickname()) for _ in range(3)] == ["player_1"] * 3
+        assert len(set(map(id, sessions))) == 3
+        assert sessions[0].closed and sessions[1].closed
+
+        async def closeApp() -> None:
+            async with app:
+                await nickname()
+
+        asyncio.run(closeApp())
+        assert sessions[-1].closed and app.transport.session is None
+
+
+def testServerStartRaisesBindError(api):
+    with FakeApi.FakeApiServer(api) as server:
+        busy = FakeApi.FakeApiServer(api, port=server.port)
+        with pytest.raises(OSError):
+            busy.start()
+        busy.stop()
+
+
+def testCompressedResponsesOverKeepAlive(gzipServer, makeApp):
+    app = makeApp(transport=Transport.TransportConfig())
+    app.base_url = f"http://127.0.0.1:{gzipServer.server_port}/wot/"
+
+    nicknames = [app.account.info(account_id=i)["data"][str(i)]["nickname"] for i in range(1, 4)]
+    app.close()
+
+    assert nicknames == ["player_1", "player_2", "player_3"]
+    assert {encoding for encoding, _ in gzipServer.seen} == {", ".join(Transport.supportedEncodings())}
+    assert len({port for _, port in gzipServer.seen}) == 1
+
+
+def testCompressedResponsesAsync(gzipServer, makeAsyncApp):
+    app = makeAsyncApp(transport=Transport.TransportConfig(accept_encoding=("gzip",)))
+    app.base_url = f"http://127.0.0.1:{gzipServer.server_port}/wot/"
+
+    async def main() -> list[dict]:
+        async with app:
+            return [await app.account.info(account_id=i) for i in range(1, 4)]
+
+    assert [res["meta"]["count"] for res in asyncio.run(main())] == [1, 1, 1]
+    assert [encoding for encoding, _ in gzipServer.seen] == ["gzip"] * 3
+    assert len({port for _, port in gzipServer.seen}) == 1
+
+
+def testCompressionCanBeDisabled():
+    assert Transport.TransportConfig(accept_encoding=()).headers() == {}
+    assert "gzip" in Transport.supportedEncodings()
+
+
+@pytest.mark.skipif(importlib.util.find_spec("httpx") is not None, reason="httpx is installed")
+@pytest.mark.parametrize("method_execution", [Constants.METHODEXECUTION.SYNC, Constants.METHODEXECUTION.ASYNC])
+def testHttp2RequiresHttpx(method_execution):
+    with pytest.raises(Exceptions.PackageIsNotInstalled):
+        Transport.createTransport(Transport.TransportConfig(http2=True), method_execution)
@@ -0,0 +1,56 @@
+"""
+Query strings of requests and cached validation of queries
+"""
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from WgLestaAPI import Exceptions, Utils
+
+
+def testListsAndBooleansAreNormalised():
+    query = Utils.compileQuery({"account_id": [1, 2, 3], "extra": ("a", "b"), "in_garage": True, "limit": 10})
+    assert query == "?account_id=1,2,3&extra=a,b&in_garage=true&limit=10"
+
+
+def testSafeValuesAreNotEncoded():
+    assert Utils.compileQuery({"fields": "-statistics.all,nickname", "language": "ru"}) == "?fields=-statistics.all,nickname&language=ru"
+
+
+@pytest.mark.parametrize("value, encoded", [
+    ("tank er", "tank+er"),
+    ("a&b=c", "a%26b%3Dc"),
+    ("50%+1", "50%25%2B1"),
+    ("игрок", "%D0%B8%D0%B3%D1%80%D0%BE%D0%BA"),
+    ("a#b?c", "a%23b%3Fc"),
+])
+def testSpecialCharactersAreEncoded(value, encoded):
+    assert Utils.quoteValue(value) == encoded
+    assert parse_qs(Utils.compileQuery({"search": value})[1:]) == {"search": [value]}
+
+
+@pytest.mark.parametrize("search", ["tank er", "a&b=c", "игрок", "100%"])
+def testSpecialCharactersReachTheApi(search, makeApp):
+    app = makeApp()
+    res = app.account.list(search=search, limit=1)
+
+    assert res["data"][0]["nickname"] == f"{search}_0"
+    assert parse_qs(urlsplit(app.transport.urls[0]).query)["search"] == [search]
+
+
+def testInvalidQueriesAreRejected(makeApp):
+    app = makeApp()
+    with pytest.raises(Exceptions.IncorrectMethodDeclaration):
+        app.execute("account")
+    with pytest.raises(Exceptions.IncorrectMethodDeclaration):
+        app.execute("account.info.extra")
+    assert app.transport.requests == []
+
+
+def testValidationIsCached(makeApp):
+    app = makeApp()
+    app.account.info(account_id=1)
+    hits = Utils.checkQuery.cache_info().hits
+    app.account.info(account_id=2)
+
+    assert Utils.checkQuery.cache_info().hits == hits + 1